@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Compare HTML parser backends on saved SERP/listing pages.
+
+Usage: python benchmarks/bench_html_parsers.py [PAGES_DIR] [--iterations N]
+
+PAGES_DIR holds saved *.html pages (e.g. Google results saved from a
+browser). Without it a synthetic SERP page is generated. Each backend must
+title every link exactly as the original per-portal scrapers did on a full
+html.parser tree: most portals read only the <h3>, Indeed and Naukri also
+fell back to a <div role="heading">.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from scrapers.html_parser import PARSER_BACKENDS, extract_links, link_title, lxml_available
+
+DOMAINS = ["cutshort.io/jobs", "reed.co.uk/jobs", "wellfound.com/l", "foundit.in/job",
+           "weworkremotely.com/jobs", "ycombinator.com/companies"]
+
+
+def synthetic_serp_page(results: int = 30, filler_kb: int = 250) -> str:
+    """Build a SERP-like page: a few result anchors buried in markup we ignore"""
+    filler = "".join(
+        f'<div class="c{i}"><span data-x="{i}">noise {i}</span><script>var v{i}={i};</script></div>'
+        for i in range(filler_kb * 1024 // 80)
+    )
+    anchors = "".join(
+        f'<div class="g"><a href="/url?q=https://www.{DOMAINS[i % len(DOMAINS)]}/python-developer-{i}&amp;sa=U">'
+        f'<h3><span>Python Developer &amp; Backend {i}</span></h3><div>breadcrumb</div></a></div>'
+        f'<a href="/search?q=related+{i}"><div role="heading">Related {i}</div></a>'
+        f'<a href="https://www.{DOMAINS[i % len(DOMAINS)]}/empty-{i}"><h3></h3><div role="heading">Empty {i}</div></a>'
+        for i in range(results)
+    )
+    return f"<html><head><style>.g{{}}</style></head><body>{filler}{anchors}{filler}</body></html>"
+
+
+DEFAULT_TITLE = "Python Developer"
+# Whether a portal accepts a <div role="heading"> when a link has no <h3>
+HEADING_FALLBACKS = (False, True)
+
+
+def baseline_links(html: str, heading_fallback: bool = False):
+    """The original scraper behaviour: full html.parser tree, then find_all"""
+    soup = BeautifulSoup(html, 'html.parser')
+    links = []
+    for link in soup.find_all('a', href=True):
+        title_elem = link.find('h3')
+        if heading_fallback:
+            title_elem = title_elem or link.find('div', {'role': 'heading'})
+        links.append((link['href'], title_elem.get_text() if title_elem else DEFAULT_TITLE))
+    return links
+
+
+def titled_links(links, heading_fallback: bool = False):
+    """A backend's links, titled the way a portal with this fallback reads them"""
+    return [(result['href'], link_title(result, DEFAULT_TITLE, heading_fallback)) for result in links]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages_dir", nargs="?", help="directory of saved *.html pages")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.pages_dir:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(args.pages_dir, "*.html"))):
+            with open(path, encoding="utf-8", errors="replace") as f:
+                pages.append(f.read())
+        if not pages:
+            sys.exit(f"No *.html pages found in {args.pages_dir}")
+    else:
+        pages = [synthetic_serp_page()]
+    total_kb = sum(len(page) for page in pages) / 1024
+    print(f"{len(pages)} page(s), {total_kb:.0f} KiB total, {args.iterations} iterations")
+    print()
+
+    expected = [[baseline_links(page, fallback) for fallback in HEADING_FALLBACKS] for page in pages]
+
+    candidates = [("baseline (full html.parser)", baseline_links)]
+    for backend in PARSER_BACKENDS:
+        if backend == "lxml" and not lxml_available():
+            print("lxml not installed, skipping the lxml backend")
+            continue
+        candidates.append((backend, lambda html, backend=backend: extract_links(html, backend)))
+
+    baseline_time = None
+    print(f"{'backend':<30}{'ms/page':>10}{'speedup':>10}  same titles")
+    for label, extract in candidates:
+        started = time.perf_counter()
+        for _ in range(args.iterations):
+            for page in pages:
+                extract(page)
+        elapsed = (time.perf_counter() - started) / (args.iterations * len(pages))
+        baseline_time = baseline_time or elapsed
+        same = extract is baseline_links or all(
+            [titled_links(extract(page), fallback) for fallback in HEADING_FALLBACKS] == titles
+            for page, titles in zip(pages, expected))
+        print(f"{label:<30}{elapsed * 1000:>10.2f}{baseline_time / elapsed:>9.1f}x  {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Sweep scraper concurrency against the mock portal server.
+
+Usage: python benchmarks/bench_load.py [--levels 1,2,4,8,16] [--runs 3] [--burst-rate 0.05] ...
+
+For each concurrency level (concurrent portals, and in-flight requests per
+host) scrape_all_jobs runs `--runs` times against benchmarks/mock_portals.py,
+served from a separate thread. Reports throughput, p50/p95 run time, and
+how the faults the server injected were absorbed: retries, portals that
+came back empty and jobs lost compared with a fault-free run.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_portals import MockPortalServer, add_server_arguments, server_from_args
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--levels", default="1,2,4,8,16", help="comma-separated concurrency levels")
+    parser.add_argument("--runs", type=int, default=3, help="runs per level")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--request-timeout", type=float, default=5.0, help="per-request timeout in seconds")
+    parser.add_argument("--rate", type=float, default=50.0, help="token-bucket rate per host (req/s)")
+    add_server_arguments(parser)
+    return parser.parse_args()
+
+
+def serve_in_thread(server: MockPortalServer, port: int) -> str:
+    """Run the mock server on its own event loop so it does not share the scrapers' loop"""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    result = {}
+
+    def run():
+        asyncio.set_event_loop(loop)
+        result["base_url"] = loop.run_until_complete(server.start(port=port))
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    started.wait()
+    return result["base_url"]
+
+
+async def scrape_once(base_url: str, level: int, args, cpu_executor):
+    """One scrape_all_jobs run at a concurrency level; returns (jobs, seconds, retries, empty portals, bytes)"""
+    from main import JobSearchAssistant
+    from network.host_limiter import HostLimiter
+    from network.rate_limiter import RateLimiter
+    from network.session import create_session
+
+    assistant = JobSearchAssistant()
+    assistant.max_concurrent_scrapers = level
+    assistant.circuit_breaker = None
+    # Every run must read the same feeds from the top
+    assistant.high_water_marks = None
+    assistant.enricher = None
+    # Set before first use, so the assistant never starts a pool of its own
+    assistant.cpu_executor = cpu_executor
+    host_limiter = HostLimiter(default_limit=level, limits={})
+    rate_limiter = RateLimiter(limits={}, default_limit=(args.rate, level))
+    # Every portal is the same local host behind the override, so do not cap per host here
+    session = create_session(limit_per_host=0)
+    for scraper in assistant.scrapers:
+        scraper.base_url = base_url
+        scraper.timeout = args.request_timeout
+        scraper.session = session
+        scraper.http_cache = None
+        scraper.cassette = None
+        scraper.host_limiter = host_limiter
+        scraper.rate_limiter = rate_limiter
+        scraper.cpu_executor = cpu_executor
+    try:
+        started = time.perf_counter()
+        jobs = await assistant.scrape_all_jobs()
+        elapsed = time.perf_counter() - started
+    finally:
+        await session.close()
+    retries = sum(scraper.stats['retries'] for scraper in assistant.scrapers)
+    portal_counts = {}
+    for job in jobs:
+        portal_counts[job['portal']] = portal_counts.get(job['portal'], 0) + 1
+    empty = sum(1 for scraper in assistant.scrapers if not portal_counts.get(scraper.name))
+    downloaded = sum(scraper.stats['wire_bytes'] for scraper in assistant.scrapers)
+    return len(jobs), elapsed, retries, empty, downloaded
+
+
+async def sweep(base_url: str, server: MockPortalServer, levels, args):
+    from scrapers.circuit_breaker import percentile
+    from workers.cpu_executor import CPUExecutor
+
+    cpu_executor = CPUExecutor()
+    try:
+        # Fault-free baseline: how many jobs a clean run yields
+        faults = (server.burst_rate, server.timeout_rate, server.truncate_rate)
+        server.burst_rate = server.timeout_rate = server.truncate_rate = 0.0
+        expected, *_ = await scrape_once(base_url, max(levels), args, cpu_executor)
+        server.burst_rate, server.timeout_rate, server.truncate_rate = faults
+
+        print(f"{'level':>5}{'jobs/s':>9}{'p50 s':>8}{'p95 s':>8}{'retries':>9}{'429s':>6}"
+              f"{'hung':>6}{'cut':>5}{'empty':>7}{'KiB/run':>9}{'jobs lost':>11}")
+        for level in levels:
+            before = dict(server.stats)
+            runs = [await scrape_once(base_url, level, args, cpu_executor) for _ in range(args.runs)]
+            injected = {key: server.stats[key] - before[key] for key in server.stats}
+            times = [elapsed for _, elapsed, _, _, _ in runs]
+            jobs = sum(count for count, _, _, _, _ in runs)
+            lost = sum(expected - count for count, _, _, _, _ in runs) / len(runs)
+            print(f"{level:>5}{jobs / sum(times):>9.1f}{percentile(times, 50):>8.2f}{percentile(times, 95):>8.2f}"
+                  f"{sum(r for _, _, r, _, _ in runs) / len(runs):>9.1f}"
+                  f"{injected['rate_limited'] / len(runs):>6.0f}{injected['hung'] / len(runs):>6.0f}"
+                  f"{injected['truncated'] / len(runs):>5.0f}{sum(e for _, _, _, e, _ in runs) / len(runs):>7.1f}"
+                  f"{sum(b for _, _, _, _, b in runs) / len(runs) / 1024:>9.0f}"
+                  f"{lost:>8.1f}/{expected}")
+    finally:
+        cpu_executor.shutdown()
+
+
+def main():
+    args = parse_args()
+    os.environ.setdefault("LOG_LEVEL", "CRITICAL")
+    levels = [int(level) for level in args.levels.split(",")]
+    server = server_from_args(args)
+    base_url = serve_in_thread(server, args.port)
+    print(f"Mock portals at {base_url}: {args.latency_ms:.0f} ms median latency, {args.page_kb} KiB pages, "
+          f"429 bursts {args.burst_rate:.0%}, hangs {args.timeout_rate:.0%}, truncation {args.truncate_rate:.0%}; "
+          f"{args.runs} runs per level")
+    print()
+    asyncio.run(sweep(base_url, server, levels, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Time near-duplicate lookups in the LSH index against comparing every pair of signatures.
+
+Usage: python benchmarks/bench_near_duplicates.py [--jobs 2000] [--reposts 0.2] [--edits 3] [--repeat 3]
+
+Indexes --jobs seeded synthetic postings, then checks them again as
+reposts from other portals (a --reposts share of them with --edits words
+changed and the company renamed) alongside as many new postings. Reports
+the time per lookup through LSH bands and by comparing the signature with
+every indexed one, how many reposts each finds, and the false positives.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WORDS = [f"{stem}{suffix}" for stem in ("build", "scale", "team", "remote", "data", "api", "python", "cloud",
+                                        "service", "product", "design", "deploy", "customer", "growth")
+         for suffix in ("", "s", "ed", "ing", "er", "able", "ly", "ment", "ion", "ive")]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2000, help="postings in the index")
+    parser.add_argument("--reposts", type=float, default=0.2, help="share of postings reposted on another portal")
+    parser.add_argument("--edits", type=int, default=3, help="words changed in a repost")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes; the best is reported")
+    return parser.parse_args()
+
+
+def posting(rng: random.Random, number: int):
+    return {"company": f"Company {number}", "title": rng.choice(["Python Developer", "Backend Engineer"]),
+            "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(120, 400))),
+            "link": f"https://jobs.example.com/{number}"}
+
+
+def repost(rng: random.Random, job, edits: int):
+    words = job["description"].split()
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return {**job, "company": f"{job['company']} Inc.", "description": "<p>" + " ".join(words) + "</p>",
+            "link": job["link"].replace("jobs.example.com", "other.example.org")}
+
+
+def best_time(check, jobs, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [check(job) for job in jobs]
+        best = min(best, time.perf_counter() - started)
+    return results, best
+
+
+def main():
+    args = parse_args()
+    from database.near_duplicates import NearDuplicateIndex
+
+    rng = random.Random(42)
+    originals = [posting(rng, number) for number in range(args.jobs)]
+    reposted = rng.sample(range(args.jobs), int(args.jobs * args.reposts))
+    queries = [repost(rng, originals[number], args.edits) for number in reposted]
+    queries += [posting(rng, args.jobs + number) for number in range(len(queries))]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        index = NearDuplicateIndex(index_file=os.path.join(workdir, "near_duplicates.json"),
+                                   max_entries=args.jobs)
+        started = time.perf_counter()
+        indexed = index.signatures(originals)
+        for job, signature in zip(originals, indexed):
+            index.is_duplicate(job, signature)
+        index.commit(originals)
+        build_time = time.perf_counter() - started
+    signatures = index.signatures(queries)
+
+    def all_pairs(signature):
+        return max(index.similarity(signature, other) for other in indexed) >= index.threshold
+
+    lsh, lsh_time = best_time(lambda signature: index.find(signature) is not None, signatures, args.repeat)
+    brute, brute_time = best_time(all_pairs, signatures, args.repeat)
+
+    print(f"{args.jobs} postings indexed in {build_time:.2f}s; {len(reposted)} reposts with {args.edits} "
+          f"words changed and {len(queries) - len(reposted)} new postings looked up, best of {args.repeat}")
+    print()
+    print(f"{'lookup':<12}{'ms/job':>10}{'reposts found':>16}{'false positives':>18}")
+    for name, results, seconds in (("LSH bands", lsh, lsh_time), ("all pairs", brute, brute_time)):
+        found = sum(results[:len(reposted)])
+        false_positives = sum(results[len(reposted):])
+        print(f"{name:<12}{seconds / len(queries) * 1000:>10.3f}{found:>16}{false_positives:>18}")
+    print()
+    print(f"Speedup {brute_time / max(lsh_time, 1e-9):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
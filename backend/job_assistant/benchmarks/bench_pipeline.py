@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Replay a recorded run offline and report jobs/sec per pipeline stage.
+
+Usage: python benchmarks/bench_pipeline.py [CASSETTE] [--latency] [--iterations N]
+
+Record a cassette once with network access:
+    HTTP_CASSETTE_MODE=record python main.py morning
+then benchmark against it as often as needed. History, Excel and cover
+letters go to a temporary directory, Telegram and Gemini are disabled,
+so nothing outside the cassette is read or written.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassette", nargs="?", help="recorded cassette file (default: HTTP_CASSETTE_PATH)")
+    parser.add_argument("--latency", action="store_true", help="replay with the recorded latencies")
+    parser.add_argument("--iterations", type=int, default=3)
+    return parser.parse_args()
+
+
+def offline_assistant(workdir: str):
+    """A JobSearchAssistant that only touches the cassette and `workdir`"""
+    from main import JobSearchAssistant
+    assistant = JobSearchAssistant()
+    assistant.isolate(workdir)
+    return assistant
+
+
+async def timed(coro):
+    started = time.perf_counter()
+    result = await coro
+    return result, time.perf_counter() - started
+
+
+async def replay(jobs):
+    """Jobs scraped earlier, as the stream match_job_stream consumes"""
+    for job in jobs:
+        yield job
+
+
+async def run_stages(workdir: str):
+    """Run each stage of run_morning_task on its own, returning (stage, jobs, seconds) rows"""
+    async with offline_assistant(workdir) as assistant:
+        jobs, scrape_time = await timed(assistant.scrape_all_jobs())
+        # The same dedupe/enrich/match path run_morning_task streams scraped jobs through
+        (_, matched), match_time = await timed(assistant.match_job_stream(replay(jobs)))
+        matched, letter_time = await timed(assistant.generate_cover_letters(matched))
+        started = time.perf_counter()
+        assistant.excel_writer.write_jobs(matched, assistant.skill_matcher.vocabulary)
+        excel_time = time.perf_counter() - started
+        started = time.perf_counter()
+        assistant.db.save_jobs(matched, assistant.skill_matcher.vocabulary.skills)
+        if assistant.near_duplicates is not None:
+            assistant.near_duplicates.commit(matched)
+        save_time = time.perf_counter() - started
+    return [
+        ("scrape (replayed)", len(jobs), scrape_time),
+        ("dedupe + match", len(jobs), match_time),
+        ("cover letters", len(matched), letter_time),
+        ("excel", len(matched), excel_time),
+        ("save history", len(matched), save_time),
+    ]
+
+
+async def run_end_to_end(workdir: str):
+    """Run the full morning task, returning the jobs it matched and the time it took"""
+    async with offline_assistant(workdir) as assistant:
+        _, elapsed = await timed(assistant.run_morning_task())
+        return assistant.db.get_today_jobs_count(), elapsed
+
+
+def main():
+    args = parse_args()
+    # config reads these at import, so they must be set before anything imports it
+    os.environ["HTTP_CASSETTE_MODE"] = "replay"
+    os.environ["HTTP_CASSETTE_REPLAY_LATENCY"] = "true" if args.latency else "false"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    if args.cassette:
+        os.environ["HTTP_CASSETTE_PATH"] = args.cassette
+    from config import HTTP_CASSETTE_PATH
+    args.cassette = HTTP_CASSETTE_PATH
+    if not os.path.exists(args.cassette):
+        sys.exit(f"No cassette at {args.cassette}; record one with HTTP_CASSETTE_MODE=record python main.py")
+
+    best = {}
+    end_to_end = []
+    for _ in range(args.iterations):
+        with tempfile.TemporaryDirectory() as workdir:
+            for stage, jobs, elapsed in asyncio.run(run_stages(workdir)):
+                if stage not in best or elapsed < best[stage][1]:
+                    best[stage] = (jobs, elapsed)
+        with tempfile.TemporaryDirectory() as workdir:
+            end_to_end.append(asyncio.run(run_end_to_end(workdir)))
+
+    print(f"Cassette {args.cassette}, {'recorded' if args.latency else 'no'} latency, "
+          f"best of {args.iterations}")
+    print()
+    print(f"{'stage':<22}{'jobs':>8}{'seconds':>10}{'jobs/sec':>12}")
+    for stage, (jobs, elapsed) in best.items():
+        print(f"{stage:<22}{jobs:>8}{elapsed:>10.3f}{jobs / max(elapsed, 1e-9):>12.1f}")
+    matched_counts = {matched for matched, _ in end_to_end}
+    print()
+    print(f"run_morning_task: {min(elapsed for _, elapsed in end_to_end):.3f}s best, "
+          f"{sorted(matched_counts)} jobs matched"
+          + ("" if len(matched_counts) == 1 else " (NOT deterministic)"))
+
+
+if __name__ == "__main__":
+    main()
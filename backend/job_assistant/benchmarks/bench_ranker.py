@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Time BM25 relevance ranking over a large batch of matched jobs.
+
+Usage: python benchmarks/bench_ranker.py [CASSETTE] [--jobs 50000] [--words 100] [--repeat 3] [--budget-ms 1000]
+
+Jobs come from a replay of CASSETTE (cycled up to --jobs), or are
+synthetic with about --words words of description each when there is no
+cassette. Reports the time RelevanceRanker.rank takes, how many jobs tie
+on the top match percentage and how many distinct places the blended
+score gives them, and exits non-zero when the best run is over
+--budget-ms.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FILLER = ("we are looking for an experienced engineer to join our growing team and help "
+          "build reliable scalable services for customers around the world").split()
+TITLE_WORDS = ["Senior", "Junior", "Python", "Backend", "Java", "Frontend", "Developer",
+               "Engineer", "Software", "Data", "Platform", "Associate"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassette", nargs="?", help="recorded cassette file (default: HTTP_CASSETTE_PATH)")
+    parser.add_argument("--jobs", type=int, default=50000, help="jobs to rank")
+    parser.add_argument("--words", type=int, default=100, help="mean description length of synthetic jobs")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs; the best is reported")
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="allowed time for the best run")
+    return parser.parse_args()
+
+
+def recorded_jobs(workdir: str):
+    """Every job a replay of the cassette scrapes, matched"""
+    import asyncio
+    from bench_pipeline import offline_assistant
+
+    async def scrape():
+        async with offline_assistant(workdir) as assistant:
+            return await assistant.match_jobs(await assistant.scrape_all_jobs())
+
+    return asyncio.run(scrape())
+
+
+def synthetic_jobs(count: int, words: int):
+    from config import SKILLS_BASE
+    from matcher.skill_matcher import SkillMatcher
+    rng = random.Random(42)
+    skills = SkillMatcher(SKILLS_BASE).all_detectable
+    jobs = []
+    for _ in range(count):
+        description = [rng.choice(FILLER) for _ in range(rng.randint(words // 2, words * 3 // 2))]
+        for skill in rng.sample(skills, rng.randint(1, 6)):
+            description.insert(rng.randrange(len(description)), skill)
+        jobs.append({"title": " ".join(rng.sample(TITLE_WORDS, 3)), "description": " ".join(description)})
+    SkillMatcher(SKILLS_BASE).match_jobs(jobs, processes=1)
+    return jobs
+
+
+def main():
+    args = parse_args()
+    os.environ["HTTP_CASSETTE_MODE"] = "replay"
+    os.environ["HTTP_CASSETTE_REPLAY_LATENCY"] = "false"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    if args.cassette:
+        os.environ["HTTP_CASSETTE_PATH"] = args.cassette
+    from config import HTTP_CASSETTE_PATH
+    from ranker.relevance import RelevanceRanker
+
+    if os.path.exists(HTTP_CASSETTE_PATH):
+        with tempfile.TemporaryDirectory() as workdir:
+            source = recorded_jobs(workdir)
+        if not source:
+            sys.exit(f"Replaying {HTTP_CASSETTE_PATH} scraped no jobs")
+        jobs = [dict(source[i % len(source)]) for i in range(args.jobs)]
+        origin = f"{len(source)} recorded jobs from {HTTP_CASSETTE_PATH}"
+    else:
+        jobs = synthetic_jobs(args.jobs, args.words)
+        origin = f"synthetic jobs, ~{args.words} words each (no cassette)"
+
+    started = time.perf_counter()
+    ranker = RelevanceRanker()
+    build_time = time.perf_counter() - started
+    best = float("inf")
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        ranked = ranker.rank(jobs)
+        best = min(best, time.perf_counter() - started)
+
+    text_mb = sum(len(job.get("title") or "") + len(job.get("description") or "") for job in jobs) / 1e6
+    top_match = max(job["match_percentage"] for job in jobs)
+    tied = [job for job in ranked if job["match_percentage"] == top_match]
+    print(f"{len(jobs)} jobs ({text_mb:.1f} MB of text) from {origin}, best of {args.repeat}")
+    print()
+    print(f"  ranker built   {build_time * 1000:8.2f} ms")
+    print(f"  rank           {best * 1000:8.1f} ms   {len(jobs) / best:10.0f} jobs/sec   {text_mb / best:6.1f} MB/sec")
+    print()
+    print(f"{len(tied)} jobs tie at {top_match}% match; the blended score puts them in "
+          f"{len({job['rank_score'] for job in tied})} distinct places")
+    if best * 1000 > args.budget_ms:
+        print(f"Best run {best * 1000:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
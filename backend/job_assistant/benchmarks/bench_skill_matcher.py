@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Compare single-pass skill extraction with the old one-regex-per-skill loop.
+
+Usage: python benchmarks/bench_skill_matcher.py [CASSETTE] [--count 10000] [--repeat 3] [--processes N]
+
+Descriptions come from the jobs a replay of CASSETTE scrapes (default
+HTTP_CASSETTE_PATH), cycled up to --count; without a cassette, seeded
+synthetic descriptions are used instead. Both extractors run over the same
+texts, and the run fails if they disagree on any of them. The same texts
+are then matched as jobs one at a time with match_job, and as a batch with
+match_jobs in this process and across --processes worker processes.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FILLER = ("we are looking for an experienced engineer to join our growing team and help "
+          "build reliable scalable services for customers around the world").split()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassette", nargs="?", help="recorded cassette file (default: HTTP_CASSETTE_PATH)")
+    parser.add_argument("--count", type=int, default=10000, help="descriptions to extract from")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes; the best is reported")
+    parser.add_argument("--processes", type=int, default=None, help="workers for match_jobs (default CPU_WORKERS)")
+    return parser.parse_args()
+
+
+def recorded_texts(workdir: str):
+    """Title + description of every job a replay of the cassette scrapes"""
+    from bench_pipeline import offline_assistant
+
+    async def scrape():
+        async with offline_assistant(workdir) as assistant:
+            return await assistant.scrape_all_jobs()
+
+    return [f"{job.get('title', '')} {job.get('description', '')}" for job in asyncio.run(scrape())]
+
+
+def synthetic_texts(skills, count: int):
+    rng = random.Random(42)
+    texts = []
+    for _ in range(count):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(150, 450))]
+        for skill in rng.sample(skills, rng.randint(3, 12)):
+            words.insert(rng.randrange(len(words)), skill.upper() if rng.random() < 0.3 else skill)
+        texts.append(" ".join(words))
+    return texts
+
+
+class PerPatternExtractor:
+    """The previous implementation: one compiled \\bskill\\b regex searched per skill"""
+
+    def __init__(self, skills):
+        self.patterns = {skill: re.compile(r'\b' + re.escape(skill) + r'\b', re.IGNORECASE)
+                         for skill in skills}
+
+    def extract(self, text: str):
+        return {skill for skill, pattern in self.patterns.items() if pattern.search(text)}
+
+
+def best_time(extract, texts, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [extract(text) for text in texts]
+        best = min(best, time.perf_counter() - started)
+    return results, best
+
+
+def main():
+    args = parse_args()
+    os.environ["HTTP_CASSETTE_MODE"] = "replay"
+    os.environ["HTTP_CASSETTE_REPLAY_LATENCY"] = "false"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    if args.cassette:
+        os.environ["HTTP_CASSETTE_PATH"] = args.cassette
+    from config import CPU_WORKERS, HTTP_CASSETTE_PATH, SKILLS_BASE
+    from matcher.skill_matcher import SkillExtractor, SkillMatcher
+
+    skills = SkillMatcher(SKILLS_BASE).all_detectable
+    if os.path.exists(HTTP_CASSETTE_PATH):
+        with tempfile.TemporaryDirectory() as workdir:
+            source = recorded_texts(workdir)
+        if not source:
+            sys.exit(f"Replaying {HTTP_CASSETTE_PATH} scraped no jobs")
+        texts = [source[i % len(source)] for i in range(args.count)]
+        origin = f"{len(source)} recorded jobs from {HTTP_CASSETTE_PATH}"
+    else:
+        texts = synthetic_texts(skills, args.count)
+        origin = "synthetic descriptions (no cassette)"
+
+    started = time.perf_counter()
+    single_pass = SkillExtractor(skills)
+    build_time = time.perf_counter() - started
+    started = time.perf_counter()
+    per_pattern = PerPatternExtractor(skills)
+    loop_build_time = time.perf_counter() - started
+
+    loop_results, loop_time = best_time(per_pattern.extract, texts, args.repeat)
+    results, elapsed = best_time(single_pass.extract, texts, args.repeat)
+    mismatches = sum(1 for a, b in zip(loop_results, results) if a != b)
+
+    size_kb = sum(len(text) for text in texts) / 1024
+    print(f"{len(texts)} texts ({size_kb:.0f} KiB) from {origin}, {len(skills)} skills, "
+          f"best of {args.repeat}")
+    print()
+    print(f"{'extractor':<16}{'build ms':>10}{'seconds':>10}{'texts/sec':>12}")
+    for name, build, seconds in (("per-pattern", loop_build_time, loop_time),
+                                 ("single-pass", build_time, elapsed)):
+        print(f"{name:<16}{build * 1000:>10.2f}{seconds:>10.3f}{len(texts) / max(seconds, 1e-9):>12.0f}")
+    print()
+    print(f"Speedup {loop_time / max(elapsed, 1e-9):.1f}x")
+    if mismatches:
+        print(f"Skill sets differ on {mismatches} texts")
+        sys.exit(1)
+
+    matcher = SkillMatcher(SKILLS_BASE)
+    jobs = [{"title": "", "description": text} for text in texts]
+    processes = args.processes or CPU_WORKERS
+    print()
+    print(f"{'matching':<30}{'seconds':>10}{'jobs/sec':>12}")
+    for name, match in (("match_job, one at a time", lambda batch: [matcher.match_job(job) for job in batch]),
+                        ("match_jobs, 1 process", lambda batch: matcher.match_jobs(batch, processes=1)),
+                        (f"match_jobs, {processes} processes", lambda batch: matcher.match_jobs(batch, processes))):
+        _, seconds = best_time(lambda _: match([dict(job) for job in jobs]), [None], args.repeat)
+        print(f"{name:<30}{seconds:>10.3f}{len(jobs) / max(seconds, 1e-9):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
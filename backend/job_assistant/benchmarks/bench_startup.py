@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Measure the cold start of `python main.py reminder` with -X importtime.
+
+Usage: python benchmarks/bench_startup.py [TASK] [--runs 5] [--budget-ms 400] [--top 10]
+
+Runs main.py in a fresh interpreter `--runs` times with Telegram disabled,
+so nothing is sent. Reports wall time, time spent importing, the slowest
+top-level imports, and any module from the scraping or report stages that
+the task pulled in. Exits non-zero when such a module is imported or the
+median wall time is over --budget-ms, so it can guard startup in CI.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+JOB_ASSISTANT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages only the morning stages need; the reminder must not import them
+HEAVY_MODULES = {"aiohttp", "openpyxl", "bs4", "lxml", "google", "scrapers", "matcher",
+                 "generator", "enricher", "network", "workers", "ranker", "normalizer", "numpy", "scipy"}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("task", nargs="?", default="reminder", help="main.py task to start")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=400.0, help="allowed median wall time")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    return parser.parse_args()
+
+
+def parse_importtime(stderr: str):
+    """(module, cumulative µs, depth) for every line -X importtime wrote"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # One space after the separator, then two per level of nesting
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), int(cumulative), depth))
+    return imports
+
+
+def start_once(task: str):
+    """Run main.py once; returns (wall seconds, imports)"""
+    env = dict(os.environ, TELEGRAM_BOT_TOKEN="", TELEGRAM_CHAT_ID="", LOG_LEVEL="WARNING")
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "main.py", task],
+                            cwd=JOB_ASSISTANT_DIR, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        sys.exit(f"main.py {task} failed:\n{result.stderr[-2000:]}")
+    return elapsed, parse_importtime(result.stderr)
+
+
+def main():
+    args = parse_args()
+    runs = [start_once(args.task) for _ in range(args.runs)]
+    walls = [elapsed for elapsed, _ in runs]
+    # Top-level imports add up to the total
+    import_times = [sum(us for _, us, depth in imports if depth == 0) / 1e6 for _, imports in runs]
+    median_wall = statistics.median(walls)
+
+    print(f"python main.py {args.task}, {args.runs} runs")
+    print(f"  wall time    median {median_wall * 1000:7.1f} ms   min {min(walls) * 1000:7.1f} ms")
+    print(f"  import time  median {statistics.median(import_times) * 1000:7.1f} ms")
+    print()
+    _, imports = runs[-1]
+    top_level = sorted((item for item in imports if item[2] == 0), key=lambda item: -item[1])
+    print(f"{'slowest imports':<40}{'ms':>8}")
+    for name, cumulative, _ in top_level[:args.top]:
+        print(f"{name:<40}{cumulative / 1000:>8.1f}")
+
+    heavy = sorted({name for name, _, _ in imports if name.split(".")[0] in HEAVY_MODULES})
+    failed = False
+    if heavy:
+        print()
+        print(f"Imported modules the {args.task} task should not need: {', '.join(heavy)}")
+        failed = True
+    if median_wall * 1000 > args.budget_ms:
+        print()
+        print(f"Median start {median_wall * 1000:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
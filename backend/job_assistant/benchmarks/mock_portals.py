@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Fault- and latency-injecting stand-in for every portal and Google.
+
+Usage: python benchmarks/mock_portals.py [--port 8800] [--latency-ms 80] [--burst-rate 0.05] ...
+       SCRAPER_BASE_URL=http://127.0.0.1:8800 python main.py morning
+
+Scrapers reach it through SCRAPER_BASE_URL, which turns
+https://host/path into BASE/host/path. Google queries get a SERP page with
+result links for the site: portals in the query, the RemoteOK and Remotive
+APIs get JSON feeds, and anything else gets a job detail page carrying a
+schema.org JobPosting. Every response can be delayed (log-normal latency)
+or replaced by a 429 burst, a hang past the client timeout, or a truncated
+body.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import zlib
+from html import escape
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from aiohttp import web
+
+SITE_PATTERN = re.compile(r'site:([^\s()]+)')
+
+
+class MockPortalServer:
+    """aiohttp app serving fake portals, feeds and Google results with injected faults"""
+
+    def __init__(self, latency_ms: float = 80.0, latency_sigma: float = 0.6, page_kb: int = 100,
+                 feed_items: int = 500, burst_rate: float = 0.0, burst_length: int = 3,
+                 timeout_rate: float = 0.0, truncate_rate: float = 0.0, hang_seconds: float = 60.0,
+                 seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.page_kb = page_kb
+        self.feed_items = feed_items
+        self.burst_rate = burst_rate
+        self.burst_length = burst_length
+        self.timeout_rate = timeout_rate
+        self.truncate_rate = truncate_rate
+        self.hang_seconds = hang_seconds
+        self.random = random.Random(seed)
+        self.stats = {"requests": 0, "ok": 0, "rate_limited": 0, "hung": 0, "truncated": 0}
+        # Remaining 429 responses per host in the current burst
+        self._bursts: Dict[str, int] = {}
+        self._runner: Optional[web.AppRunner] = None
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/{host}/{path:.*}", self.handle)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8800) -> str:
+        """Start serving; returns the base URL to point scrapers at"""
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        return f"http://{host}:{port}"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _latency(self) -> float:
+        if self.latency_ms <= 0:
+            return 0.0
+        return self.random.lognormvariate(0, self.latency_sigma) * self.latency_ms / 1000
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        host = request.match_info["host"]
+        self.stats["requests"] += 1
+        await asyncio.sleep(self._latency())
+
+        remaining = self._bursts.get(host, 0)
+        if remaining or self.random.random() < self.burst_rate:
+            self._bursts[host] = (remaining or self.burst_length) - 1
+            self.stats["rate_limited"] += 1
+            return web.Response(status=429, headers={"Retry-After": "1"})
+        if self.random.random() < self.timeout_rate:
+            self.stats["hung"] += 1
+            await asyncio.sleep(self.hang_seconds)
+            return web.Response(status=504)
+
+        body, content_type = self._body(host, request)
+        if self.random.random() < self.truncate_rate:
+            self.stats["truncated"] += 1
+            response = web.StreamResponse(headers={"Content-Type": content_type})
+            response.content_length = len(body)
+            await response.prepare(request)
+            await response.write(body[:len(body) // 2])
+            request.transport.close()
+            return response
+        self.stats["ok"] += 1
+        response = web.Response(body=body, headers={"Content-Type": content_type})
+        # gzip/deflate as the client accepts, like the real portals
+        response.enable_compression()
+        return response
+
+    def _body(self, host: str, request: web.Request):
+        path = "/" + request.match_info["path"]
+        if host == "www.google.com" and path == "/search":
+            num = int(request.query.get("num", "10"))
+            return self.serp_page(request.query.get("q", ""), num).encode(), "text/html"
+        if host == "remoteok.com" and path.startswith("/api"):
+            return json.dumps([{"legal": "mock feed"}] + self.feed_items_for(host)).encode(), "application/json"
+        if host == "remotive.com" and path.startswith("/api"):
+            limit = int(request.query.get("limit", self.feed_items))
+            return json.dumps({"jobs": self.feed_items_for(host)[:limit]}).encode(), "application/json"
+        return self.detail_page(host, path).encode(), "text/html"
+
+    def _filler(self, kb: int) -> str:
+        return "".join(f'<div class="f{i}"><span>filler {i}</span></div>' for i in range(kb * 1024 // 40))
+
+    def serp_page(self, query: str, num: int) -> str:
+        """Google-style results: `num` job links per site: portal in the query"""
+        sites = SITE_PATTERN.findall(query) or ["example.com"]
+        terms = SITE_PATTERN.sub("", query).strip("() ").replace(" OR ", " ")
+        slug = zlib.crc32(terms.encode()) % 10000
+        results = []
+        for site in sites:
+            for i in range(num):
+                link = f"https://www.{site}/jobs/l/job-listings/job/viewjob-python-backend-{slug}-{i}"
+                results.append(f'<div class="g"><a href="/url?q={quote(link, safe=":/")}&amp;sa=U">'
+                               f'<h3>{escape(f"Python Backend Developer {slug}-{i}")}</h3></a></div>')
+        # Like Google, related searches and scripts follow the results in #botstuff
+        filler = self._filler(self.page_kb // 2)
+        return (f'<html><body>{filler}<div id="search">{"".join(results)}</div>'
+                f'<div id="botstuff">{filler}</div></body></html>')
+
+    def feed_items_for(self, host: str) -> List[Dict]:
+        skills = ["python", "django", "fastapi", "postgresql", "docker", "aws", "react", "golang"]
+        return [{
+            "id": i,
+            "position": f"Python Backend Engineer {i}",
+            "title": f"Python Backend Engineer {i}",
+            "tags": ["python", "backend"] if i % 2 == 0 else ["frontend"],
+            "company": f"{host} company {i}",
+            "company_name": f"{host} company {i}",
+            "description": " ".join(self.random.sample(skills, 4)) + " " + "x" * 800,
+            "url": f"https://{host}/remote-jobs/{i}"
+        } for i in range(self.feed_items)]
+
+    def detail_page(self, host: str, path: str) -> str:
+        """A job page: JSON-LD JobPosting plus page furniture and filler"""
+        skills = ["Python", "Django", "FastAPI", "PostgreSQL", "Docker", "AWS", "Redis", "Kubernetes", "Java"]
+        picked = random.Random(zlib.crc32(path.encode())).sample(skills, 5)
+        posting = {
+            "@context": "https://schema.org",
+            "@type": "JobPosting",
+            "title": "Python Backend Developer",
+            "description": f"<p>We are hiring at {escape(host)}.</p><ul>"
+                           + "".join(f"<li>Experience with {skill}</li>" for skill in picked) + "</ul>"
+        }
+        return (f'<html><head><script type="application/ld+json">{json.dumps(posting)}</script></head>'
+                f'<body><nav>Java jobs | React jobs</nav><h1>{escape(host)}</h1>'
+                f'{self._filler(self.page_kb)}</body></html>')
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    """Fault and latency knobs shared by this script and the load benchmark"""
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="median response latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.6, help="log-normal spread of latency")
+    parser.add_argument("--page-kb", type=int, default=100, help="size of HTML pages")
+    parser.add_argument("--feed-items", type=int, default=500, help="items per JSON feed")
+    parser.add_argument("--burst-rate", type=float, default=0.0, help="chance a request starts a 429 burst")
+    parser.add_argument("--burst-length", type=int, default=3, help="429 responses per burst")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="chance a request hangs")
+    parser.add_argument("--truncate-rate", type=float, default=0.0, help="chance a body is cut off")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def server_from_args(args: argparse.Namespace) -> MockPortalServer:
+    return MockPortalServer(latency_ms=args.latency_ms, latency_sigma=args.latency_sigma,
+                            page_kb=args.page_kb, feed_items=args.feed_items,
+                            burst_rate=args.burst_rate, burst_length=args.burst_length,
+                            timeout_rate=args.timeout_rate, truncate_rate=args.truncate_rate,
+                            seed=args.seed)
+
+
+async def serve_forever(server: MockPortalServer, port: int):
+    base_url = await server.start(port=port)
+    print(f"Mock portals listening; run scrapers with SCRAPER_BASE_URL={base_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8800)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve_forever(server_from_args(args), args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -74,17 +74,26 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "output")
 EXCEL_DIR = os.path.join(OUTPUT_DIR, "excel")
 COVERLETTER_DIR = os.path.join(OUTPUT_DIR, "coverletters")
 HISTORY_FILE = os.path.join(DATABASE_DIR, "jobs_history.json")
-
-# Create directories if they don't exist
-for directory in [DATABASE_DIR, OUTPUT_DIR, EXCEL_DIR, COVERLETTER_DIR]:
-    os.makedirs(directory, exist_ok=True)
+PORTAL_HEALTH_FILE = os.path.join(DATABASE_DIR, "portal_health.json")
+HIGH_WATER_MARKS_FILE = os.path.join(DATABASE_DIR, "high_water_marks.json")
+NEAR_DUPLICATES_FILE = os.path.join(DATABASE_DIR, "near_duplicates.json")
+CACHE_DIR = os.path.join(BASE_DIR, "cache")
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+CASSETTE_DIR = os.path.join(CACHE_DIR, "cassettes")
+JOB_DETAILS_CACHE_FILE = os.path.join(CACHE_DIR, "job_details.json")
+MATCH_CACHE_FILE = os.path.join(CACHE_DIR, "match_results.json")
+DESCRIPTION_CACHE_FILE = os.path.join(CACHE_DIR, "descriptions.json")
 
 # Job Search Settings
 MAX_JOBS_PER_RUN = 35
 MIN_MATCH_PERCENTAGE = 50
+EARLY_STOP_MATCH_PERCENTAGE = 80  # Stop scraping once MAX_JOBS_PER_RUN jobs score this high (None to disable)
 JOBS_PER_PORTAL = 5  # Limit per portal to avoid overwhelming
 
 # Scraper Settings
+# Portals to scrape, by name (see scrapers/registry.py), e.g. SCRAPERS="Remote OK,Remotive";
+# empty scrapes every portal
+ENABLED_SCRAPERS = [name.strip() for name in os.getenv("SCRAPERS", "").split(",") if name.strip()] or None
 REQUEST_TIMEOUT = 15
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 HEADERS = {
@@ -95,6 +104,126 @@ HEADERS = {
     "Connection": "keep-alive",
 }
 
+# Concurrency Settings
+SCRAPE_CONCURRENTLY = True  # Set False to scrape portals one after another
+MAX_CONCURRENT_SCRAPERS = 8
+MAX_CONCURRENT_REQUESTS_PER_HOST = 2
+HOST_CONCURRENCY_LIMITS = {
+    "www.google.com": 1,  # Shared by every Google-SERP-backed scraper
+}
+PORTAL_TIMEOUT = 90  # Seconds before a slow portal is abandoned
+JOB_QUEUE_SIZE = 100  # Scraped jobs buffered ahead of matching
+# Send every scraper request to this server instead (e.g. benchmarks/mock_portals.py);
+# https://host/path becomes SCRAPER_BASE_URL/host/path
+SCRAPER_BASE_URL = os.getenv("SCRAPER_BASE_URL", "")
+
+# Circuit Breaker Settings (portals that keep yielding no jobs are skipped for a while)
+CIRCUIT_BREAKER_ENABLED = True
+CIRCUIT_FAILURE_THRESHOLD = 3  # Consecutive runs without jobs before a portal is skipped
+CIRCUIT_COOLDOWN = 2 * 24 * 3600  # Seconds before a skipped portal is probed again
+CIRCUIT_MAX_COOLDOWN = 14 * 24 * 3600  # Cooldown doubles after each failed probe, up to this
+CIRCUIT_LATENCY_WINDOW = 30  # Recent runs kept for latency percentiles
+
+# Incremental Scraping (feed scrapers only read what is new since the last run)
+INCREMENTAL_SCRAPING = True
+HIGH_WATER_MARK_IDS = 500  # Most recent item IDs remembered per portal
+KNOWN_ITEMS_BEFORE_STOP = 5  # Consecutive already-seen items that end a feed read
+# Remotive `limit` per request; the next, larger page is fetched only while every item is new
+REMOTIVE_PAGE_SIZES = [50, 200, None]
+
+# Near-Duplicate Detection (the same role reposted on several portals is only processed once)
+NEAR_DUPLICATE_DETECTION = True
+NEAR_DUPLICATE_THRESHOLD = 0.8  # Estimated Jaccard similarity of two jobs' shingles that makes them one role
+NEAR_DUPLICATE_SHINGLE_SIZE = 3  # Words per shingle of company + title + description
+NEAR_DUPLICATE_MIN_SHINGLES = 10  # Jobs with less text (placeholders) are not compared
+NEAR_DUPLICATE_MAX_ENTRIES = 5000  # Signatures kept across runs, oldest dropped first
+MINHASH_PERMUTATIONS = 64
+# Bands of MINHASH_PERMUTATIONS / LSH_BANDS rows; pairs become candidates from about (1/bands)^(1/rows) similarity
+LSH_BANDS = 16
+
+# Connection Pool Settings (one pooled session is shared per run)
+CONNECTION_POOL_LIMIT = 50
+CONNECTION_POOL_LIMIT_PER_HOST = 4
+DNS_CACHE_TTL = 300  # Seconds
+KEEPALIVE_TIMEOUT = 30  # Seconds an idle connection stays in the pool
+
+# Rate Limits: (requests per second, burst size) per host
+DEFAULT_RATE_LIMIT = (5.0, 5)
+RATE_LIMITS = {
+    "www.google.com": (0.4, 1),  # Paces every SERP-backed scraper in one place
+}
+RATE_LIMIT_JITTER = 1.0  # Max random extra delay (seconds) for hosts in RATE_LIMITS
+RATE_LIMIT_MIN_RATE = 0.02  # Floor when a host keeps answering 429
+
+# Retry Settings (GET requests only)
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 1.0  # Seconds, doubled per attempt with full jitter
+RETRY_BACKOFF_MAX = 20.0
+REQUEST_DEADLINE = 45  # Overall seconds per request, retries included
+
+# HTML Parsing: "auto" (lxml when installed, else "stream"), "lxml", "html.parser" or "stream"
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "auto")
+
+# CPU Worker Settings (HTML parsing and skill matching run off the event loop)
+CPU_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+CPU_USE_PROCESSES = True  # Falls back to threads when a process pool cannot start
+CPU_MAX_PENDING = 32  # Bounded queue depth for CPU work
+MATCH_CHUNK_SIZE = 50  # Jobs per skill-matching task
+MATCH_FLUSH_DELAY = 0.5  # Seconds of a quiet job stream before a partial chunk is matched anyway
+PARALLEL_MATCH_MIN_JOBS = 2000  # SkillMatcher.match_jobs splits batches this large across processes
+LOOP_LAG_INTERVAL = 0.1  # Seconds between event-loop lag samples
+
+# Google SERP Settings (shared by the site:-query scrapers)
+SERP_CACHE_TTL = 3600  # Seconds parsed result sets are reused
+SERP_MERGE_QUERIES = False  # Combine site: queries with equal terms into one OR query
+SERP_MERGE_WINDOW = 0.5  # Seconds to wait for queries to merge with
+
+# Job Detail Enrichment (fetch real descriptions for placeholder SERP jobs)
+ENRICH_JOB_DETAILS = True
+ENRICH_CONCURRENCY = 8  # Detail pages fetched at once (per-host limits still apply)
+ENRICH_CACHE_TTL = 14 * 24 * 3600  # Seconds a fetched description is reused
+ENRICH_MIN_DESCRIPTION_LENGTH = 200  # Shorter descriptions are treated as placeholders
+ENRICH_MAX_DESCRIPTION_CHARS = 5000
+# Only jobs whose title mentions one of these are worth a detail-page fetch
+ENRICH_TITLE_KEYWORDS = ["python", "django", "flask", "fastapi", "backend", "back-end",
+                         "developer", "engineer", "software", "programmer", "sde"]
+
+# Description Normalization (feed descriptions arrive as HTML; jobs carry plain text from scraping on)
+NORMALIZE_DESCRIPTIONS = True
+NORMALIZE_MAX_DESCRIPTION_CHARS = 5000  # Cleaned text is cut at the last word boundary before this
+DESCRIPTION_CACHE_MAX_ENTRIES = 5000  # Cleaned HTML descriptions kept across runs, LRU
+
+# Streaming JSON Settings (RemoteOK / Remotive feeds)
+STREAM_JSON_FEEDS = True  # Parse feed items off the socket and stop once enough matched
+JSON_STREAM_CHUNK_SIZE = 16 * 1024  # Bytes read from the socket per chunk
+
+# Response Body Limits (bodies are streamed and decompressed as they arrive)
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024  # Decoded bytes kept from one page; the rest is never downloaded
+MAX_FEED_BYTES = 16 * 1024 * 1024  # Same for JSON feeds
+PORTAL_BYTE_BUDGET = 32 * 1024 * 1024  # Bytes one portal may download per run (None for no limit)
+BODY_CHUNK_SIZE = 64 * 1024  # Bytes read from the socket per chunk
+
+# HTTP Cache Settings (conditional GETs via ETag / Last-Modified)
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_TTL = 3600  # Seconds an entry is served without revalidation
+HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024  # LRU eviction beyond this size
+
+# Relevance Ranking (BM25 over titles and descriptions; needs numpy and scipy)
+RANK_BY_RELEVANCE = True
+RANK_RELEVANCE_WEIGHT = 0.25  # Share of the ranking score from relevance, the rest from match %
+RANK_TITLE_WEIGHT = 2.0  # A title word counts as this many description words
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Match Cache Settings (skill-match results reused for postings seen on earlier runs)
+MATCH_CACHE_ENABLED = True
+MATCH_CACHE_MAX_ENTRIES = 20000  # LRU eviction beyond this many postings
+
+# HTTP Cassette Settings (record a live run, replay it offline for benchmarks)
+HTTP_CASSETTE_MODE = os.getenv("HTTP_CASSETTE_MODE", "off")  # "off", "record" or "replay"
+HTTP_CASSETTE_PATH = os.getenv("HTTP_CASSETTE_PATH", os.path.join(CASSETTE_DIR, "run.json.gz"))
+HTTP_CASSETTE_REPLAY_LATENCY = os.getenv("HTTP_CASSETTE_REPLAY_LATENCY", "false").lower() == "true"
+
 # Excel Column Headers
 EXCEL_COLUMNS = [
     "S.No",
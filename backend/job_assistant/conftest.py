@@ -0,0 +1,7 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# A manual smoke check that scrapes a live portal: python test_components.py
+collect_ignore = ["test_components.py"]
@@ -1,14 +1,14 @@
 import json
 import hashlib
 from datetime import datetime, date
-from typing import List, Dict, Set
+from typing import Iterable, List, Dict, Set, Optional
 import os
 from config import HISTORY_FILE
 
 
 class JobDatabase:
-    def __init__(self):
-        self.history_file = HISTORY_FILE
+    def __init__(self, history_file: str = HISTORY_FILE):
+        self.history_file = history_file
         self._ensure_file_exists()
     
     def _ensure_file_exists(self):
@@ -36,10 +36,18 @@ class JobDatabase:
         with open(self.history_file, 'w') as f:
             json.dump(history, f, indent=2, default=str)
     
-    def filter_duplicates(self, jobs: List[Dict]) -> List[Dict]:
-        """Filter out duplicate jobs based on history"""
+    def known_hashes(self) -> Set[str]:
+        """Hashes of every job already in history"""
         history = self.load_history()
-        existing_hashes = {job.get('hash') for job in history.get('jobs', [])}
+        return {job.get('hash') for job in history.get('jobs', [])}
+    
+    def filter_duplicates(self, jobs: List[Dict], known: Optional[Set[str]] = None) -> List[Dict]:
+        """Filter out duplicate jobs based on history.
+        
+        Pass `known` (from known_hashes()) to filter a stream batch by batch:
+        kept jobs are added to it, so repeats within the run are dropped too.
+        """
+        existing_hashes = self.known_hashes() if known is None else known
         
         unique_jobs = []
         for job in jobs:
@@ -47,12 +55,24 @@ class JobDatabase:
             if job_hash not in existing_hashes:
                 job['hash'] = job_hash
                 unique_jobs.append(job)
+                if known is not None:
+                    known.add(job_hash)
         
         return unique_jobs
     
-    def save_jobs(self, jobs: List[Dict]):
-        """Save new jobs to history"""
+    def skill_vocabulary(self) -> List[str]:
+        """Skill names the history's skill masks index into (see matcher/skill_vocabulary.py)"""
+        return self.load_history().get('skill_vocabulary', [])
+    
+    def save_jobs(self, jobs: List[Dict], skill_vocabulary: Optional[List[str]] = None):
+        """Save new jobs to history.
+        
+        Pass the vocabulary the jobs' skill masks were built with; it only
+        ever grows, so it stays valid for the masks already in history.
+        """
         history = self.load_history()
+        if skill_vocabulary is not None:
+            history['skill_vocabulary'] = list(skill_vocabulary)
         
         for job in jobs:
             job_record = {
@@ -62,12 +82,31 @@ class JobDatabase:
                 'title': job.get('title'),
                 'portal': job.get('portal'),
                 'date_found': datetime.now().isoformat(),
-                'match_percentage': job.get('match_percentage')
+                'match_percentage': job.get('match_percentage'),
+                'skill_mask': job.get('skill_mask', 0),
+                'matched_mask': job.get('matched_mask', 0)
             }
             history['jobs'].append(job_record)
         
         self.save_history(history)
     
+    def find_jobs(self, needs: Iterable[str] = (), excludes: Iterable[str] = ()) -> List[Dict]:
+        """History records requiring every skill in `needs` and none in `excludes`.
+        
+        Works on the stored skill masks alone, e.g. find_jobs(['kafka'], ['java'])
+        for jobs needing Kafka but not Java.
+        """
+        from matcher.skill_vocabulary import SkillVocabulary
+        history = self.load_history()
+        vocabulary = SkillVocabulary(history.get('skill_vocabulary', []))
+        needs = list(needs)
+        if any(skill not in vocabulary for skill in needs):
+            return []  # No job was ever found needing it
+        need = vocabulary.mask(needs)
+        exclude = vocabulary.mask(skill for skill in excludes if skill in vocabulary)
+        return [job for job in history.get('jobs', [])
+                if job.get('skill_mask', 0) & need == need and not job.get('skill_mask', 0) & exclude]
+    
     def get_today_jobs_count(self) -> int:
         """Get count of jobs found today"""
         history = self.load_history()
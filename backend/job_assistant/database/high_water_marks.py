@@ -0,0 +1,79 @@
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+from config import HIGH_WATER_MARKS_FILE, HIGH_WATER_MARK_IDS
+
+logger = logging.getLogger(__name__)
+
+
+class HighWaterMarks:
+    """Per-portal record of how far each feed has been read, persisted across runs.
+
+    For every portal it keeps the IDs of the most recently seen items and
+    the newest posting time among them. Feed scrapers skip items below the
+    mark and stop once they run into a stretch of them, so a daily run only
+    reads what was posted since the last one.
+
+    Items seen during a run are staged and only become part of the mark
+    when commit() is called for the portal after its scrape finished; a run
+    that failed or was cut short leaves the mark where it was.
+    """
+
+    def __init__(self, marks_file: str = HIGH_WATER_MARKS_FILE, max_ids: int = HIGH_WATER_MARK_IDS):
+        self.marks_file = marks_file
+        self.max_ids = max_ids
+        self.portals: Dict[str, Dict] = self._load()
+        self._known: Dict[str, Set[str]] = {}
+        self._staged: Dict[str, List] = {}
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.marks_file, 'r') as f:
+                return json.load(f).get('portals', {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable high-water marks file: {str(e)}")
+            return {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.marks_file), exist_ok=True)
+        with open(self.marks_file, 'w') as f:
+            json.dump({'updated': datetime.now().isoformat(), 'portals': self.portals}, f, indent=2)
+
+    def newest(self, portal: str) -> Optional[float]:
+        """Posting time (epoch seconds) of the newest item seen on an earlier run"""
+        return self.portals.get(portal, {}).get('newest_posted_at')
+
+    def is_known(self, portal: str, item_id: str, posted_at: Optional[float] = None) -> bool:
+        """Whether the item is at or below the portal's mark"""
+        if portal not in self._known:
+            self._known[portal] = set(self.portals.get(portal, {}).get('seen_ids', []))
+        if item_id and item_id in self._known[portal]:
+            return True
+        newest = self.newest(portal)
+        return posted_at is not None and newest is not None and posted_at < newest
+
+    def stage(self, portal: str, item_id: str, posted_at: Optional[float] = None):
+        """Note an item read this run; it counts as known from the next run on"""
+        if item_id:
+            self._staged.setdefault(portal, []).append((item_id, posted_at))
+
+    def commit(self, portal: str) -> int:
+        """Move the portal's mark up to the items staged this run; returns how many there were"""
+        staged = self._staged.pop(portal, [])
+        if not staged:
+            return 0
+        mark = self.portals.setdefault(portal, {'seen_ids': [], 'newest_posted_at': None})
+        new_ids = list(dict.fromkeys(item_id for item_id, _ in staged))
+        staged_ids = set(new_ids)
+        previous = [item_id for item_id in mark['seen_ids'] if item_id not in staged_ids]
+        mark['seen_ids'] = (new_ids + previous)[:self.max_ids]
+        times = [posted_at for _, posted_at in staged if posted_at is not None]
+        if times:
+            mark['newest_posted_at'] = max(times + [mark['newest_posted_at'] or 0])
+        mark['updated'] = datetime.now().isoformat()
+        self._known.pop(portal, None)
+        return len(new_ids)
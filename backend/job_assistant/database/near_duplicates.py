@@ -0,0 +1,221 @@
+import base64
+import json
+import logging
+import os
+import random
+import re
+import struct
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from config import (NEAR_DUPLICATES_FILE, NEAR_DUPLICATE_THRESHOLD, NEAR_DUPLICATE_SHINGLE_SIZE,
+                    NEAR_DUPLICATE_MIN_SHINGLES, NEAR_DUPLICATE_MAX_ENTRIES, MINHASH_PERMUTATIONS, LSH_BANDS)
+from normalizer.description import html_to_text
+
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r'\w+')
+UINT64 = (1 << 64) - 1
+# Seeds the hash functions; signatures written with other ones cannot be compared
+HASH_SEED = 1
+
+
+def shingle_text(job: Dict) -> str:
+    """The text a job is compared on: its company, title and description"""
+    return f"{job.get('company') or ''} {job.get('title') or ''} {job.get('description') or ''}"
+
+
+def shingles(text: str, size: int = NEAR_DUPLICATE_SHINGLE_SIZE) -> Set[int]:
+    """32-bit hashes of the word n-grams of a text"""
+    # Descriptions are plain text once normalized; this covers jobs that skipped the normalizer
+    words = WORD_PATTERN.findall(html_to_text(text).lower())
+    return {zlib.crc32(' '.join(words[i:i + size]).encode('utf-8')) for i in range(len(words) - size + 1)}
+
+
+@lru_cache(maxsize=4)
+def hash_functions(permutations: int) -> List[Tuple[int, int]]:
+    """Multiply-shift hash functions: the top 32 bits of a * x + b mod 2^64, with a odd"""
+    rng = random.Random(HASH_SEED)
+    return [(rng.getrandbits(64) | 1, rng.getrandbits(64)) for _ in range(permutations)]
+
+
+def signature(job_shingles: Set[int], permutations: int = MINHASH_PERMUTATIONS) -> Tuple[int, ...]:
+    """MinHash signature: the smallest value of each hash function over the shingles"""
+    values = list(job_shingles)
+    return tuple(min([(a * x + b) & UINT64 for x in values]) >> 32 for a, b in hash_functions(permutations))
+
+
+def job_signatures(texts: List[str], permutations: int = MINHASH_PERMUTATIONS,
+                   shingle_size: int = NEAR_DUPLICATE_SHINGLE_SIZE,
+                   min_shingles: int = NEAR_DUPLICATE_MIN_SHINGLES) -> List[Optional[Tuple[int, ...]]]:
+    """Signatures of a batch of shingle_text()s, None for texts too short to compare.
+
+    A module-level function, so a batch can be signed in a CPU worker.
+    """
+    signatures = []
+    for text in texts:
+        text_shingles = shingles(text, shingle_size)
+        signatures.append(signature(text_shingles, permutations) if len(text_shingles) >= min_shingles else None)
+    return signatures
+
+
+class NearDuplicateIndex:
+    """MinHash signatures of the jobs seen recently, with an LSH index over them.
+
+    Link hashes only catch a posting seen before on the same portal; the
+    same role posted on Remotive, Working Nomads and Wellfound has three
+    links. Each job is reduced to a MinHash signature of its shingles, and
+    jobs whose signatures share a band become candidates; a candidate whose
+    estimated similarity reaches the threshold makes the job a duplicate.
+    Finding candidates is a few dict lookups, whatever the size of the index.
+
+    Jobs that are not duplicates are staged, so reposts later in the same
+    run are caught, but only the ones passed to commit() (the jobs saved to
+    history) are kept across runs; a job cut by the early stop or ranked out
+    of the report does not hide its reposts on the next run. Kept
+    signatures are dropped oldest first beyond `max_entries`. Jobs with
+    fewer than `min_shingles` shingles are neither compared nor indexed.
+    """
+
+    def __init__(self, index_file: str = NEAR_DUPLICATES_FILE, threshold: float = NEAR_DUPLICATE_THRESHOLD,
+                 permutations: int = MINHASH_PERMUTATIONS, bands: int = LSH_BANDS,
+                 shingle_size: int = NEAR_DUPLICATE_SHINGLE_SIZE, min_shingles: int = NEAR_DUPLICATE_MIN_SHINGLES,
+                 max_entries: int = NEAR_DUPLICATE_MAX_ENTRIES):
+        if permutations % bands:
+            raise ValueError(f"{permutations} permutations do not split into {bands} bands")
+        self.index_file = index_file
+        self.threshold = threshold
+        self.permutations = permutations
+        self.bands = bands
+        self.rows = permutations // bands
+        self.shingle_size = shingle_size
+        self.min_shingles = min_shingles
+        self.max_entries = max_entries
+        self.stats = {"staged": 0, "committed": 0, "duplicates": 0, "too_short": 0}
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._staged: Set[str] = set()
+        self._buckets: List[Dict[Tuple[int, ...], Set[str]]] = [{} for _ in range(bands)]
+        self._dirty = False
+        self._load()
+
+    def _params(self) -> Dict:
+        return {'seed': HASH_SEED, 'permutations': self.permutations, 'shingle_size': self.shingle_size}
+
+    def _load(self):
+        """Load the signatures of earlier runs, oldest first"""
+        try:
+            with open(self.index_file, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable near-duplicate index: {str(e)}")
+            return
+        if data.get('params') != self._params():
+            logger.info("MinHash settings changed since the near-duplicate index was written, starting it afresh")
+            self._dirty = True
+            return
+        unpack = struct.Struct(f'<{self.permutations}I').unpack
+        for key, entry in data.get('entries', {}).items():
+            entry['signature'] = unpack(base64.b64decode(entry['signature']))
+            self._add(key, entry)
+
+    def save(self):
+        """Persist the signatures if anything changed"""
+        if not self._dirty:
+            return
+        pack = struct.Struct(f'<{self.permutations}I').pack
+        entries = {key: {**entry, 'signature': base64.b64encode(pack(*entry['signature'])).decode('ascii')}
+                   for key, entry in self._entries.items() if key not in self._staged}
+        os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+        with open(self.index_file, 'w') as f:
+            json.dump({'params': self._params(), 'updated': datetime.now().isoformat(), 'entries': entries}, f)
+        self._dirty = False
+
+    def signatures(self, jobs: List[Dict]) -> List[Optional[Tuple[int, ...]]]:
+        """Signatures of the jobs with this index's settings, computed in this process"""
+        return job_signatures([shingle_text(job) for job in jobs], self.permutations,
+                              self.shingle_size, self.min_shingles)
+
+    def _bands(self, signature: Tuple[int, ...]):
+        return (signature[i:i + self.rows] for i in range(0, self.permutations, self.rows))
+
+    def _add(self, key: str, entry: Dict):
+        self._entries[key] = entry
+        for buckets, band in zip(self._buckets, self._bands(entry['signature'])):
+            buckets.setdefault(band, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self._staged.discard(key)
+        for buckets, band in zip(self._buckets, self._bands(entry['signature'])):
+            bucket = buckets[band]
+            bucket.discard(key)
+            if not bucket:
+                del buckets[band]
+
+    def similarity(self, first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of the shingle sets behind two signatures"""
+        return sum(a == b for a, b in zip(first, second)) / self.permutations
+
+    def find(self, signature: Tuple[int, ...]) -> Optional[Dict]:
+        """The most similar indexed job at or above the threshold"""
+        candidates = set()
+        for buckets, band in zip(self._buckets, self._bands(signature)):
+            candidates |= buckets.get(band, set())
+        best, best_similarity = None, self.threshold
+        for key in candidates:
+            similarity = self.similarity(signature, self._entries[key]['signature'])
+            if similarity >= best_similarity:
+                best, best_similarity = self._entries[key], similarity
+        return best
+
+    def is_duplicate(self, job: Dict, signature: Optional[Tuple[int, ...]]) -> bool:
+        """Whether the job repeats one kept from an earlier run or staged in this one.
+
+        `signature` comes from job_signatures() and is None for a job too
+        short to compare. A duplicate gets 'duplicate_of', the link of the
+        job it repeats; any other job is staged. Jobs are keyed by their
+        history hash (or link), so a job is never a duplicate of itself.
+        """
+        key = job.get('hash') or job.get('link', '')
+        if key in self._entries:
+            return False
+        if signature is None:
+            self.stats["too_short"] += 1
+            return False
+        original = self.find(signature)
+        if original is not None:
+            self.stats["duplicates"] += 1
+            job['duplicate_of'] = original['link']
+            logger.debug(f"{job.get('title')} at {job.get('company')} ({job.get('link')}) "
+                         f"repeats {original['link']}")
+            return True
+        self.stats["staged"] += 1
+        self._staged.add(key)
+        self._add(key, {'signature': signature, 'link': job.get('link', ''),
+                        'seen': datetime.now().isoformat()})
+        return False
+
+    def commit(self, jobs: Iterable[Dict]) -> int:
+        """Keep the staged signatures of these jobs across runs; returns how many there were"""
+        committed = 0
+        for job in jobs:
+            key = job.get('hash') or job.get('link', '')
+            if key in self._staged:
+                self._staged.discard(key)
+                committed += 1
+        if committed:
+            self.stats["committed"] += committed
+            self._dirty = True
+        return committed
+
+    def summary(self) -> str:
+        """One-line report for the run log"""
+        return (f"{self.stats['duplicates']} dropped, {self.stats['too_short']} too short to compare, "
+                f"{self.stats['staged']} staged, {self.stats['committed']} kept for later runs, "
+                f"{len(self._entries) - len(self._staged)} signatures kept")
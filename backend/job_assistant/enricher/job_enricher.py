@@ -0,0 +1,241 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+from config import (JOB_DETAILS_CACHE_FILE, ENRICH_CACHE_TTL, ENRICH_CONCURRENCY,
+                    ENRICH_MIN_DESCRIPTION_LENGTH, ENRICH_MAX_DESCRIPTION_CHARS, ENRICH_TITLE_KEYWORDS)
+from normalizer.description import BLOCK_ELEMENTS, html_to_text
+from scrapers.base_scraper import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+# Page furniture whose text says nothing about the job
+SKIPPED_ELEMENTS = {"script", "style", "noscript", "template", "svg", "nav", "header", "footer", "aside", "form"}
+CONTENT_ELEMENTS = {"main", "article"}
+JSON_LD_PATTERN = re.compile(r'<script[^>]*application/ld\+json[^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+JSON_LD_OPEN_PATTERN = re.compile(r'<script[^>]*application/ld\+json', re.IGNORECASE)
+MAX_PENDING_SCRIPT = 256 * 1024
+
+
+class _DescriptionExtractor(HTMLParser):
+    """Collects JSON-LD blocks, meta descriptions and visible text in one pass"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.json_ld: List[str] = []
+        self.meta_description = ""
+        self.page_text: List[str] = []
+        self.content_text: List[str] = []
+        self._json_ld: Optional[List[str]] = None
+        self._skip_depth = 0
+        self._content_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in BLOCK_ELEMENTS:
+            # Block elements separate words, inline ones (<b>, <a>) do not
+            self.handle_data(" ")
+        attributes = dict(attrs)
+        if tag == 'script' and (attributes.get('type') or '').lower() == 'application/ld+json':
+            self._json_ld = []
+        if tag == 'meta' and (attributes.get('name') or attributes.get('property') or '').lower() in (
+                'description', 'og:description'):
+            if len(attributes.get('content') or '') > len(self.meta_description):
+                self.meta_description = attributes['content']
+        if tag in SKIPPED_ELEMENTS:
+            self._skip_depth += 1
+        elif tag in CONTENT_ELEMENTS:
+            self._content_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in BLOCK_ELEMENTS:
+            self.handle_data(" ")
+        if tag == 'script' and self._json_ld is not None:
+            self.json_ld.append("".join(self._json_ld))
+            self._json_ld = None
+        if tag in SKIPPED_ELEMENTS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in CONTENT_ELEMENTS:
+            self._content_depth = max(0, self._content_depth - 1)
+
+    def handle_data(self, data):
+        if self._json_ld is not None:
+            self._json_ld.append(data)
+        elif not self._skip_depth:
+            self.page_text.append(data)
+            if self._content_depth:
+                self.content_text.append(data)
+
+
+class _JobPostingRead:
+    """Stop predicate for detail pages: satisfied once a JSON-LD JobPosting block has been read.
+
+    extract_description prefers that block, so the rest of the page (often
+    most of it) is not downloaded. Pages without one are read in full.
+    """
+
+    def __init__(self):
+        self._pending = ""
+
+    def __call__(self, text: str) -> bool:
+        text = self._pending + text
+        end = 0
+        for match in JSON_LD_PATTERN.finditer(text):
+            if 'JobPosting' in match.group(1):
+                return True
+            end = match.end()
+        # Carry an unclosed JSON-LD block, or a tag still open at the end of
+        # the chunk, which may be a JSON-LD opening tag split in two
+        opening = None
+        for opening in JSON_LD_OPEN_PATTERN.finditer(text, end):
+            pass
+        start = len(text)
+        if opening is not None and len(text) - opening.start() <= MAX_PENDING_SCRIPT:
+            start = opening.start()
+        else:
+            tag = text.rfind('<', end)
+            if tag != -1 and text.find('>', tag) == -1 and len(text) - tag <= MAX_PENDING_SCRIPT:
+                start = tag
+        self._pending = text[start:]
+        return False
+
+
+def _job_posting_description(block: str) -> str:
+    """Description of a schema.org JobPosting in a JSON-LD block, if any"""
+    try:
+        data = json.loads(block)
+    except ValueError:
+        return ""
+    candidates = data if isinstance(data, list) else [data]
+    while candidates:
+        item = candidates.pop(0)
+        if not isinstance(item, dict):
+            continue
+        candidates.extend(item.get('@graph', []))
+        item_type = item.get('@type')
+        if (item_type == 'JobPosting' or isinstance(item_type, list) and 'JobPosting' in item_type) \
+                and isinstance(item.get('description'), str):
+            return item['description']
+    return ""
+
+
+def extract_description(page: str, max_chars: int = ENRICH_MAX_DESCRIPTION_CHARS) -> str:
+    """Pull the job description out of a detail page.
+
+    Prefers the schema.org JobPosting most job boards embed as JSON-LD,
+    then the text of <main>/<article>, then the meta description, then the
+    page's visible text without navigation, headers and footers.
+    """
+    extractor = _DescriptionExtractor()
+    try:
+        extractor.feed(page)
+        extractor.close()
+    except Exception as e:
+        logger.debug(f"Could not parse detail page: {str(e)}")
+    for block in extractor.json_ld:
+        # JSON-LD descriptions are often HTML that was escaped once more
+        description = html_to_text(_job_posting_description(block), max_chars)
+        if description:
+            return description
+    for text in ("".join(extractor.content_text), extractor.meta_description, "".join(extractor.page_text)):
+        description = html_to_text(text, max_chars)
+        if len(description) >= ENRICH_MIN_DESCRIPTION_LENGTH:
+            return description
+    return ""
+
+
+class JobEnricher(BaseScraper):
+    """Replaces placeholder descriptions with the text of the job's detail page.
+
+    Only jobs with a short description and a relevant-looking title are
+    fetched. Requests share the run's per-host limiter, rate limiter and
+    retries; descriptions are cached by URL on disk so a job seen on
+    several days is fetched once.
+    """
+
+    def __init__(self, cache_file: str = JOB_DETAILS_CACHE_FILE, ttl: int = ENRICH_CACHE_TTL,
+                 concurrency: int = ENRICH_CONCURRENCY):
+        super().__init__("Job details", "")
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.enrich_stats = {"fetched": 0, "cache_hits": 0, "skipped": 0, "failed": 0}
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._cache: Dict[str, Dict] = self._load()
+        self._dirty = False
+
+    async def scrape(self) -> List[Dict]:
+        """The enricher lists no jobs of its own"""
+        return []
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable job details cache: {str(e)}")
+            return {}
+
+    def save(self):
+        """Persist the description cache, dropping expired entries"""
+        if not self._dirty:
+            return
+        now = time.time()
+        self._cache = {url: entry for url, entry in self._cache.items()
+                       if now - entry['fetched_at'] < self.ttl}
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        with open(self.cache_file, 'w') as f:
+            json.dump(self._cache, f)
+        self._dirty = False
+
+    @staticmethod
+    def needs_details(job: Dict) -> bool:
+        """Whether a job only has a placeholder description worth replacing"""
+        if len(job.get('description', '')) >= ENRICH_MIN_DESCRIPTION_LENGTH:
+            return False
+        if not job.get('link', '').startswith('http'):
+            return False
+        title = job.get('title', '').lower()
+        return any(keyword in title for keyword in ENRICH_TITLE_KEYWORDS)
+
+    async def enrich(self, job: Dict) -> bool:
+        """Fill in the job's description from its detail page; True when it changed"""
+        if not self.needs_details(job):
+            self.enrich_stats["skipped"] += 1
+            return False
+        url = job['link']
+        cached = self._cache.get(url)
+        if cached is not None and time.time() - cached['fetched_at'] < self.ttl:
+            self.enrich_stats["cache_hits"] += 1
+            job['description'] = cached['description']
+            return True
+
+        async with self._semaphore:
+            page = await self.fetch(url, stop=_JobPostingRead)
+            if page and self.cpu_executor is not None:
+                description = await self.cpu_executor.run(extract_description, page)
+            else:
+                description = extract_description(page) if page else ""
+        if not description:
+            # Not cached, so a page that failed today is tried again next run
+            self.enrich_stats["failed"] += 1
+            return False
+        self.enrich_stats["fetched"] += 1
+        self._cache[url] = {'description': description, 'fetched_at': time.time()}
+        self._dirty = True
+        job['description'] = description
+        return True
+
+    async def enrich_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Enrich a batch of jobs concurrently"""
+        await asyncio.gather(*(self.enrich(job) for job in jobs))
+        return jobs
+
+    def summary(self) -> str:
+        """One-line report for the run log"""
+        return (f"{self.enrich_stats['fetched']} fetched, {self.enrich_stats['cache_hits']} cached, "
+                f"{self.enrich_stats['failed']} failed, {self.enrich_stats['skipped']} not needed")
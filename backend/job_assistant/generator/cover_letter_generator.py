@@ -1,9 +1,10 @@
 import os
 import asyncio
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 from config import COVERLETTER_DIR, PERSONAL_INFO, TARGET_PROFILE
+from matcher.skill_vocabulary import SkillVocabulary, skill_lists
 
 load_dotenv()
 
@@ -27,12 +28,13 @@ class CoverLetterGenerator:
                 print(f"Warning: Could not initialize Gemini: {e}")
                 self._gemini_model = None
 
-    async def generate(self, job: Dict) -> str:
+    async def generate(self, job: Dict, vocabulary: Optional[SkillVocabulary] = None) -> str:
         """Generate cover letter for a job - uses Gemini if available, template otherwise"""
         company = job.get('company', 'the company')
         title = job.get('title', 'Backend Developer')
-        required_skills = ', '.join(job.get('required_skills', [])[:5])
-        matched_skills = ', '.join(job.get('matched_skills', [])[:3])
+        skills = skill_lists(job, vocabulary)
+        required_skills = ', '.join(skills['required_skills'][:5])
+        matched_skills = ', '.join(skills['matched_skills'][:3])
 
         # Try Gemini first
         if self.api_key:
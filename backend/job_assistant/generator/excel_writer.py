@@ -1,20 +1,22 @@
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 import os
 from config import EXCEL_DIR, EXCEL_COLUMNS
+from matcher.skill_vocabulary import SkillVocabulary, skill_lists
 
 
 class ExcelWriter:
     def __init__(self):
         self.output_dir = EXCEL_DIR
     
-    def write_jobs(self, jobs: List[Dict]) -> str:
-        """Write jobs to Excel file with proper formatting"""
+    def write_jobs(self, jobs: List[Dict], vocabulary: Optional[SkillVocabulary] = None) -> str:
+        """Write jobs to Excel file with proper formatting; `vocabulary` names the jobs' skill masks"""
         # Create filename with date
         today = datetime.now().strftime("%d_%m_%Y")
         filename = f"Jobs_{today}.xlsx"
+        os.makedirs(self.output_dir, exist_ok=True)
         filepath = os.path.join(self.output_dir, filename)
         
         # Create workbook
@@ -91,11 +93,12 @@ class ExcelWriter:
             ws.cell(row=row, column=15, value='')  # Remarks
             
             # Skills and matching info
-            skills_required = ', '.join(job.get('required_skills', []))
+            skills = skill_lists(job, vocabulary)
+            skills_required = ', '.join(skills['required_skills'])
             ws.cell(row=row, column=16, value=skills_required)  # Exact Skills Required
             ws.cell(row=row, column=17, value=f"{job.get('match_percentage', 0):.1f}%")  # Match %
             
-            missing_skills = ', '.join(job.get('missing_skills', []))
+            missing_skills = ', '.join(skills['missing_skills'])
             ws.cell(row=row, column=18, value=missing_skills if missing_skills else 'None')  # Resume Changes
             
             ws.cell(row=row, column=19, value=job.get('cover_letter_generated', 'No'))  # Cover Letter
@@ -1,44 +1,44 @@
 #!/usr/bin/env python3
+import os
 import sys
 import asyncio
 import logging
+import tempfile
+import time
+from contextlib import aclosing
 from datetime import datetime
-from typing import List, Dict
+from functools import cached_property
+from typing import AsyncIterator, List, Dict, Optional, Set, Tuple
 import traceback
 
 from config import (
     MAX_JOBS_PER_RUN,
     MIN_MATCH_PERCENTAGE,
+    EARLY_STOP_MATCH_PERCENTAGE,
     SKILLS_BASE,
-    LOG_LEVEL
+    LOG_LEVEL,
+    SCRAPE_CONCURRENTLY,
+    MAX_CONCURRENT_SCRAPERS,
+    PORTAL_TIMEOUT,
+    JOB_QUEUE_SIZE,
+    ENABLED_SCRAPERS,
+    ENRICH_JOB_DETAILS,
+    ENRICH_CONCURRENCY,
+    CIRCUIT_BREAKER_ENABLED,
+    INCREMENTAL_SCRAPING,
+    NEAR_DUPLICATE_DETECTION,
+    HTTP_CACHE_ENABLED,
+    MATCH_CACHE_ENABLED,
+    NORMALIZE_DESCRIPTIONS,
+    RANK_BY_RELEVANCE,
+    MATCH_CHUNK_SIZE,
+    MATCH_FLUSH_DELAY
 )
-from matcher.skill_matcher import SkillMatcher
-from generator.excel_writer import ExcelWriter
-from generator.cover_letter_generator import CoverLetterGenerator
 from notifier.telegram_bot import TelegramNotifier
 from database.db_manager import JobDatabase
 
-# Import all scrapers
-from scrapers.indeed import IndeedScraper
-from scrapers.naukri import NaukriScraper
-from scrapers.instahyre import InstahyreScraper
-from scrapers.cutshort import CutshortScraper
-from scrapers.freshersworld import FreshersworldScraper
-from scrapers.timesjobs import TimesJobsScraper
-from scrapers.foundit import FounditScraper
-from scrapers.remoteok import RemoteOKScraper
-from scrapers.remotive import RemotiveScraper
-from scrapers.weworkremotely import WeWorkRemotelyScraper
-from scrapers.jobspresso import JobspressoScraper
-from scrapers.workingnomads import WorkingNomadsScraper
-from scrapers.yc import YCScraper
-from scrapers.wellfound import WellfoundScraper
-from scrapers.otta import OttaScraper
-from scrapers.reed import ReedScraper
-from scrapers.cwjobs import CWJobsScraper
-from scrapers.graduatejobs import GraduateJobsScraper
-from scrapers.iamexpat import IamExpatScraper
-from scrapers.undutchables import UndutchablesScraper
+# Everything else (scrapers, aiohttp, parsers, openpyxl, the CPU pool) is
+# imported by the stage that first needs it, so `main.py reminder` starts fast
 
 # Setup logging
 logging.basicConfig(
@@ -50,78 +50,470 @@ logger = logging.getLogger(__name__)
 
 class JobSearchAssistant:
     def __init__(self):
-        self.skill_matcher = SkillMatcher(SKILLS_BASE)
-        self.excel_writer = ExcelWriter()
-        self.cover_letter_gen = CoverLetterGenerator()
         self.telegram = TelegramNotifier()
         self.db = JobDatabase()
-        
-        # Initialize all scrapers
-        self.scrapers = [
-            IndeedScraper(),
-            NaukriScraper(),
-            InstahyreScraper(),
-            CutshortScraper(),
-            FreshersworldScraper(),
-            TimesJobsScraper(),
-            FounditScraper(),
-            RemoteOKScraper(),
-            RemotiveScraper(),
-            WeWorkRemotelyScraper(),
-            JobspressoScraper(),
-            WorkingNomadsScraper(),
-            YCScraper(),
-            WellfoundScraper(),
-            OttaScraper(),
-            ReedScraper(),
-            CWJobsScraper(),
-            GraduateJobsScraper(),
-            IamExpatScraper(),
-            UndutchablesScraper()
-        ]
+        # Opened by open(); requests use throwaway sessions until then
+        self.session = None
+        self.max_concurrent_scrapers = MAX_CONCURRENT_SCRAPERS if SCRAPE_CONCURRENTLY else 1
     
-    async def scrape_all_jobs(self) -> List[Dict]:
-        """Scrape jobs from all portals"""
-        all_jobs = []
-        
-        logger.info(f"Starting job scraping from {len(self.scrapers)} portals...")
+    @cached_property
+    def skill_matcher(self):
+        # Skill masks index into the vocabulary saved with the history, so it is loaded from there
+        from matcher.skill_matcher import SkillMatcher
+        from matcher.skill_vocabulary import SkillVocabulary
+        return SkillMatcher(SKILLS_BASE, SkillVocabulary(self.db.skill_vocabulary()))
+    
+    @cached_property
+    def excel_writer(self):
+        from generator.excel_writer import ExcelWriter
+        return ExcelWriter()
+    
+    @cached_property
+    def cover_letter_gen(self):
+        from generator.cover_letter_generator import CoverLetterGenerator
+        return CoverLetterGenerator()
+    
+    @cached_property
+    def scrapers(self) -> List:
+        """The enabled portals' scrapers, loaded from scrapers/registry.py on first use"""
+        from scrapers.registry import load_scrapers
+        scrapers = load_scrapers(ENABLED_SCRAPERS)
+        for scraper in scrapers:
+            self.attach(scraper)
+        return scrapers
+    
+    @cached_property
+    def host_limiter(self):
+        # One per-host limiter for every scraper, so the Google-SERP-backed
+        # portals share a single budget for www.google.com
+        from network.host_limiter import HostLimiter
+        return HostLimiter()
+    
+    @cached_property
+    def http_cache(self):
+        from network.http_cache import HttpCache
+        return HttpCache() if HTTP_CACHE_ENABLED else None
+    
+    @cached_property
+    def rate_limiter(self):
+        from network.rate_limiter import RateLimiter
+        return RateLimiter()
+    
+    @cached_property
+    def serp(self):
+        from scrapers.google_serp import SerpService
+        serp = SerpService()
+        serp.cpu_executor = self.cpu_executor
+        return serp
+    
+    @cached_property
+    def cassette(self):
+        # HTTP_CASSETTE_MODE=record/replay captures a run or replays it offline
+        from network.cassette import Cassette
+        return Cassette.from_config()
+    
+    @cached_property
+    def circuit_breaker(self):
+        # Portals that keep coming back empty are skipped until their cooldown expires;
+        # replayed runs say nothing about portal health and must not skip anything
+        from scrapers.circuit_breaker import CircuitBreaker
+        replaying = self.cassette is not None and self.cassette.replaying
+        return CircuitBreaker() if CIRCUIT_BREAKER_ENABLED and not replaying else None
+    
+    @cached_property
+    def high_water_marks(self):
+        # Feeds are only read down to where the last run got to; replayed
+        # runs must see every recorded item, so they read from the top
+        from database.high_water_marks import HighWaterMarks
+        replaying = self.cassette is not None and self.cassette.replaying
+        return HighWaterMarks() if INCREMENTAL_SCRAPING and not replaying else None
+    
+    @cached_property
+    def near_duplicates(self):
+        # Signatures of recent jobs, to drop the same role reposted on another portal
+        from database.near_duplicates import NearDuplicateIndex
+        return NearDuplicateIndex() if NEAR_DUPLICATE_DETECTION else None
+    
+    @cached_property
+    def normalizer(self):
+        # Feed descriptions are HTML; everything after scraping works on their plain text
+        from normalizer.description import DescriptionNormalizer
+        return DescriptionNormalizer() if NORMALIZE_DESCRIPTIONS else None
+    
+    @cached_property
+    def match_cache(self):
+        # Match results of postings seen on earlier runs, valid while the skill lists stay the same
+        from matcher.match_cache import MatchCache
+        return MatchCache(SKILLS_BASE, self.skill_matcher.vocabulary.skills) if MATCH_CACHE_ENABLED else None
+    
+    @cached_property
+    def ranker(self):
+        # Optional: needs numpy and scipy, without them jobs are sorted by match percentage
+        if not RANK_BY_RELEVANCE:
+            return None
+        try:
+            from ranker.relevance import RelevanceRanker
+        except ImportError as e:
+            logger.info(f"Relevance ranking unavailable ({str(e)}), sorting by match percentage")
+            return None
+        return RelevanceRanker()
+    
+    @cached_property
+    def cpu_executor(self):
+        # One CPU pool for SERP parsing and skill matching keeps the loop free for I/O
+        from workers.cpu_executor import CPUExecutor
+        return CPUExecutor()
+    
+    @cached_property
+    def enricher(self):
+        # Detail pages for jobs that only came with a placeholder description
+        if not ENRICH_JOB_DETAILS:
+            return None
+        from enricher.job_enricher import JobEnricher
+        enricher = JobEnricher()
+        self.attach(enricher)
+        return enricher
+    
+    def isolate(self, workdir: str):
+        """Read and write history, caches and output in `workdir`, with Telegram and Gemini off.
         
-        for scraper in self.scrapers:
+        For replayed runs: they start from an empty history, so every replay
+        of a cassette matches the same jobs, and they leave the real history,
+        caches and reports alone. Call it before the run touches the history.
+        """
+        from enricher.job_enricher import JobEnricher
+        from matcher.match_cache import MatchCache
+        from database.high_water_marks import HighWaterMarks
+        from database.near_duplicates import NearDuplicateIndex
+        from normalizer.description import DescriptionNormalizer
+        from scrapers.circuit_breaker import CircuitBreaker
+        self.http_cache = None
+        # Before anything reads the history, e.g. the skill vocabulary
+        self.db = JobDatabase(os.path.join(workdir, "jobs_history.json"))
+        if self.enricher is not None:
+            self.enricher = JobEnricher(cache_file=os.path.join(workdir, "job_details.json"))
+        if self.match_cache is not None:
+            self.match_cache = MatchCache(SKILLS_BASE, self.skill_matcher.vocabulary.skills,
+                                          cache_file=os.path.join(workdir, "match_results.json"))
+        if self.near_duplicates is not None:
+            self.near_duplicates = NearDuplicateIndex(index_file=os.path.join(workdir, "near_duplicates.json"))
+        if self.normalizer is not None:
+            self.normalizer = DescriptionNormalizer(cache_file=os.path.join(workdir, "descriptions.json"))
+        if self.high_water_marks is not None:
+            self.high_water_marks = HighWaterMarks(os.path.join(workdir, "high_water_marks.json"))
+        if self.circuit_breaker is not None:
+            self.circuit_breaker = CircuitBreaker(os.path.join(workdir, "portal_health.json"))
+        for client in self.http_clients():
+            self.attach(client)
+        self.excel_writer.output_dir = workdir
+        self.cover_letter_gen.output_dir = workdir
+        self.cover_letter_gen.api_key = ""
+        self.telegram.bot_token = ""
+    
+    def _loaded(self, name: str):
+        """A lazily built component, or None when no stage has needed it yet"""
+        return self.__dict__.get(name)
+    
+    def http_clients(self) -> List:
+        """Every scraper-like object that makes requests during a run"""
+        return self.scrapers + ([self.enricher] if self.enricher is not None else [])
+    
+    def attach(self, client):
+        """Share the run's limiters, caches and CPU pool with a scraper or the enricher"""
+        client.host_limiter = self.host_limiter
+        client.http_cache = self.http_cache
+        client.rate_limiter = self.rate_limiter
+        client.serp = self.serp
+        client.cpu_executor = self.cpu_executor
+        client.cassette = self.cassette
+        client.high_water_marks = self.high_water_marks
+        client.session = self.session
+    
+    async def __aenter__(self):
+        await self.open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def open(self):
+        """Open the pooled HTTP session and hand it to every scraper and the notifier"""
+        from network.session import create_session
+        self.session = create_session()
+        # Scrapers loaded after this pick the session up in attach()
+        for client in self._loaded('scrapers') or []:
+            client.session = self.session
+        if self._loaded('enricher') is not None:
+            self.enricher.session = self.session
+        self.telegram.session = self.session
+    
+    async def close(self):
+        """Close the pooled HTTP session, stop CPU workers and persist caches and portal health"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        for name in ('http_cache', 'circuit_breaker', 'cassette', 'enricher', 'high_water_marks',
+                     'match_cache', 'near_duplicates', 'normalizer'):
+            component = self._loaded(name)
+            if component is not None:
+                component.save()
+        if self._loaded('cpu_executor') is not None:
+            self.cpu_executor.shutdown()
+    
+    async def _stream_portal(self, scraper, queue: asyncio.Queue,
+                             semaphore: asyncio.Semaphore) -> Tuple[int, float, Optional[str]]:
+        """Feed one portal's jobs into the merged stream, returning its job count, time taken and error"""
+        count = 0
+        error = None
+        async with semaphore:
+            started = time.perf_counter()
             try:
                 logger.info(f"Scraping {scraper.name}...")
-                jobs = await scraper.scrape()
-                logger.info(f"Found {len(jobs)} jobs from {scraper.name}")
-                all_jobs.extend(jobs)
+                async with asyncio.timeout(PORTAL_TIMEOUT):
+                    async with aclosing(scraper.iter_jobs()) as jobs:
+                        async for job in jobs:
+                            await queue.put(job)
+                            count += 1
+                retry_note = ""
+                if scraper.stats['retries']:
+                    retry_note = (f" ({scraper.stats['retries']} retries, "
+                                  f"{scraper.stats['backoff_seconds']:.1f}s backing off)")
+                logger.info(f"Found {count} jobs from {scraper.name}{retry_note}; {scraper.transfer_summary()}")
+            except TimeoutError:
+                logger.warning(f"Gave up on {scraper.name} after {PORTAL_TIMEOUT}s ({count} jobs kept)")
+                error = f"timeout after {PORTAL_TIMEOUT}s"
             except Exception as e:
                 logger.error(f"Error scraping {scraper.name}: {str(e)}")
                 logger.debug(traceback.format_exc())
-        
-        logger.info(f"Total jobs scraped: {len(all_jobs)}")
-        return all_jobs
+                error = str(e) or e.__class__.__name__
+            elapsed = time.perf_counter() - started
+            if self.circuit_breaker is not None:
+                # A feed that only had jobs seen on earlier runs is up to date, not failing
+                self.circuit_breaker.record(scraper.name, count, elapsed, error,
+                                            up_to_date=scraper.stats['known_items'] > 0)
+        # None marks the end of this portal's jobs
+        await queue.put(None)
+        return count, elapsed, error
     
-    def filter_and_match_jobs(self, jobs: List[Dict]) -> List[Dict]:
-        """Filter duplicates and match skills"""
-        logger.info("Filtering duplicates and matching skills...")
+    async def iter_all_jobs(self) -> AsyncIterator[Dict]:
+        """Merge every portal's jobs into one stream, in arrival order.
+        
+        Descriptions come out as plain text. Closing the stream early
+        cancels the portals still scraping.
+        """
+        scrapers = self.scrapers
+        if self.circuit_breaker is not None:
+            scrapers = [scraper for scraper in self.scrapers if self.circuit_breaker.allow(scraper.name)]
+            for scraper in self.scrapers:
+                if scraper not in scrapers:
+                    logger.info(f"Skipping {scraper.name}: circuit open until "
+                                f"{self.circuit_breaker.retry_at(scraper.name):%Y-%m-%d %H:%M}")
         
-        # Remove duplicates
-        unique_jobs = self.db.filter_duplicates(jobs)
-        logger.info(f"Unique jobs after deduplication: {len(unique_jobs)}")
+        logger.info(f"Starting job scraping from {len(scrapers)} portals...")
+        started = time.perf_counter()
+        
+        queue = asyncio.Queue(maxsize=JOB_QUEUE_SIZE)
+        semaphore = asyncio.Semaphore(self.max_concurrent_scrapers)
+        producers = [asyncio.create_task(self._stream_portal(scraper, queue, semaphore))
+                     for scraper in scrapers]
+        total = 0
+        drained = False
+        try:
+            finished = 0
+            while finished < len(producers):
+                job = await queue.get()
+                if job is None:
+                    finished += 1
+                    continue
+                total += 1
+                if self.normalizer is not None:
+                    self.normalizer.normalize(job)
+                yield job
+            drained = True
+        finally:
+            for producer in producers:
+                producer.cancel()
+            results = await asyncio.gather(*producers, return_exceptions=True)
+            
+            # Move high-water marks only when every job reached the consumer; a
+            # stream closed early leaves them, so the next run reads those items again
+            if drained and self.high_water_marks is not None:
+                new_items = sum(self.high_water_marks.commit(scraper.name)
+                                for scraper, result in zip(scrapers, results)
+                                if isinstance(result, tuple) and result[2] is None)
+                known_items = sum(scraper.stats['known_items'] for scraper in scrapers)
+                logger.info(f"High-water marks: {new_items} new feed items, {known_items} seen on earlier runs skipped")
+            
+            portal_time = sum(result[1] for result in results if isinstance(result, tuple))
+            wall_time = time.perf_counter() - started
+            logger.info(f"Total jobs scraped: {total}")
+            logger.info(
+                f"Scraping took {wall_time:.1f}s wall-clock vs {portal_time:.1f}s summed "
+                f"per-portal time ({portal_time / max(wall_time, 1e-6):.1f}x speedup)"
+            )
+            wire_bytes = sum(scraper.stats['wire_bytes'] for scraper in scrapers)
+            body_bytes = sum(scraper.stats['body_bytes'] for scraper in scrapers)
+            logger.info(f"Downloaded {wire_bytes / 1024:.0f} KiB from {len(scrapers)} portals "
+                        f"({body_bytes / 1024:.0f} KiB decompressed and parsed)")
+            logger.info(f"Google SERP: {self.serp.summary()}")
+            if self.normalizer is not None:
+                logger.info(f"Descriptions: {self.normalizer.summary()}")
+            if self.http_cache is not None:
+                logger.info(f"HTTP cache: {self.http_cache.summary()}")
+            if self.cassette is not None:
+                logger.info(f"HTTP cassette: {self.cassette.summary()}")
+    
+    async def scrape_all_jobs(self) -> List[Dict]:
+        """Scrape jobs from all portals"""
+        return [job async for job in self.iter_all_jobs()]
+    
+    async def match_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Score jobs in place: cached results first, the rest in CPU workers a chunk per task"""
+        from matcher.skill_matcher import MATCH_FIELDS, match_jobs_in_worker
+        cache = self.match_cache
+        vocabulary = self.skill_matcher.vocabulary.skills
+        misses = jobs if cache is None else [job for job in jobs if not cache.apply(job)]
+        chunks = [misses[i:i + MATCH_CHUNK_SIZE] for i in range(0, len(misses), MATCH_CHUNK_SIZE)]
+        results = await asyncio.gather(
+            *(self.cpu_executor.run(match_jobs_in_worker, SKILLS_BASE, vocabulary, chunk) for chunk in chunks)
+        )
+        # Process workers return copies, so their results are copied back
+        for chunk, matched_chunk in zip(chunks, results):
+            for job, matched_job in zip(chunk, matched_chunk):
+                for field in MATCH_FIELDS:
+                    job[field] = matched_job[field]
+                if cache is not None:
+                    cache.store(job)
+        return jobs
+    
+    def rank_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Order matched jobs best first"""
+        if self.ranker is None:
+            return sorted(jobs, key=lambda x: x['match_percentage'], reverse=True)
+        return self.ranker.rank(jobs)
+    
+    async def drop_near_duplicates(self, jobs: List[Dict]) -> List[Dict]:
+        """The jobs that are not reposts of a role seen earlier in the run or saved on an earlier run"""
+        index = self.near_duplicates
+        if index is None or not jobs:
+            return jobs
+        from database.near_duplicates import job_signatures, shingle_text
+        # MinHash is pure Python, so a whole batch is signed in one CPU worker call
+        signatures = await self.cpu_executor.run(job_signatures, [shingle_text(job) for job in jobs],
+                                                 index.permutations, index.shingle_size, index.min_shingles)
+        return [job for job, signature in zip(jobs, signatures) if not index.is_duplicate(job, signature)]
+    
+    async def _enrich(self, job: Dict) -> Dict:
+        """Fetch the job's details when it only has a placeholder"""
+        if self.enricher is not None:
+            try:
+                await self.enricher.enrich(job)
+            except Exception as e:
+                logger.warning(f"Could not enrich {job.get('link', '')}: {str(e)}")
+        return job
+    
+    async def match_job_stream(self, jobs: AsyncIterator[Dict]) -> Tuple[int, List[Dict]]:
+        """Dedupe, enrich, match and threshold jobs as they arrive.
         
-        # Match skills
+        Stops pulling from the stream once MAX_JOBS_PER_RUN jobs have scored
+        at least EARLY_STOP_MATCH_PERCENTAGE. Returns the number of jobs
+        received and the best matches.
+        """
+        logger.info("Filtering duplicates and matching skills as jobs arrive...")
+        started = time.perf_counter()
+        known = self.db.known_hashes()
+        received = unique = high_scoring = 0
         matched_jobs = []
-        for job in unique_jobs:
-            matched_job = self.skill_matcher.match_job(job)
-            if matched_job['match_percentage'] >= MIN_MATCH_PERCENTAGE:
-                matched_jobs.append(matched_job)
         
-        # Sort by match percentage
-        matched_jobs.sort(key=lambda x: x['match_percentage'], reverse=True)
+        def collect(matched_job: Dict) -> bool:
+            """Threshold one scored job; True once enough high scorers are in"""
+            nonlocal high_scoring
+            if matched_job['match_percentage'] < MIN_MATCH_PERCENTAGE:
+                return False
+            if not matched_jobs:
+                logger.info(f"First match after {time.perf_counter() - started:.1f}s: "
+                            f"{matched_job['title']} ({matched_job['match_percentage']:.1f}%)")
+            matched_jobs.append(matched_job)
+            if EARLY_STOP_MATCH_PERCENTAGE is None or \
+               matched_job['match_percentage'] < EARLY_STOP_MATCH_PERCENTAGE:
+                return False
+            high_scoring += 1
+            return high_scoring >= MAX_JOBS_PER_RUN
+        
+        async def match(done: Set[asyncio.Task], flush: bool = False) -> bool:
+            """Queue the enriched jobs of finished tasks, scoring them once a chunk is full"""
+            ready.extend(task.result() for task in done)
+            if not ready or (len(ready) < MATCH_CHUNK_SIZE and not flush):
+                return False
+            # Reposts of a role are dropped before they are scored and get a cover letter;
+            # placeholders can only be compared once their details are in
+            batch = await self.drop_near_duplicates(ready[:])
+            ready.clear()
+            stop = False
+            for matched_job in await self.match_jobs(batch):
+                stop = collect(matched_job) or stop
+            return stop
+        
+        # Enrichment waits on detail pages, so it runs concurrently; enriched jobs are
+        # scored a chunk at a time, not one CPU pool round-trip per job
+        pending = set()
+        ready = []
+        stop = exhausted = False
+        # Pulls the next job off the stream, so it can be waited on together with enrichment
+        incoming = None
+        try:
+            while not stop:
+                if incoming is None and not exhausted and len(pending) < ENRICH_CONCURRENCY * 2:
+                    incoming = asyncio.ensure_future(jobs.__anext__())
+                waiting = pending if incoming is None else pending | {incoming}
+                if not waiting:
+                    stop = await match(set(), flush=True)
+                    break
+                # A partial chunk is scored once the stream has gone quiet, so slow
+                # portals hold back neither the first matches nor the early stop
+                done, _ = await asyncio.wait(waiting, timeout=MATCH_FLUSH_DELAY if ready else None,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    stop = await match(set(), flush=True)
+                    continue
+                if incoming in done:
+                    done.discard(incoming)
+                    try:
+                        job = incoming.result()
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        received += 1
+                        if self.db.filter_duplicates([job], known):
+                            unique += 1
+                            pending.add(asyncio.create_task(self._enrich(job)))
+                    incoming = None
+                pending -= done
+                stop = await match(done)
+        finally:
+            leftover = pending | ({incoming} if incoming is not None else set())
+            for task in leftover:
+                task.cancel()
+            await asyncio.gather(*leftover, return_exceptions=True)
+        
+        if stop:
+            logger.info(f"{high_scoring} jobs at or above {EARLY_STOP_MATCH_PERCENTAGE}%, stopped early")
+        logger.info(f"Unique jobs after deduplication: {unique}")
+        if self.near_duplicates is not None:
+            logger.info(f"Near-duplicates: {self.near_duplicates.summary()}")
+        if self.enricher is not None:
+            logger.info(f"Job details: {self.enricher.summary()}; {self.enricher.transfer_summary()}")
+        if self.match_cache is not None:
+            logger.info(f"Match cache: {self.match_cache.summary()}")
+        
+        # Best first: match percentage, blended with relevance to the profile when available
+        matched_jobs = self.rank_jobs(matched_jobs)
         
         # Limit to max jobs
         matched_jobs = matched_jobs[:MAX_JOBS_PER_RUN]
         
         logger.info(f"Matched jobs above {MIN_MATCH_PERCENTAGE}%: {len(matched_jobs)}")
-        return matched_jobs
+        return received, matched_jobs
     
     async def generate_cover_letters(self, jobs: List[Dict]) -> List[Dict]:
         """Generate cover letters for all jobs"""
@@ -129,7 +521,7 @@ class JobSearchAssistant:
         
         for job in jobs:
             try:
-                cover_letter = await self.cover_letter_gen.generate(job)
+                cover_letter = await self.cover_letter_gen.generate(job, self.skill_matcher.vocabulary)
                 job['cover_letter_path'] = cover_letter
                 job['cover_letter_generated'] = 'Yes'
             except Exception as e:
@@ -145,18 +537,24 @@ class JobSearchAssistant:
             logger.info("Starting Morning Job Search Task")
             logger.info("=" * 50)
             
-            # Scrape jobs
-            all_jobs = await self.scrape_all_jobs()
+            # Watch event-loop lag while network I/O and parsing overlap
+            from workers.cpu_executor import LoopLagMonitor
+            lag_monitor = LoopLagMonitor()
+            lag_monitor.start()
+            try:
+                # Scrape, filter and match, one job at a time as portals yield them
+                async with aclosing(self.iter_all_jobs()) as jobs:
+                    scraped, matched_jobs = await self.match_job_stream(jobs)
+            finally:
+                await lag_monitor.stop()
+            logger.info(f"Event loop lag during scraping: {lag_monitor.summary()}")
             
-            if not all_jobs:
+            if not scraped:
                 message = "⚠️ No jobs found from any portal. Please check scrapers."
                 logger.warning(message)
                 await self.telegram.send_message(message)
                 return
             
-            # Filter and match
-            matched_jobs = self.filter_and_match_jobs(all_jobs)
-            
             if not matched_jobs:
                 message = "No jobs matched the skill criteria (>= 50%)."
                 logger.info(message)
@@ -167,11 +565,13 @@ class JobSearchAssistant:
             matched_jobs = await self.generate_cover_letters(matched_jobs)
             
             # Generate Excel
-            excel_path = self.excel_writer.write_jobs(matched_jobs)
+            excel_path = self.excel_writer.write_jobs(matched_jobs, self.skill_matcher.vocabulary)
             logger.info(f"Excel file generated: {excel_path}")
             
-            # Save to history
-            self.db.save_jobs(matched_jobs)
+            # Save to history; only saved jobs hide their reposts on later runs
+            self.db.save_jobs(matched_jobs, self.skill_matcher.vocabulary.skills)
+            if self.near_duplicates is not None:
+                self.near_duplicates.commit(matched_jobs)
             
             # Send Telegram notification
             max_match = max(job['match_percentage'] for job in matched_jobs)
@@ -218,18 +618,21 @@ You found {today_jobs} matched jobs today.
 
 async def main():
     """Main entry point"""
+    # Default: run morning task
+    task = sys.argv[1] if len(sys.argv) > 1 else "morning"
+    if task not in ("morning", "reminder"):
+        print("Usage: python main.py [morning|reminder]")
+        return
     assistant = JobSearchAssistant()
-    
-    if len(sys.argv) > 1:
-        task = sys.argv[1]
-        if task == "morning":
-            await assistant.run_morning_task()
-        elif task == "reminder":
-            await assistant.run_reminder_task()
-        else:
-            print("Usage: python main.py [morning|reminder]")
-    else:
-        # Default: run morning task
+    if task == "reminder":
+        # One Telegram message needs no pooled session, scrapers or CPU workers
+        await assistant.run_reminder_task()
+        return
+    if assistant.cassette is not None and assistant.cassette.replaying:
+        workdir = tempfile.mkdtemp(prefix="job_assistant_replay_")
+        assistant.isolate(workdir)
+        logger.info(f"Replaying {assistant.cassette.path}; history, caches and reports go to {workdir}")
+    async with assistant:
         await assistant.run_morning_task()
 
 
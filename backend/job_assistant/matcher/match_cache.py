@@ -0,0 +1,98 @@
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional
+from config import MATCH_CACHE_FILE, MATCH_CACHE_MAX_ENTRIES
+from matcher.skill_matcher import MATCH_FIELDS, skills_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(job: Dict) -> str:
+    """Hash of the text a job is matched on, its title and description"""
+    text = f"{job.get('title', '')}\n{job.get('description', '')}"
+    return hashlib.sha1(text.encode('utf-8', 'replace')).hexdigest()
+
+
+class MatchCache:
+    """Persistent cache of skill-match results, keyed by a hash of the job's text.
+
+    The same postings come back from the feeds day after day; their match
+    results are served from here instead of rescanning the description.
+    The file records the fingerprint of the skill lists and vocabulary the
+    results were computed with, and a cache written for different ones is
+    discarded on load. The least recently used entries are evicted beyond
+    `max_entries`.
+    """
+
+    def __init__(self, skills_base: List[str], vocabulary: List[str], cache_file: str = MATCH_CACHE_FILE,
+                 max_entries: int = MATCH_CACHE_MAX_ENTRIES):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.fingerprint = skills_fingerprint(skills_base, vocabulary)
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """Load the cached results, most recently used last"""
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable match cache: {str(e)}")
+            return
+        if data.get('fingerprint') != self.fingerprint:
+            logger.info("Skill lists changed since the match cache was written, starting it afresh")
+            self._dirty = True
+            return
+        self._entries.update(data.get('entries', {}))
+
+    def save(self):
+        """Persist the cache if anything changed"""
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        with open(self.cache_file, 'w') as f:
+            json.dump({'fingerprint': self.fingerprint, 'updated': datetime.now().isoformat(),
+                       'entries': self._entries}, f)
+        self._dirty = False
+
+    def apply(self, job: Dict) -> bool:
+        """Copy a cached result onto the job; False when it has to be matched"""
+        key = content_hash(job)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return False
+        self.stats["hits"] += 1
+        self._entries.move_to_end(key)
+        self._dirty = True
+        for field in MATCH_FIELDS:
+            job[field] = entry[field]
+        return True
+
+    def store(self, job: Dict):
+        """Remember a matched job's result"""
+        key = content_hash(job)
+        self._entries[key] = {field: job[field] for field in MATCH_FIELDS}
+        self._entries.move_to_end(key)
+        self._dirty = True
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else None
+
+    def summary(self) -> str:
+        """One-line report of cache effectiveness for the run log"""
+        rate = self.hit_rate()
+        return (f"{self.stats['hits']} hits, {self.stats['misses']} misses"
+                f"{'' if rate is None else f' ({rate:.0%} hit rate)'}, {len(self._entries)} entries")
@@ -1,9 +1,94 @@
 import re
+import hashlib
+import json
 import logging
-from typing import Dict, List, Set
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+from config import CPU_WORKERS, PARALLEL_MATCH_MIN_JOBS
+from matcher.skill_vocabulary import SkillVocabulary
 
 logger = logging.getLogger(__name__)
 
+# Keys match_job sets on a job: bitmasks over the SkillVocabulary, and the score
+MATCH_FIELDS = ('skill_mask', 'matched_mask', 'match_percentage')
+
+# Zero-width; matches where \b would inside a skill's own pattern
+_WORD_BOUNDARY = re.compile(r'\b')
+
+
+def _trie_pattern(skills: Iterable[str]) -> str:
+    r"""Regex source matching any of `skills`, with alternatives merged on common prefixes.
+
+    "go", "golang" and "google cloud" become go(?:lang|ogle\ cloud)?, so at
+    each position of the text the regex engine follows a single branch
+    instead of trying every skill in turn. Optional tails are greedy, which
+    makes the first match at a position the longest skill found there.
+    """
+    trie: Dict = {}
+    for skill in skills:
+        node = trie
+        for char in skill:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+
+class SkillExtractor:
+    r"""Finds every skill of a vocabulary in a text with a single regex pass.
+
+    Gives the same results as searching the text for r'\bskill\b' once per
+    skill (case-insensitively), including skills that overlap or start
+    inside another one: the combined pattern is a lookahead, so it is tried
+    at every word boundary, and the shorter skills that are prefixes of the
+    longest one found at a position are checked for their own trailing
+    boundary.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills = sorted({skill.lower() for skill in skills if skill})
+        self._skill_set = set(self.skills)
+        self._pattern = re.compile(r'\b(?=(' + _trie_pattern(self.skills) + r')\b)', re.IGNORECASE)
+        # Shorter skills each skill starts with, e.g. "django" for "django rest framework"
+        self._prefixes = {
+            skill: [other for other in self.skills if len(other) < len(skill) and skill.startswith(other)]
+            for skill in self.skills
+        }
+
+    def _skill_for(self, matched: str) -> str:
+        skill = matched.lower()
+        if skill in self._skill_set:
+            return skill
+        # Case folds that str.lower() does not reproduce (e.g. the Kelvin sign)
+        return next(s for s in self.skills if len(s) == len(matched)
+                    and re.fullmatch(re.escape(s), matched, re.IGNORECASE))
+
+    def extract(self, text: str) -> Set[str]:
+        found = set()
+        for match in self._pattern.finditer(text):
+            skill = self._skill_for(match.group(1))
+            found.add(skill)
+            start = match.start()
+            for prefix in self._prefixes[skill]:
+                if prefix not in found and _WORD_BOUNDARY.match(text, start + len(prefix)):
+                    found.add(prefix)
+        return found
+
+
+@lru_cache(maxsize=8)
+def skill_extractor(skills: FrozenSet[str]) -> SkillExtractor:
+    """The extractor for a vocabulary, compiled once per process"""
+    return SkillExtractor(skills)
+
 
 class SkillMatcher:
     # Common tech skills that may appear in job descriptions beyond user's base
@@ -30,7 +115,7 @@ class SkillMatcher:
         "selenium", "pytest", "unit testing",
     ]
 
-    def __init__(self, skills_base: List[str]):
+    def __init__(self, skills_base: List[str], vocabulary: Optional[SkillVocabulary] = None):
         self.skills_base = [skill.lower() for skill in skills_base]
         self.skills_base_set = set(self.skills_base)
 
@@ -39,65 +124,115 @@ class SkillMatcher:
         for s in self.COMMON_INDUSTRY_SKILLS:
             all_detectable.add(s.lower())
         self.all_detectable = list(all_detectable)
-        self.all_patterns = self._create_patterns(self.all_detectable)
+        self.extractor = skill_extractor(frozenset(all_detectable))
 
-    def _create_patterns(self, skills: List[str]) -> Dict[str, re.Pattern]:
-        """Create regex patterns for each skill"""
-        patterns = {}
-        for skill in skills:
-            pattern = re.compile(r'\b' + re.escape(skill) + r'\b', re.IGNORECASE)
-            patterns[skill] = pattern
-        return patterns
+        # Skills are scored as bitmasks over the vocabulary, which gains any
+        # detectable skill it does not know yet
+        self.vocabulary = vocabulary if vocabulary is not None else SkillVocabulary()
+        self.vocabulary.extend(sorted(all_detectable))
+        self.skills_base_mask = self.vocabulary.mask(self.skills_base)
 
     def extract_all_skills_from_text(self, text: str) -> Set[str]:
         """Extract ALL recognizable skills from job description (not just user's)."""
         if not text:
             return set()
+        return self.extractor.extract(text)
 
-        found_skills = set()
-        for skill in self.all_detectable:
-            pattern = self.all_patterns.get(skill)
-            if pattern and pattern.search(text):
-                found_skills.add(skill)
-        return found_skills
-
-    def match_job(self, job: Dict) -> Dict:
-        """Match job against skill base and calculate percentage"""
-        description = job.get('description', '')
+    def required_skills(self, job: Dict) -> Set[str]:
+        """Skills the job asks for, from its title and description"""
         title = job.get('title', '')
 
         # Combine title and description for better matching
-        full_text = f"{title} {description}"
-
-        # Extract ALL skills from job description (including ones user doesn't have)
-        required_skills = self.extract_all_skills_from_text(full_text)
+        required_skills = self.extract_all_skills_from_text(f"{title} {job.get('description', '')}")
 
         if not required_skills:
             # If no skills found, check if it's a Python/Backend role by title
             if any(keyword in title.lower() for keyword in ['python', 'django', 'backend']):
                 required_skills = {'python'}  # Default minimum
+        return required_skills
 
-        # Match: intersection of required skills with USER's skill base
-        matched_skills = required_skills.intersection(self.skills_base_set)
-        # Missing: skills the job wants that the user does NOT have
-        missing_skills = required_skills - matched_skills
-
-        # Calculate match percentage
-        if required_skills:
-            match_percentage = (len(matched_skills) / len(required_skills)) * 100
-        else:
-            match_percentage = 0
-
-        # Update job with matching info
-        job['required_skills'] = sorted(list(required_skills))
-        job['matched_skills'] = sorted(list(matched_skills))
-        job['missing_skills'] = sorted(list(missing_skills))
-        job['match_percentage'] = round(match_percentage, 2)
-
-        # Log details for transparency
-        logger.debug(f"Matching Job: {title}")
-        logger.debug(f"  Required: {job['required_skills']}")
-        logger.debug(f"  Matched:  {job['matched_skills']}")
-        logger.debug(f"  Match %:  {job['match_percentage']}%")
-
-        return job
+    def score(self, skill_mask: int) -> Dict:
+        """Matched skills and match percentage for a mask of required skills"""
+        # Match: intersection of required skills with USER's skill base;
+        # missing ones are skill_mask & ~matched_mask
+        matched_mask = skill_mask & self.skills_base_mask
+
+        required = skill_mask.bit_count()
+        match_percentage = (matched_mask.bit_count() / required) * 100 if required else 0
+
+        return {
+            'skill_mask': skill_mask,
+            'matched_mask': matched_mask,
+            'match_percentage': round(match_percentage, 2),
+        }
+
+    def match_job(self, job: Dict) -> Dict:
+        """Match job against skill base and calculate percentage"""
+        return self.match_jobs([job], processes=1)[0]
+
+    def match_jobs(self, jobs: List[Dict], processes: Optional[int] = None) -> List[Dict]:
+        """Match a batch of jobs, updating each in place; returns the jobs.
+
+        Sets MATCH_FIELDS on every job; skill names are only expanded from
+        the masks for reports (see skill_vocabulary.skill_lists). Jobs that
+        ask for the same set of skills are scored once. Batches of at least
+        PARALLEL_MATCH_MIN_JOBS are split across `processes` worker processes
+        (CPU_WORKERS by default; 1 keeps all work in this process).
+        """
+        processes = processes or CPU_WORKERS
+        if processes > 1 and len(jobs) >= PARALLEL_MATCH_MIN_JOBS:
+            try:
+                return self._match_in_processes(jobs, processes)
+            except (OSError, NotImplementedError, PermissionError) as e:
+                logger.warning(f"Process pool unavailable, matching in this process: {str(e)}")
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        scores: Dict[int, Dict] = {}
+        for job in jobs:
+            skill_mask = self.vocabulary.mask(self.required_skills(job))
+            score = scores.get(skill_mask)
+            if score is None:
+                score = scores[skill_mask] = self.score(skill_mask)
+            job.update(score)
+
+            # Log details for transparency
+            if debug:
+                logger.debug(f"Matching Job: {job.get('title', '')}")
+                logger.debug(f"  Required: {self.vocabulary.names(job['skill_mask'])}")
+                logger.debug(f"  Matched:  {self.vocabulary.names(job['matched_mask'])}")
+                logger.debug(f"  Match %:  {job['match_percentage']}%")
+        return jobs
+
+    def _match_in_processes(self, jobs: List[Dict], processes: int) -> List[Dict]:
+        # A few chunks per worker keeps them busy when chunks take uneven time
+        size = -(-len(jobs) // (processes * 4))
+        chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = pool.map(match_jobs_in_worker, repeat(self.skills_base),
+                               repeat(self.vocabulary.skills), chunks)
+            for chunk, matched_chunk in zip(chunks, results):
+                for job, matched_job in zip(chunk, matched_chunk):
+                    for key in MATCH_FIELDS:
+                        job[key] = matched_job[key]
+        return jobs
+
+
+def skills_fingerprint(skills_base: List[str], vocabulary: List[str]) -> str:
+    """Hash of everything a match result depends on besides the job's text"""
+    lists = [sorted({skill.lower() for skill in skills_base}),
+             sorted({skill.lower() for skill in SkillMatcher.COMMON_INDUSTRY_SKILLS}),
+             list(vocabulary)]
+    return hashlib.sha1(json.dumps(lists).encode()).hexdigest()
+
+
+# Matchers built inside worker processes, keyed by skills base and vocabulary
+_worker_matchers: Dict[tuple, SkillMatcher] = {}
+
+
+def match_jobs_in_worker(skills_base: List[str], vocabulary: List[str], jobs: List[Dict]) -> List[Dict]:
+    """Match a chunk of jobs; runs in a CPU worker, reusing its matcher"""
+    key = (tuple(skills_base), tuple(vocabulary))
+    matcher = _worker_matchers.get(key)
+    if matcher is None:
+        matcher = _worker_matchers[key] = SkillMatcher(skills_base, SkillVocabulary(vocabulary))
+    return matcher.match_jobs(jobs, processes=1)
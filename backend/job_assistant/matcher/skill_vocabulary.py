@@ -0,0 +1,65 @@
+from typing import Dict, Iterable, List, Optional
+
+
+class SkillVocabulary:
+    """Index of skill names, so a set of skills can be held as one int bitmask.
+
+    Bit i stands for skills[i]. The vocabulary only ever grows, and it is
+    saved in the job history next to the masks, so masks written on earlier
+    runs keep their meaning. Set operations on skills become &, | and ~, and
+    counting them int.bit_count(); names are only needed for display.
+    """
+
+    def __init__(self, skills: Iterable[str] = ()):
+        self.skills: List[str] = []
+        self.bits: Dict[str, int] = {}
+        self.extend(skills)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def __contains__(self, skill: str) -> bool:
+        return skill.lower() in self.bits
+
+    def extend(self, skills: Iterable[str]) -> int:
+        """Append skills not in the vocabulary yet; returns how many were new"""
+        added = 0
+        for skill in skills:
+            skill = skill.lower()
+            if skill not in self.bits:
+                self.bits[skill] = 1 << len(self.skills)
+                self.skills.append(skill)
+                added += 1
+        return added
+
+    def mask(self, skills: Iterable[str]) -> int:
+        """Bitmask of `skills`; raises KeyError for a skill not in the vocabulary"""
+        mask = 0
+        for skill in skills:
+            mask |= self.bits[skill.lower()]
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        """The skills in `mask`, sorted by name"""
+        names = []
+        while mask:
+            lowest = mask & -mask
+            names.append(self.skills[lowest.bit_length() - 1])
+            mask ^= lowest
+        return sorted(names)
+
+
+def skill_lists(job: Dict, vocabulary: Optional[SkillVocabulary] = None) -> Dict[str, List[str]]:
+    """Required, matched and missing skill names of a matched job, for reports.
+
+    Expands the job's masks with `vocabulary`; jobs matched before masks
+    were introduced still carry the lists themselves.
+    """
+    if vocabulary is None or 'skill_mask' not in job:
+        return {field: job.get(field, []) for field in ('required_skills', 'matched_skills', 'missing_skills')}
+    required, matched = job['skill_mask'], job.get('matched_mask', 0)
+    return {
+        'required_skills': vocabulary.names(required),
+        'matched_skills': vocabulary.names(matched),
+        'missing_skills': vocabulary.names(required & ~matched),
+    }
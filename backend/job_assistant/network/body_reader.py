@@ -0,0 +1,141 @@
+import codecs
+import zlib
+from typing import Callable, NamedTuple, Optional
+from config import BODY_CHUNK_SIZE
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Only advertise encodings we can decode ourselves, since responses are read
+# with aiohttp's auto_decompress off
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+# Called with each newly decoded piece of text; True stops the download.
+# Requests take a factory for these, so every attempt starts fresh.
+StopPredicate = Callable[[str], bool]
+
+
+class ContentDecoder:
+    """Incremental Content-Encoding decoder for identity, gzip, deflate and br bodies"""
+
+    def __init__(self, encoding: str = ""):
+        self.encoding = (encoding or "identity").strip().lower()
+        self._zlib = None
+        self._brotli = None
+        if self.encoding in ("gzip", "x-gzip"):
+            self._zlib = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.encoding == "deflate":
+            # Decided once the first two bytes show whether there is a zlib header
+            self._deflate_head = b""
+        elif self.encoding == "br" and brotli is not None:
+            self._brotli = brotli.Decompressor()
+        elif self.encoding != "identity":
+            raise ValueError(f"Unsupported Content-Encoding: {self.encoding}")
+
+    def decompress(self, data: bytes, max_length: int = 0) -> bytes:
+        """Decode a chunk; with `max_length`, zlib output is cut there without inflating the rest"""
+        if self.encoding == "deflate" and self._zlib is None:
+            data = self._deflate_head + data
+            if len(data) < 2:
+                self._deflate_head = data
+                return b""
+            # Some servers send raw deflate without the zlib header
+            zlib_header = data[0] & 0x0F == 8 and (data[0] << 8 | data[1]) % 31 == 0
+            self._zlib = zlib.decompressobj(zlib.MAX_WBITS if zlib_header else -zlib.MAX_WBITS)
+        if self._zlib is not None:
+            return self._zlib.decompress(data, max_length)
+        if self._brotli is not None:
+            return self._brotli.process(data)
+        return data
+
+    @property
+    def unconsumed_tail(self) -> bytes:
+        """Input held back by the last decompress() because output hit max_length"""
+        return self._zlib.unconsumed_tail if self._zlib is not None else b""
+
+    def flush(self) -> bytes:
+        if self._zlib is not None:
+            return self._zlib.flush()
+        return b""
+
+
+def _charset(response) -> str:
+    """The response's declared charset, or UTF-8 when it has none we know"""
+    charset = response.charset or "utf-8"
+    try:
+        codecs.lookup(charset)
+    except LookupError:
+        return "utf-8"
+    return charset
+
+
+class BodyRead(NamedTuple):
+    text: str
+    wire_bytes: int  # Bytes received, before decompression
+    body_bytes: int  # Decoded bytes kept
+    truncated: bool  # Cut off at the size limit
+    stopped: bool  # Ended early because the stop predicate was satisfied
+
+    @property
+    def complete(self) -> bool:
+        return not self.truncated and not self.stopped
+
+
+async def read_body(response, max_bytes: int, stop: Optional[StopPredicate] = None,
+                    chunk_size: int = BODY_CHUNK_SIZE) -> BodyRead:
+    """Read a response body chunk by chunk, keeping at most `max_bytes` decoded bytes.
+
+    The response must have been requested with auto_decompress=False. Once
+    the limit is reached or `stop` returns True, reading ends and the rest
+    of the body is never downloaded (the connection is dropped on release).
+    """
+    decoder = ContentDecoder(response.headers.get("Content-Encoding", ""))
+    text_decoder = codecs.getincrementaldecoder(_charset(response))(errors="replace")
+    parts = []
+    wire_bytes = body_bytes = 0
+    truncated = stopped = False
+    async for chunk in response.content.iter_chunked(chunk_size):
+        wire_bytes += len(chunk)
+        # Inflate at most chunk_size bytes at a time, so a stop or the limit
+        # also saves decompressing the rest of a highly compressed chunk
+        while chunk and not (truncated or stopped):
+            data = decoder.decompress(chunk, min(chunk_size, max_bytes - body_bytes + 1))
+            chunk = decoder.unconsumed_tail
+            if body_bytes + len(data) > max_bytes:
+                data = data[:max_bytes - body_bytes]
+                truncated = True
+            body_bytes += len(data)
+            text = text_decoder.decode(data)
+            parts.append(text)
+            if not truncated and stop is not None and stop(text):
+                stopped = True
+        if truncated or stopped:
+            break
+    else:
+        data = decoder.flush()[:max_bytes - body_bytes]
+        body_bytes += len(data)
+        parts.append(text_decoder.decode(data, final=True))
+    return BodyRead("".join(parts), wire_bytes, body_bytes, truncated, stopped)
+
+
+def stop_at_marker(*markers: str) -> StopPredicate:
+    """Stop predicate that is satisfied once any of `markers` has been read.
+
+    Keeps a short tail of the previous chunk, so a marker split across two
+    chunks is still found. Pass functools.partial(stop_at_marker, ...) as a
+    request's stop factory.
+    """
+    overlap = max(len(marker) for marker in markers) - 1
+    tail = ""
+
+    def seen(text: str) -> bool:
+        nonlocal tail
+        window = tail + text
+        if any(marker in window for marker in markers):
+            return True
+        tail = window[-overlap:] if overlap else ""
+        return False
+
+    return seen
@@ -0,0 +1,107 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Optional
+from config import HTTP_CASSETTE_MODE, HTTP_CASSETTE_PATH, HTTP_CASSETTE_REPLAY_LATENCY
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("off", "record", "replay")
+
+
+class Cassette:
+    """Record/replay store for scraper HTTP traffic.
+
+    In "record" mode every body returned by BaseScraper's request path is
+    captured (failures included, as ""), together with how long the request
+    took. In "replay" mode those bodies are served back without touching
+    the network, optionally after sleeping for the recorded latency.
+    Interactions are keyed by method, URL and request payload and stored
+    in one gzipped JSON file.
+    """
+
+    def __init__(self, path: str = HTTP_CASSETTE_PATH, mode: str = HTTP_CASSETTE_MODE,
+                 replay_latency: bool = HTTP_CASSETTE_REPLAY_LATENCY):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.stats = {"recorded": 0, "replayed": 0, "missing": 0}
+        self._interactions: Dict[str, Dict] = {}
+        self._dirty = False
+        if mode == "replay":
+            self._load()
+
+    @classmethod
+    def from_config(cls) -> Optional["Cassette"]:
+        """The cassette selected by HTTP_CASSETTE_MODE, or None when off"""
+        if HTTP_CASSETTE_MODE == "off":
+            return None
+        return cls()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _load(self):
+        try:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                self._interactions = json.load(f).get('interactions', {})
+        except FileNotFoundError:
+            logger.warning(f"Cassette {self.path} not found, every request will miss")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cassette {self.path}, every request will miss: {str(e)}")
+            self._interactions = {}
+        logger.info(f"Replaying {len(self._interactions)} recorded responses from {self.path}")
+
+    def save(self):
+        """Write recorded interactions (record mode only)"""
+        if self.mode != "record" or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+            json.dump({'version': 1, 'interactions': self._interactions}, f)
+        self._dirty = False
+        logger.info(f"Recorded {len(self._interactions)} responses to {self.path}")
+
+    @staticmethod
+    def key(method: str, url: str, request_kwargs: Dict) -> str:
+        """Identify a request by method, URL and any payload sent with it"""
+        payload = {name: request_kwargs[name] for name in ('params', 'data', 'json') if name in request_kwargs}
+        if not payload:
+            return f"{method} {url}"
+        digest = hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+        return f"{method} {url} {digest[:12]}"
+
+    def record(self, method: str, url: str, request_kwargs: Dict, body: str, elapsed: float):
+        """Capture the body a request produced and how long it took"""
+        self._interactions[self.key(method, url, request_kwargs)] = {
+            'method': method,
+            'url': url,
+            'body': body,
+            'elapsed': round(elapsed, 3)
+        }
+        self.stats["recorded"] += 1
+        self._dirty = True
+
+    async def play(self, method: str, url: str, request_kwargs: Dict) -> str:
+        """Serve a recorded body ("" when the request was never recorded)"""
+        interaction = self._interactions.get(self.key(method, url, request_kwargs))
+        if interaction is None:
+            self.stats["missing"] += 1
+            logger.warning(f"No recorded response for {method} {url}")
+            return ""
+        self.stats["replayed"] += 1
+        if self.replay_latency:
+            await asyncio.sleep(interaction['elapsed'])
+        return interaction['body']
+
+    def summary(self) -> str:
+        """One-line report for the run log"""
+        if self.replaying:
+            return f"{self.stats['replayed']} replayed, {self.stats['missing']} not recorded"
+        return f"{self.stats['recorded']} recorded"
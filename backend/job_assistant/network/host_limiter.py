@@ -0,0 +1,30 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from config import MAX_CONCURRENT_REQUESTS_PER_HOST, HOST_CONCURRENCY_LIMITS
+
+
+class HostLimiter:
+    """Caps the number of in-flight requests per host, shared by all scrapers"""
+
+    def __init__(self, default_limit: int = MAX_CONCURRENT_REQUESTS_PER_HOST,
+                 limits: Optional[Dict[str, int]] = None):
+        self.default_limit = default_limit
+        self.limits = dict(HOST_CONCURRENCY_LIMITS if limits is None else limits)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Get (or lazily create) the semaphore guarding a host"""
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.limits.get(host, self.default_limit))
+            self._semaphores[host] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Hold one of the host's request slots for the duration of the block"""
+        host = urlparse(url).hostname or ''
+        async with self._get_semaphore(host):
+            yield
@@ -0,0 +1,152 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+from config import HTTP_CACHE_DIR, HTTP_CACHE_TTL, HTTP_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """Persistent HTTP response cache with ETag/Last-Modified revalidation.
+
+    Bodies are stored gzipped next to a JSON index keyed by URL. Entries younger
+    than the TTL are served without touching the network; older ones are
+    revalidated with a conditional GET. The least recently used entries are
+    evicted once the stored bodies exceed the size bound.
+    """
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR, ttl: int = HTTP_CACHE_TTL,
+                 max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "bytes_saved": 0}
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._dirty = False
+        self._load_index()
+
+    def _load_index(self):
+        """Load the cache index, most recently used entries last"""
+        try:
+            with open(self.index_file, 'r') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable HTTP cache index: {str(e)}")
+            return
+        for url, entry in sorted(entries.items(), key=lambda item: item[1].get('last_used', 0)):
+            self._entries[url] = entry
+
+    def save(self):
+        """Persist the cache index if anything changed"""
+        if not self._dirty:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.index_file, 'w') as f:
+            json.dump(self._entries, f)
+        self._dirty = False
+
+    def _body_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode()).hexdigest() + ".gz")
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Get the cache entry for a URL, if any"""
+        entry = self._entries.get(url)
+        if entry is not None and not os.path.exists(self._body_path(url)):
+            del self._entries[url]
+            self._dirty = True
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Whether an entry can be served without revalidation"""
+        return time.time() - entry.get('stored_at', 0) < self.ttl
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for an entry"""
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def read_body(self, url: str) -> Optional[str]:
+        """Read a cached body and mark the entry as recently used"""
+        try:
+            with gzip.open(self._body_path(url), 'rt', encoding='utf-8') as f:
+                body = f.read()
+        except Exception as e:
+            logger.warning(f"Dropping unreadable HTTP cache entry for {url}: {str(e)}")
+            self._entries.pop(url, None)
+            self._dirty = True
+            return None
+        entry = self._entries[url]
+        entry['last_used'] = time.time()
+        self._entries.move_to_end(url)
+        self._dirty = True
+        return body
+
+    def record_hit(self, url: str):
+        """Count a fresh entry served without a request"""
+        self.stats["hits"] += 1
+        self.stats["bytes_saved"] += self._entries[url].get('size', 0)
+
+    def record_revalidated(self, url: str, headers) -> None:
+        """Refresh an entry after the server answered 304 Not Modified"""
+        entry = self._entries[url]
+        entry['stored_at'] = time.time()
+        if headers.get('ETag'):
+            entry['etag'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            entry['last_modified'] = headers['Last-Modified']
+        self._dirty = True
+        self.stats["revalidated"] += 1
+        self.stats["bytes_saved"] += entry.get('size', 0)
+
+    def store(self, url: str, body: str, headers) -> None:
+        """Store a freshly downloaded body"""
+        self.stats["misses"] += 1
+        if 'no-store' in headers.get('Cache-Control', ''):
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with gzip.open(self._body_path(url), 'wt', encoding='utf-8') as f:
+            f.write(body)
+        now = time.time()
+        self._entries[url] = {
+            'etag': headers.get('ETag', ''),
+            'last_modified': headers.get('Last-Modified', ''),
+            'stored_at': now,
+            'last_used': now,
+            'size': len(body.encode('utf-8'))
+        }
+        self._entries.move_to_end(url)
+        self._dirty = True
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the size bound holds"""
+        total = sum(entry.get('size', 0) for entry in self._entries.values())
+        while total > self.max_bytes and len(self._entries) > 1:
+            url, entry = self._entries.popitem(last=False)
+            total -= entry.get('size', 0)
+            self._dirty = True
+            try:
+                os.remove(self._body_path(url))
+            except OSError:
+                pass
+
+    def summary(self) -> str:
+        """One-line report of cache effectiveness for the run log"""
+        return (f"{self.stats['hits']} hits, {self.stats['misses']} misses, "
+                f"{self.stats['revalidated']} revalidated (304), "
+                f"{self.stats['bytes_saved'] / 1024:.0f} KiB not re-downloaded")
@@ -0,0 +1,88 @@
+import codecs
+import json
+import re
+from typing import Any, List, Optional
+
+WHITESPACE_AND_COMMAS = re.compile(r'[\s,]*')
+# Characters that can follow a complete array item
+VALUE_TERMINATORS = frozenset(',] \t\r\n')
+
+
+class JsonArrayStream:
+    """Incremental decoder for the items of one JSON array.
+
+    Feed it raw body chunks as they arrive; each call returns the array
+    items completed so far. `key` names the array inside a top-level object
+    (e.g. "jobs" for {"jobs": [...]}); without it the body itself must be
+    the array. Anything after the closing bracket is ignored.
+    """
+
+    def __init__(self, key: Optional[str] = None):
+        self.key = key
+        self.done = False
+        self._utf8 = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._in_array = False
+        if key is not None:
+            self._key_pattern = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add a chunk of the body and return the items it completed"""
+        if self.done:
+            return []
+        self._buffer += self._utf8.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """Flush the items left once the body has been read completely"""
+        if self.done:
+            return []
+        self._buffer += self._utf8.decode(b'', final=True)
+        return self._drain(final=True)
+
+    def _find_array_start(self) -> bool:
+        if self.key is None:
+            stripped = self._buffer.lstrip()
+            if not stripped:
+                return False
+            if stripped[0] != '[':
+                raise ValueError("Expected a JSON array")
+            self._buffer = stripped[1:]
+        else:
+            match = self._key_pattern.search(self._buffer)
+            if match is None:
+                return False
+            self._buffer = self._buffer[match.end():]
+        self._in_array = True
+        return True
+
+    def _drain(self, final: bool) -> List[Any]:
+        items = []
+        if not self._in_array and not self._find_array_start():
+            return items
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = WHITESPACE_AND_COMMAS.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == ']':
+                self.done = True
+                break
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The item is still incomplete; wait for the next chunk
+                if final:
+                    raise
+                break
+            if not final and not isinstance(item, (dict, list)) and \
+               (end == len(buffer) or buffer[end] not in VALUE_TERMINATORS):
+                # A number or literal cut off by the chunk ("-2." of "-2.5") still decodes,
+                # shortened; it only counts as complete once a separator follows it
+                break
+            items.append(item)
+            pos = end
+        self._buffer = buffer[pos:]
+        return items
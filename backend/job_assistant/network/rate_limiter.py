@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+from config import DEFAULT_RATE_LIMIT, RATE_LIMITS, RATE_LIMIT_JITTER, RATE_LIMIT_MIN_RATE
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Token bucket for one host, slowed down when the host pushes back"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, jitter: float = 0.0) -> float:
+        """Wait for a token; returns the seconds spent waiting"""
+        started = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    break
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+            if jitter:
+                # Jitter is taken while holding the lock so spacing stays irregular
+                await asyncio.sleep(random.uniform(0, jitter))
+        return time.monotonic() - started
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """Halve the rate and pause the host, honouring Retry-After when given"""
+        now = time.monotonic()
+        self.rate = max(RATE_LIMIT_MIN_RATE, self.rate / 2)
+        self.tokens = 0.0
+        self.updated = now
+        pause = retry_after if retry_after is not None else 1 / self.rate
+        self.blocked_until = max(self.blocked_until, now + pause)
+
+    def reward(self):
+        """Recover the rate additively after a successful request"""
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * 0.1)
+
+
+class RateLimiter:
+    """Per-host token buckets shared by every scraper in a run"""
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 default_limit: Tuple[float, int] = DEFAULT_RATE_LIMIT,
+                 jitter: float = RATE_LIMIT_JITTER):
+        self.limits = dict(RATE_LIMITS if limits is None else limits)
+        self.default_limit = default_limit
+        self.jitter = jitter
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _get_bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).hostname or ''
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, capacity = self.limits.get(host, self.default_limit)
+            bucket = TokenBucket(rate, capacity)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, url: str) -> float:
+        """Wait until a request to the URL's host is allowed"""
+        host_jitter = self.jitter if urlparse(url).hostname in self.limits else 0.0
+        return await self._get_bucket(url).acquire(host_jitter)
+
+    def penalize(self, url: str, retry_after: Optional[float] = None):
+        """Back off a host that answered 429/503"""
+        bucket = self._get_bucket(url)
+        bucket.penalize(retry_after)
+        logger.warning(f"Slowing down {urlparse(url).hostname} to {bucket.rate:.2f} req/s"
+                       + (f" (Retry-After {retry_after:.0f}s)" if retry_after is not None else ""))
+
+    def reward(self, url: str):
+        """Let a host that answered normally recover towards its configured rate"""
+        self._get_bucket(url).reward()
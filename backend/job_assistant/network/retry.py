@@ -0,0 +1,39 @@
+import random
+from typing import Optional
+from config import RETRY_MAX_ATTEMPTS, RETRY_BACKOFF_BASE, RETRY_BACKOFF_MAX, REQUEST_DEADLINE
+
+
+class RetryableResponse(Exception):
+    """Raised for a response status worth retrying (429 and transient 5xx)"""
+
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, bounded by a per-request deadline.
+    
+    Only GET requests are retried since they are safe to repeat.
+    """
+    RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+    RETRYABLE_METHODS = {'GET'}
+
+    def __init__(self, max_attempts: int = RETRY_MAX_ATTEMPTS, base_delay: float = RETRY_BACKOFF_BASE,
+                 max_delay: float = RETRY_BACKOFF_MAX, deadline: float = REQUEST_DEADLINE):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """Whether another attempt is allowed after `attempt` attempts"""
+        return method.upper() in self.RETRYABLE_METHODS and attempt < self.max_attempts
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before the next attempt; never shorter than Retry-After"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
@@ -0,0 +1,51 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
+import aiohttp
+from config import (
+    REQUEST_TIMEOUT,
+    CONNECTION_POOL_LIMIT,
+    CONNECTION_POOL_LIMIT_PER_HOST,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _create_resolver() -> Optional[aiohttp.abc.AbstractResolver]:
+    """Use the aiodns resolver when it is installed, else aiohttp's default"""
+    try:
+        import aiodns  # noqa: F401
+        return aiohttp.AsyncResolver()
+    except Exception as e:
+        logger.debug(f"aiodns resolver unavailable, using threaded DNS: {str(e)}")
+        return None
+
+
+def create_session(limit: int = CONNECTION_POOL_LIMIT,
+                   limit_per_host: int = CONNECTION_POOL_LIMIT_PER_HOST) -> aiohttp.ClientSession:
+    """Create the pooled session shared by every scraper for one run.
+    
+    Must be called from inside the running event loop.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        resolver=_create_resolver()
+    )
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+@asynccontextmanager
+async def session_scope(session: Optional[aiohttp.ClientSession], timeout: float = REQUEST_TIMEOUT):
+    """Yield the shared session, or a throwaway one when none was injected"""
+    if session is not None and not session.closed:
+        yield session
+    else:
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        async with aiohttp.ClientSession(timeout=client_timeout) as own_session:
+            yield own_session
@@ -0,0 +1,141 @@
+"""Plain-text job descriptions, cleaned once between scraping and matching.
+
+Remote OK and Remotive hand out descriptions as HTML, sometimes escaped a
+second time. Left as they are, the skill matcher, the ranker and the
+near-duplicate shingles all scan the markup, and every copy of the job
+(worker processes, caches, reports) carries it along.
+"""
+
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict
+from config import DESCRIPTION_CACHE_FILE, DESCRIPTION_CACHE_MAX_ENTRIES, NORMALIZE_MAX_DESCRIPTION_CHARS
+
+logger = logging.getLogger(__name__)
+
+# Elements whose content is not text of the description
+IGNORED_ELEMENT_PATTERN = re.compile(r'<(script|style|noscript|template)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+# Elements that end a line or a block of text, so their tags separate words;
+# inline tags (<b>, <a>, <span>) do not, as in "<b>Py</b>thon"
+BLOCK_ELEMENTS = {"address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "figcaption",
+                  "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li",
+                  "main", "nav", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul"}
+BLOCK_TAG_PATTERN = re.compile(r'</?(?:' + '|'.join(sorted(BLOCK_ELEMENTS)) + r')\b[^>]*>', re.IGNORECASE)
+# Tags start with a letter, '/' or '!', so "salary < 50k" in plain text is left alone
+TAG_PATTERN = re.compile(r'<[a-zA-Z/!][^>]*>')
+ENTITY_PATTERN = re.compile(r'&(?:[a-zA-Z][a-zA-Z0-9]*|#[0-9]+|#[xX][0-9a-fA-F]+);')
+MARKUP_PATTERN = re.compile(r'[<&]')
+# Stored with the cache; bump it when html_to_text's output changes so cached texts are redone
+CLEANER_VERSION = 2
+
+
+def _strip_markup(text: str) -> str:
+    text = BLOCK_TAG_PATTERN.sub(' ', IGNORED_ELEMENT_PATTERN.sub(' ', text))
+    return html.unescape(TAG_PATTERN.sub('', text))
+
+
+def html_to_text(text: str, max_chars: int = NORMALIZE_MAX_DESCRIPTION_CHARS) -> str:
+    """Text of an HTML description: tags and entities gone, whitespace collapsed, cut at a word boundary"""
+    if MARKUP_PATTERN.search(text):
+        text = _strip_markup(text)
+        # Markup that was escaped once more only turns into tags and entities now
+        if '<' in text or ENTITY_PATTERN.search(text):
+            text = _strip_markup(text)
+    # str.split() knows every Unicode space, &nbsp; included, and beats a \s+ regex by far
+    text = ' '.join(text.split())
+    if len(text) > max_chars:
+        cut = text.rfind(' ', 0, max_chars + 1)
+        text = text[:cut if cut > 0 else max_chars]
+    return text
+
+
+def description_hash(description: str) -> str:
+    return hashlib.sha1(description.encode('utf-8', 'replace')).hexdigest()
+
+
+class DescriptionNormalizer:
+    """Replaces each scraped job's description with its plain text, in place.
+
+    Descriptions with markup are cleaned with html_to_text and the result
+    is cached on disk by a hash of the raw description, so a posting that
+    the feeds return day after day is cleaned once. Plain-text descriptions
+    only have their whitespace collapsed and are not cached. The least
+    recently used entries are evicted beyond `max_entries`, and a cache
+    written with another `max_chars` or CLEANER_VERSION is discarded on load.
+    """
+
+    def __init__(self, cache_file: str = DESCRIPTION_CACHE_FILE, max_entries: int = DESCRIPTION_CACHE_MAX_ENTRIES,
+                 max_chars: int = NORMALIZE_MAX_DESCRIPTION_CHARS):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.stats = {"cleaned": 0, "cache_hits": 0, "plain": 0, "chars_in": 0, "chars_out": 0}
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """Load the cleaned descriptions, most recently used last"""
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable description cache: {str(e)}")
+            return
+        if data.get('max_chars') != self.max_chars or data.get('version') != CLEANER_VERSION:
+            logger.info("Description cleaning changed since the cache was written, starting it afresh")
+            self._dirty = True
+            return
+        self._entries.update(data.get('entries', {}))
+
+    def save(self):
+        """Persist the cache if anything changed"""
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        with open(self.cache_file, 'w') as f:
+            json.dump({'version': CLEANER_VERSION, 'max_chars': self.max_chars, 'updated': datetime.now().isoformat(),
+                       'entries': self._entries}, f)
+        self._dirty = False
+
+    def clean(self, description: str) -> str:
+        """Plain text of a description, from the cache when it was cleaned before"""
+        if not MARKUP_PATTERN.search(description):
+            self.stats["plain"] += 1
+            return html_to_text(description, self.max_chars)
+        key = description_hash(description)
+        text = self._entries.get(key)
+        if text is None:
+            self.stats["cleaned"] += 1
+            text = html_to_text(description, self.max_chars)
+            self._entries[key] = text
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self.stats["cache_hits"] += 1
+            self._entries.move_to_end(key)
+        self._dirty = True
+        return text
+
+    def normalize(self, job: Dict) -> Dict:
+        """Replace the job's description with its plain text"""
+        description = job.get('description') or ''
+        text = self.clean(description)
+        self.stats["chars_in"] += len(description)
+        self.stats["chars_out"] += len(text)
+        job['description'] = text
+        return job
+
+    def summary(self) -> str:
+        """One-line report for the run log"""
+        return (f"{self.stats['cleaned']} cleaned, {self.stats['cache_hits']} from cache, "
+                f"{self.stats['plain']} already plain text; {self.stats['chars_in'] / 1024:.0f} KiB "
+                f"of descriptions down to {self.stats['chars_out'] / 1024:.0f} KiB")
@@ -1,10 +1,12 @@
 import os
 import asyncio
-import aiohttp
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import logging
 from config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
 
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,6 +15,8 @@ class TelegramNotifier:
         self.bot_token = TELEGRAM_BOT_TOKEN
         self.chat_id = TELEGRAM_CHAT_ID
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
+        # Reuses the run's pooled session when JobSearchAssistant injects one
+        self.session: Optional["aiohttp.ClientSession"] = None
         
         if not self.bot_token or not self.chat_id:
             logger.warning("Telegram credentials not configured. Notifications will be skipped.")
@@ -23,6 +27,8 @@ class TelegramNotifier:
             logger.info(f"[Telegram Disabled] Would send: {message}")
             return False
         
+        # aiohttp is only imported once there is something to send
+        from network.session import session_scope
         try:
             url = f"{self.base_url}/sendMessage"
             payload = {
@@ -30,7 +36,7 @@ class TelegramNotifier:
                 "text": message,
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with session_scope(self.session) as session:
                 async with session.post(url, json=payload) as response:
                     if response.status == 200:
                         logger.info("Telegram message sent successfully")
@@ -0,0 +1,161 @@
+"""BM25 relevance of jobs to the user's profile, computed over a whole batch at once.
+
+The skill match only looks at which known skills a job names, so jobs that
+mention one or two of them all tie at 100%. This scores the full title and
+description against the profile (SKILLS_BASE, JOB_TITLES, TARGET_PROFILE)
+with BM25 and blends that into the ranking.
+
+Tokenizing is the expensive part of this, so it is done with NumPy on the
+UTF-8 bytes of all jobs joined together: word boundaries come from a byte
+lookup table, and every word is reduced to a 64-bit key hashed from its first
+and last eight bytes and its length. The key is a hash, not the word: words
+sharing one would count as the same term. Chance collisions among a few
+hundred profile terms are negligible, but words over 16 bytes are only told
+apart by their first and last eight bytes and length. A 16-bit tag rules
+out most words before their keys are looked up among the profile's terms,
+and the per-job counts become a SciPy sparse matrix that is scored in one
+product.
+"""
+
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from scipy import sparse
+from config import (SKILLS_BASE, JOB_TITLES, TARGET_PROFILE, RANK_RELEVANCE_WEIGHT,
+                    RANK_TITLE_WEIGHT, BM25_K1, BM25_B)
+
+logger = logging.getLogger(__name__)
+
+# Bytes that make up words: ASCII letters and digits, '+' and '#' (c++, c#),
+# and everything non-ASCII so accented words stay whole
+WORD_BYTES = np.zeros(256, dtype=bool)
+WORD_BYTES[[ord(c) for c in "abcdefghijklmnopqrstuvwxyz0123456789+#"]] = True
+WORD_BYTES[128:] = True
+
+# LOW_BYTES[n] keeps the first n bytes of a little-endian uint64
+LOW_BYTES = np.array([(1 << (8 * n)) - 1 for n in range(8)] + [2 ** 64 - 1], dtype=np.uint64)
+FIRST_MIX = np.uint64(0x9E3779B97F4A7C15)
+LAST_MIX = np.uint64(0xC2B2AE3D27D4EB4F)
+
+
+class _Words(NamedTuple):
+    """Every word of a text: where it starts, its length and its first 8 bytes"""
+    starts: np.ndarray
+    lengths: np.ndarray
+    first: np.ndarray
+    at: np.ndarray  # A uint64 at every byte offset of the text, shifted by 8
+
+    def tags(self) -> np.ndarray:
+        """16-bit digest of each word's first 8 bytes and length, for a cheap first filter"""
+        halves = self.first.view("<u2").reshape(-1, 4)
+        return halves[:, 0] ^ halves[:, 1] ^ halves[:, 2] ^ (self.lengths.astype(np.uint16) * np.uint16(0x9E37))
+
+    def keys(self, selected: Optional[np.ndarray] = None) -> np.ndarray:
+        """64-bit hash of the selected words (all by default) from their first and last 8 bytes and length"""
+        starts, lengths, first = self.starts, self.lengths, self.first
+        if selected is not None:
+            starts, lengths, first = starts[selected], lengths[selected], first[selected]
+        last = np.where(lengths > 8, self.at[starts + lengths], np.uint64(0))
+        with np.errstate(over="ignore"):
+            return first * FIRST_MIX + last * LAST_MIX + lengths.astype(np.uint64)
+
+
+def _words(text: str) -> _Words:
+    data = np.frombuffer(text.lower().encode("utf-8"), dtype=np.uint8)
+    is_word = np.zeros(len(data) + 2, dtype=bool)
+    is_word[1:-1] = WORD_BYTES[data]
+    starts = np.flatnonzero(is_word[1:] > is_word[:-1])
+    lengths = np.flatnonzero(is_word[:-1] > is_word[1:]) - starts
+
+    # at[i + 8] holds bytes i..i+7, so a word's first (or last) 8 bytes are one gather
+    padded = np.zeros(len(data) + 16, dtype=np.uint8)
+    padded[8:8 + len(data)] = data
+    at = np.ndarray(shape=(len(data) + 9,), dtype="<u8", buffer=padded, strides=(1,))
+    first = at[starts + 8] & LOW_BYTES[np.minimum(lengths, 8)]
+    return _Words(starts, lengths, first, at)
+
+
+def profile_text() -> str:
+    return " ".join(SKILLS_BASE + JOB_TITLES + [TARGET_PROFILE])
+
+
+class RelevanceRanker:
+    """Orders matched jobs by skill match blended with BM25 relevance to the profile.
+
+    rank() sets 'relevance' (0-100, relative to the best job in the batch)
+    and 'rank_score' on every job and returns them best first. With a
+    weight of 0 the order is the plain match percentage order.
+    """
+
+    def __init__(self, profile: Optional[str] = None, weight: float = RANK_RELEVANCE_WEIGHT,
+                 title_weight: float = RANK_TITLE_WEIGHT, k1: float = BM25_K1, b: float = BM25_B):
+        self.weight = weight
+        self.title_weight = title_weight
+        self.k1 = k1
+        self.b = b
+        words = _words(profile if profile is not None else profile_text())
+        # Profile terms, and how often the profile repeats each (its query weight)
+        self.term_keys, self.query_counts = np.unique(words.keys(), return_counts=True)
+        self.term_tags = np.zeros(1 << 16, dtype=bool)
+        self.term_tags[words.tags()] = True
+
+    def _find_terms(self, words: _Words) -> Tuple[np.ndarray, np.ndarray]:
+        """(word index, term index) of every word that is a profile term"""
+        # Most words are ruled out by their tag; only the rest get a full key
+        candidates = np.flatnonzero(self.term_tags[words.tags()])
+        keys = words.keys(candidates)
+        positions = np.minimum(np.searchsorted(self.term_keys, keys), len(self.term_keys) - 1)
+        found = self.term_keys[positions] == keys
+        return candidates[found], positions[found]
+
+    def term_counts(self, texts: List[str]) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """Profile-term counts per text (texts x terms) and each text's length in words"""
+        encoded_lengths = np.fromiter(map(len, map(str.encode, texts)), dtype=np.int64, count=len(texts))
+        # A newline between texts keeps words from running into the next one
+        offsets = np.concatenate(([0], np.cumsum(encoded_lengths + 1)[:-1]))
+        words = _words("\n".join(texts))
+        lengths = np.diff(np.searchsorted(words.starts, np.append(offsets, offsets[-1] + encoded_lengths[-1])))
+
+        hits, term_ids = self._find_terms(words)
+        doc_ids = np.searchsorted(offsets, words.starts[hits], side="right") - 1
+        counts = sparse.csr_matrix(
+            (np.ones(len(hits)), (doc_ids, term_ids)),
+            shape=(len(texts), len(self.term_keys)),
+        )
+        counts.sum_duplicates()
+        return counts, lengths
+
+    def scores(self, jobs: List[Dict]) -> np.ndarray:
+        """BM25 score of every job against the profile, titles counting `title_weight` times"""
+        if not jobs:
+            return np.zeros(0)
+        titles, title_lengths = self.term_counts([job.get('title') or '' for job in jobs])
+        descriptions, description_lengths = self.term_counts([job.get('description') or '' for job in jobs])
+        tf = (descriptions + titles * self.title_weight).tocsr()
+        lengths = description_lengths + title_lengths * self.title_weight
+
+        documents = len(jobs)
+        document_frequency = np.bincount(tf.indices, minlength=tf.shape[1])
+        idf = np.log1p((documents - document_frequency + 0.5) / (document_frequency + 0.5))
+        average_length = lengths.mean() or 1.0
+        norms = self.k1 * (1 - self.b + self.b * lengths / average_length)
+        # BM25 term saturation, applied to the stored counts only
+        row_norms = np.repeat(norms, np.diff(tf.indptr))
+        tf.data = tf.data * (self.k1 + 1) / (tf.data + row_norms)
+        return tf @ (idf * self.query_counts)
+
+    def rank(self, jobs: List[Dict]) -> List[Dict]:
+        """Score, blend with match_percentage and sort the jobs best first"""
+        if not jobs:
+            return jobs
+        scores = self.scores(jobs)
+        best = scores.max()
+        relevance = scores / best if best > 0 else scores
+        matches = np.array([job['match_percentage'] for job in jobs], dtype=float) / 100
+        blended = (1 - self.weight) * matches + self.weight * relevance
+        for job, job_relevance, rank_score in zip(jobs, np.round(relevance * 100, 2).tolist(),
+                                                  np.round(blended * 100, 2).tolist()):
+            job['relevance'] = job_relevance
+            job['rank_score'] = rank_score
+        order = np.lexsort((-matches, -blended))
+        return [jobs[i] for i in order.tolist()]
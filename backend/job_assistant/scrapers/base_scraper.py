@@ -1,90 +1,468 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import Any, AsyncIterator, Callable, List, Dict, Optional, Tuple
+from contextlib import nullcontext
 import aiohttp
 import asyncio
+import json
 import logging
-from config import HEADERS, REQUEST_TIMEOUT, JOBS_PER_PORTAL
+import time
+from urllib.parse import urlsplit
+from config import (HEADERS, REQUEST_TIMEOUT, JOBS_PER_PORTAL, STREAM_JSON_FEEDS, JSON_STREAM_CHUNK_SIZE,
+                    SCRAPER_BASE_URL, MAX_RESPONSE_BYTES, MAX_FEED_BYTES, PORTAL_BYTE_BUDGET)
+from database.high_water_marks import HighWaterMarks
+from network.body_reader import ACCEPT_ENCODING, ContentDecoder, StopPredicate, read_body
+from network.host_limiter import HostLimiter
+from network.cassette import Cassette
+from network.http_cache import HttpCache
+from network.json_stream import JsonArrayStream
+from network.rate_limiter import RateLimiter, parse_retry_after
+from network.retry import RetryPolicy, RetryableResponse
+from scrapers.google_serp import SerpService
+from network.session import session_scope
 
 logger = logging.getLogger(__name__)
 
 
+class CachedBodyMissing(Exception):
+    """The server answered 304 Not Modified for a cache entry whose body is gone"""
+
+
 class BaseScraper(ABC):
     def __init__(self, name: str, portal_url: str):
         self.name = name
         self.portal_url = portal_url
         self.headers = HEADERS.copy()
+        # Bodies are decompressed by read_body, which may not support brotli here
+        self.headers['Accept-Encoding'] = ACCEPT_ENCODING
         self.timeout = REQUEST_TIMEOUT
         self.max_jobs = JOBS_PER_PORTAL
+        # Shared across scrapers by JobSearchAssistant so hosts are not flooded
+        self.host_limiter: Optional[HostLimiter] = None
+        # Pooled session injected by JobSearchAssistant; a throwaway session
+        # is opened per request when the scraper is used on its own
+        self.session: Optional[aiohttp.ClientSession] = None
+        # On-disk response cache shared by all scrapers (None disables caching)
+        self.http_cache: Optional[HttpCache] = None
+        # Per-host token buckets shared by all scrapers (None disables pacing)
+        self.rate_limiter: Optional[RateLimiter] = None
+        self.retry_policy = RetryPolicy()
+        # Google search results shared by all site:-query scrapers
+        self.serp: Optional[SerpService] = None
+        # Shared CPU pool for parsing detail pages; parsing runs inline when None
+        self.cpu_executor = None
+        # Server that receives every request instead of the real hosts (load testing)
+        self.base_url: Optional[str] = SCRAPER_BASE_URL or None
+        # Record/replay store for offline runs (None talks to the network as usual)
+        self.cassette: Optional[Cassette] = None
+        # How far feeds were read on earlier runs (None reads them from the top every time)
+        self.high_water_marks: Optional[HighWaterMarks] = None
+        # Bytes this portal may download per run; requests past it are skipped
+        self.byte_budget: Optional[int] = PORTAL_BYTE_BUDGET
+        # Per-run request accounting, reported in the scrape log: bytes off the
+        # wire vs decoded bytes handed to parsing, and bodies not read to the end
+        self.stats = {'retries': 0, 'backoff_seconds': 0.0, 'wire_bytes': 0, 'body_bytes': 0,
+                      'truncated': 0, 'stopped_early': 0, 'over_budget': 0, 'known_items': 0}
     
     @abstractmethod
     async def scrape(self) -> List[Dict]:
         """Scrape jobs from the portal"""
         pass
     
-    async def fetch(self, url: str, method: str = 'GET', **kwargs) -> str:
-        """Fetch content from URL"""
-        try:
-            # Add some randomness to delay to avoid pattern detection
-            import random
-            await asyncio.sleep(random.uniform(1.0, 3.0))
-
-            headers = self.headers.copy()
+    async def iter_jobs(self) -> AsyncIterator[Dict]:
+        """Yield jobs as soon as they are scraped.
+        
+        The default adapter waits for scrape(); scrapers that can produce
+        jobs incrementally override this and build scrape() on top of it.
+        """
+        for job in await self.scrape():
+            yield job
+    
+    def seen_before(self, item_id: str, posted_at: Optional[float] = None) -> bool:
+        """Whether a feed item is below this portal's high-water mark.
+        
+        New items are staged, so they count as seen from the next run on
+        once the scrape finishes.
+        """
+        if self.high_water_marks is None:
+            return False
+        if self.high_water_marks.is_known(self.name, item_id, posted_at):
+            self.stats['known_items'] += 1
+            return True
+        self.high_water_marks.stage(self.name, item_id, posted_at)
+        return False
+    
+    def _wire_url(self, url: str) -> str:
+        """The URL actually requested: rerouted to base_url when one is set.
+        
+        Limiters, caches and cassettes keep using the original URL, so
+        per-host behaviour is unchanged behind the override.
+        """
+        if not self.base_url:
+            return url
+        parts = urlsplit(url)
+        wire_url = f"{self.base_url.rstrip('/')}/{parts.netloc}{parts.path or '/'}"
+        return f"{wire_url}?{parts.query}" if parts.query else wire_url
+    
+    def _host_slot(self, url: str):
+        """Reserve a request slot for the URL's host (no-op when not limited)"""
+        if self.host_limiter is None:
+            return nullcontext()
+        return self.host_limiter.slot(url)
+    
+    async def fetch(self, url: str, method: str = 'GET', stop: Optional[Callable[[], StopPredicate]] = None,
+                    max_bytes: int = MAX_RESPONSE_BYTES, **kwargs) -> str:
+        """Fetch content from URL.
+        
+        At most `max_bytes` of the decoded body are read. `stop` builds a
+        predicate that sees the text as it arrives and ends the download
+        once it returns True, e.g. when everything the caller parses has
+        been read.
+        """
+        headers = self.headers.copy()
+        if method == 'GET':
             # Rotate user agents if possible, but here just use a very modern one
             headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
             headers['Referer'] = 'https://www.google.com/'
-            
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                if method == 'GET':
-                    async with session.get(url, headers=headers, **kwargs) as response:
-                        if response.status == 200:
-                            return await response.text()
-                        elif response.status == 429:
-                            logger.error(f"{self.name}: Rate limited (429) by {url}")
-                            return ""
-                        else:
-                            logger.warning(f"{self.name}: HTTP {response.status} for {url}")
-                            return ""
-                elif method == 'POST':
-                    async with session.post(url, headers=self.headers, **kwargs) as response:
-                        if response.status == 200:
-                            return await response.text()
-                        else:
-                            logger.warning(f"{self.name}: HTTP {response.status} for {url}")
-                            return ""
-        except asyncio.TimeoutError:
-            logger.warning(f"{self.name}: Timeout fetching {url}")
-            return ""
-        except Exception as e:
-            logger.error(f"{self.name}: Error fetching {url}: {str(e)}")
-            return ""
+        
+        return await self._request_text(url, method, headers, stop=stop, max_bytes=max_bytes, **kwargs)
     
     async def fetch_json(self, url: str, method: str = 'GET', **kwargs) -> Dict:
         """Fetch JSON content from URL"""
+        text = await self._request_text(url, method, self.headers.copy(), max_bytes=MAX_FEED_BYTES, **kwargs)
+        
+        if not text:
+            return {}
         try:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                if method == 'GET':
-                    async with session.get(url, headers=self.headers, **kwargs) as response:
-                        if response.status == 200:
-                            return await response.json()
-                        else:
-                            logger.warning(f"{self.name}: HTTP {response.status} for {url}")
-                            return {}
-                elif method == 'POST':
-                    async with session.post(url, headers=self.headers, **kwargs) as response:
-                        if response.status == 200:
-                            return await response.json()
-                        else:
-                            logger.warning(f"{self.name}: HTTP {response.status} for {url}")
-                            return {}
-        except asyncio.TimeoutError:
-            logger.warning(f"{self.name}: Timeout fetching {url}")
+            return json.loads(text)
+        except ValueError as e:
+            logger.error(f"{self.name}: Invalid JSON from {url}: {str(e)}")
+            return {}
+    
+    async def search_google(self, query: str, num: int = 10) -> List[Dict]:
+        """Search Google through the shared SERP service.
+        
+        Returns parsed results as dicts with 'href' and 'title' keys.
+        """
+        if self.serp is None:
+            self.serp = SerpService()
+        return await self.serp.search(query, num, self.fetch)
+    
+    async def iter_json_array(self, url: str, key: Optional[str] = None) -> AsyncIterator[Any]:
+        """Yield the items of a JSON array feed as they come off the socket.
+        
+        `key` names the array inside a top-level object ({"jobs": [...]});
+        without it the body itself is the array. Closing the iterator early
+        (wrap it in contextlib.aclosing and break) cancels the rest of the
+        transfer. Only bodies read to the end are stored in the HTTP cache.
+        """
+        if not STREAM_JSON_FEEDS or self.cassette is not None:
+            # Cassettes record and replay whole bodies
+            for item in self._json_array(await self.fetch_json(url), key):
+                yield item
+            return
+        
+        headers = self.headers.copy()
+        body, entry = self._cached_body(url, 'GET', headers)
+        if body is not None:
+            for item in self._json_array(self._loads(url, body), key):
+                yield item
+            return
+        if self._over_budget(url):
+            return
+        
+        deadline_at = time.monotonic() + self.retry_policy.deadline
+        attempt = 0
+        while True:
+            attempt += 1
+            yielded = 0
+            try:
+                async with self._host_slot(url):
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire(url)
+                    async with session_scope(self.session, self.timeout) as session:
+                        async with session.get(self._wire_url(url), headers=headers, auto_decompress=False,
+                                               timeout=self._attempt_timeout(deadline_at)) as response:
+                            retry_after = self._observe_response(url, response)
+                            if response.status == 304 and entry is not None:
+                                for item in self._json_array(self._loads(url, self._revalidated_body(url, response, headers)), key):
+                                    yield item
+                                return
+                            elif response.status in RetryPolicy.RETRYABLE_STATUSES:
+                                raise RetryableResponse(response.status, retry_after)
+                            elif response.status != 200:
+                                logger.warning(f"{self.name}: HTTP {response.status} for {url}")
+                                return
+                            
+                            stream = JsonArrayStream(key)
+                            decoder = ContentDecoder(response.headers.get('Content-Encoding', ''))
+                            chunks = [] if self.http_cache is not None else None
+                            body_bytes = 0
+                            try:
+                                async for chunk in response.content.iter_chunked(JSON_STREAM_CHUNK_SIZE):
+                                    self.stats['wire_bytes'] += len(chunk)
+                                    data = decoder.decompress(chunk, MAX_FEED_BYTES - body_bytes + 1)
+                                    body_bytes += len(data)
+                                    self.stats['body_bytes'] += len(data)
+                                    if body_bytes > MAX_FEED_BYTES:
+                                        self.stats['truncated'] += 1
+                                        logger.warning(f"{self.name}: Feed {url} is over {MAX_FEED_BYTES // 1024} KiB, "
+                                                       f"keeping the first {yielded} items")
+                                        return
+                                    if chunks is not None:
+                                        chunks.append(data)
+                                    for item in stream.feed(data):
+                                        yielded += 1
+                                        yield item
+                                for item in stream.feed(decoder.flush()) + stream.close():
+                                    yielded += 1
+                                    yield item
+                            except GeneratorExit:
+                                # The consumer had enough; the rest of the feed is never downloaded
+                                self.stats['stopped_early'] += 1
+                                raise
+                            if chunks is not None:
+                                self.http_cache.store(url, b"".join(chunks).decode('utf-8', errors='replace'),
+                                                      response.headers)
+                            return
+            except CachedBodyMissing:
+                entry = None
+                continue
+            except RetryableResponse as e:
+                failure, retry_after = e, e.retry_after
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+                if yielded:
+                    # Items already handed out cannot be taken back, so keep what we have
+                    logger.warning(f"{self.name}: Feed {url} cut off after {yielded} items: "
+                                   f"{self._describe_failure(e)}")
+                    return
+                failure, retry_after = e, None
+            except ValueError as e:
+                logger.error(f"{self.name}: Invalid JSON from {url}: {str(e)}")
+                return
+            except Exception as e:
+                logger.error(f"{self.name}: Error fetching {url}: {str(e)}")
+                return
+            
+            delay = self._retry_delay(url, 'GET', attempt, failure, retry_after, deadline_at)
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _json_array(data: Any, key: Optional[str]) -> List:
+        """The array a streamed feed would have produced from a parsed body"""
+        if key is not None:
+            data = data.get(key) if isinstance(data, dict) else None
+        return data if isinstance(data, list) else []
+    
+    def _loads(self, url: str, body: str) -> Any:
+        if not body:
             return {}
-        except Exception as e:
-            logger.error(f"{self.name}: Error fetching {url}: {str(e)}")
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            logger.error(f"{self.name}: Invalid JSON from {url}: {str(e)}")
             return {}
     
+    def _cached_body(self, url: str, method: str, headers: Dict) -> Tuple[Optional[str], Optional[Dict]]:
+        """Look a GET up in the HTTP cache.
+        
+        Returns the body of a fresh entry, or the stale entry to revalidate
+        (its conditional headers are added to `headers`).
+        """
+        cache = self.http_cache if method == 'GET' else None
+        entry = cache.get(url) if cache else None
+        if entry is None:
+            return None, None
+        if cache.is_fresh(entry):
+            body = cache.read_body(url)
+            if body is not None:
+                cache.record_hit(url)
+                return body, None
+            return None, None
+        headers.update(cache.conditional_headers(entry))
+        return None, entry
+    
+    async def _request_text(self, url: str, method: str, headers: Dict,
+                            stop: Optional[Callable[[], StopPredicate]] = None,
+                            max_bytes: int = MAX_RESPONSE_BYTES, **kwargs) -> str:
+        """Perform the request and return the body text ("" on failure).
+        
+        With a cassette injected, bodies are served from or recorded to it.
+        """
+        if self.cassette is None:
+            return await self._request_network(url, method, headers, stop, max_bytes, **kwargs)
+        if self.cassette.replaying:
+            return await self.cassette.play(method, url, kwargs)
+        started = time.monotonic()
+        text = await self._request_network(url, method, headers, stop, max_bytes, **kwargs)
+        self.cassette.record(method, url, kwargs, text, time.monotonic() - started)
+        return text
+    
+    async def _request_network(self, url: str, method: str, headers: Dict,
+                               stop: Optional[Callable[[], StopPredicate]] = None,
+                               max_bytes: int = MAX_RESPONSE_BYTES, **kwargs) -> str:
+        """Request the URL over HTTP, retrying transient failures.
+        
+        GET requests go through the HTTP cache when one is injected: fresh
+        entries are served directly, stale ones are revalidated.
+        """
+        body, entry = self._cached_body(url, method, headers)
+        if body is not None:
+            return body
+        if self._over_budget(url):
+            return ""
+        
+        deadline_at = time.monotonic() + self.retry_policy.deadline
+        attempt = 0
+        while True:
+            attempt += 1
+            request_kwargs = dict(kwargs)
+            request_kwargs.setdefault('timeout', self._attempt_timeout(deadline_at))
+            try:
+                async with self._host_slot(url):
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire(url)
+                    return await self._send(url, method, headers, entry, stop, max_bytes, **request_kwargs)
+            except CachedBodyMissing:
+                entry = None
+                continue
+            except RetryableResponse as e:
+                failure, retry_after = e, e.retry_after
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+                failure, retry_after = e, None
+            except Exception as e:
+                logger.error(f"{self.name}: Error fetching {url}: {str(e)}")
+                return ""
+            
+            delay = self._retry_delay(url, method, attempt, failure, retry_after, deadline_at)
+            if delay is None:
+                return ""
+            await asyncio.sleep(delay)
+    
+    def _attempt_timeout(self, deadline_at: float) -> aiohttp.ClientTimeout:
+        """Timeout for one attempt, never running past the overall deadline"""
+        remaining = deadline_at - time.monotonic()
+        return aiohttp.ClientTimeout(total=max(1.0, min(self.timeout, remaining)))
+    
+    def _retry_delay(self, url: str, method: str, attempt: int, failure: Exception,
+                     retry_after: Optional[float], deadline_at: float) -> Optional[float]:
+        """Seconds to back off before the next attempt, or None to give up"""
+        delay = self.retry_policy.backoff(attempt, retry_after)
+        if not self.retry_policy.can_retry(method, attempt) or time.monotonic() + delay >= deadline_at:
+            self._log_failure(url, failure)
+            return None
+        logger.info(f"{self.name}: {self._describe_failure(failure)} for {url}, "
+                    f"retrying in {delay:.1f}s (attempt {attempt}/{self.retry_policy.max_attempts})")
+        self.stats['retries'] += 1
+        self.stats['backoff_seconds'] += delay
+        return delay
+    
+    @staticmethod
+    def _describe_failure(failure: Exception) -> str:
+        """Short human-readable reason for a failed attempt"""
+        if isinstance(failure, asyncio.TimeoutError):
+            return "Timeout"
+        return str(failure) or failure.__class__.__name__
+    
+    def _log_failure(self, url: str, failure: Exception):
+        """Log a request that failed for good"""
+        if isinstance(failure, asyncio.TimeoutError):
+            logger.warning(f"{self.name}: Timeout fetching {url}")
+        elif isinstance(failure, RetryableResponse) and failure.status == 429:
+            logger.error(f"{self.name}: Rate limited (429) by {url}")
+        elif isinstance(failure, RetryableResponse):
+            logger.warning(f"{self.name}: HTTP {failure.status} for {url}")
+        else:
+            logger.error(f"{self.name}: Error fetching {url}: {self._describe_failure(failure)}")
+    
+    def _observe_response(self, url: str, response: aiohttp.ClientResponse) -> Optional[float]:
+        """Feed the response status to the rate limiter; returns Retry-After seconds"""
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if self.rate_limiter is not None:
+            if response.status in (429, 503):
+                self.rate_limiter.penalize(url, retry_after)
+            elif response.status < 400:
+                self.rate_limiter.reward(url)
+        return retry_after
+    
+    def _revalidated_body(self, url: str, response: aiohttp.ClientResponse, headers: Dict) -> str:
+        """Serve the cached body after a 304 Not Modified.
+        
+        When the body is gone (read_body drops the entry), the conditional
+        headers are removed from the request's `headers` and
+        CachedBodyMissing is raised, so the request is sent again for the
+        whole body.
+        """
+        body = self.http_cache.read_body(url)
+        if body is None:
+            logger.warning(f"{self.name}: Cached body missing for {url}, requesting it again")
+            for name in ('If-None-Match', 'If-Modified-Since'):
+                headers.pop(name, None)
+            raise CachedBodyMissing(url)
+        self.http_cache.record_revalidated(url, response.headers)
+        return body
+    
+    def _over_budget(self, url: str) -> bool:
+        """True once this portal has downloaded its byte budget for the run"""
+        if self.byte_budget is None or self.stats['wire_bytes'] < self.byte_budget:
+            return False
+        if not self.stats['over_budget']:
+            logger.warning(f"{self.name}: Downloaded {self.stats['wire_bytes'] // 1024} KiB, over the "
+                           f"{self.byte_budget // 1024} KiB budget; skipping further requests")
+        self.stats['over_budget'] += 1
+        logger.debug(f"{self.name}: Skipped {url}, byte budget spent")
+        return True
+    
+    def transfer_summary(self) -> str:
+        """Bytes downloaded vs decoded bytes used, for the scrape log"""
+        summary = (f"{self.stats['wire_bytes'] / 1024:.0f} KiB downloaded, "
+                   f"{self.stats['body_bytes'] / 1024:.0f} KiB used")
+        if self.stats['stopped_early']:
+            summary += f", {self.stats['stopped_early']} bodies stopped early"
+        if self.stats['truncated']:
+            summary += f", {self.stats['truncated']} cut at the size limit"
+        if self.stats['over_budget']:
+            summary += f", {self.stats['over_budget']} requests over budget"
+        return summary
+    
+    async def _send(self, url: str, method: str, headers: Dict, entry: Optional[Dict],
+                    stop: Optional[Callable[[], StopPredicate]] = None,
+                    max_bytes: int = MAX_RESPONSE_BYTES, **kwargs) -> str:
+        """Send one request and turn the response into body text.
+        
+        The body is streamed, decompressed as it arrives and read only up to
+        `max_bytes` or until the stop predicate is satisfied. Raises
+        RetryableResponse for statuses worth retrying; network errors and
+        timeouts propagate to the retry loop in _request_network.
+        """
+        cache = self.http_cache
+        async with session_scope(self.session, self.timeout) as session:
+            async with session.request(method, self._wire_url(url), headers=headers,
+                                       auto_decompress=False, **kwargs) as response:
+                retry_after = self._observe_response(url, response)
+                
+                if response.status == 304 and entry is not None:
+                    return self._revalidated_body(url, response, headers)
+                elif response.status == 200:
+                    body = await read_body(response, max_bytes, stop() if stop is not None else None)
+                    self.stats['wire_bytes'] += body.wire_bytes
+                    self.stats['body_bytes'] += body.body_bytes
+                    if body.truncated:
+                        self.stats['truncated'] += 1
+                        logger.warning(f"{self.name}: {url} is over {max_bytes // 1024} KiB, keeping the start")
+                    elif body.stopped:
+                        self.stats['stopped_early'] += 1
+                    # Partial bodies are not cached, so a later caller without the same stop gets the whole page
+                    if cache is not None and method == 'GET' and body.complete:
+                        cache.store(url, body.text, response.headers)
+                    return body.text
+                elif response.status in RetryPolicy.RETRYABLE_STATUSES:
+                    raise RetryableResponse(response.status, retry_after)
+                else:
+                    logger.warning(f"{self.name}: HTTP {response.status} for {url}")
+                    return ""
+    
     def create_job_dict(self, job_id: str, company: str, title: str, 
                        description: str, location: str, link: str) -> Dict:
         """Create standardized job dictionary"""
@@ -96,8 +474,7 @@ class BaseScraper(ABC):
             "location": location,
             "link": link,
             "portal": self.name,
-            "required_skills": [],
-            "matched_skills": [],
-            "missing_skills": [],
+            "skill_mask": 0,
+            "matched_mask": 0,
             "match_percentage": 0
         }
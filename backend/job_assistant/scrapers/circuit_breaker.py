@@ -0,0 +1,154 @@
+import json
+import logging
+import math
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from config import (PORTAL_HEALTH_FILE, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN,
+                    CIRCUIT_MAX_COOLDOWN, CIRCUIT_LATENCY_WINDOW)
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no samples)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class CircuitBreaker:
+    """Per-portal circuit breaker with health statistics persisted across runs.
+
+    A run that ends without jobs (error, timeout or an empty result such as
+    a consent page) counts as a failure. After CIRCUIT_FAILURE_THRESHOLD
+    consecutive failures the portal's circuit opens and it is skipped until
+    its cooldown expires; the next run then probes it once (half-open). A
+    successful probe closes the circuit, a failed one reopens it with the
+    cooldown doubled, up to CIRCUIT_MAX_COOLDOWN.
+    """
+
+    def __init__(self, health_file: str = PORTAL_HEALTH_FILE,
+                 failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 cooldown: float = CIRCUIT_COOLDOWN, max_cooldown: float = CIRCUIT_MAX_COOLDOWN,
+                 latency_window: int = CIRCUIT_LATENCY_WINDOW):
+        self.health_file = health_file
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.latency_window = latency_window
+        self.portals: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.health_file, 'r') as f:
+                return json.load(f).get('portals', {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable portal health file: {str(e)}")
+            return {}
+
+    def save(self):
+        """Persist portal health, with derived statistics for the API"""
+        os.makedirs(os.path.dirname(self.health_file), exist_ok=True)
+        with open(self.health_file, 'w') as f:
+            json.dump({'updated': datetime.now().isoformat(), 'portals': self.snapshot()}, f, indent=2)
+
+    def _record(self, portal: str) -> Dict:
+        record = self.portals.get(portal)
+        if record is None:
+            record = {
+                'state': CLOSED,
+                'runs': 0,
+                'successes': 0,
+                'consecutive_failures': 0,
+                'skipped': 0,
+                'jobs_found': 0,
+                'seconds_without_jobs': 0.0,
+                'latencies': [],
+                'opened_at': None,
+                'cooldown': self.cooldown,
+                'last_run': None,
+                'last_error': None
+            }
+            self.portals[portal] = record
+        return record
+
+    def allow(self, portal: str) -> bool:
+        """Whether the portal should be scraped this run"""
+        record = self._record(portal)
+        if record['state'] == CLOSED:
+            return True
+        if record['state'] == OPEN and time.time() < record['opened_at'] + record['cooldown']:
+            record['skipped'] += 1
+            return False
+        # Cooldown over (or a probe left unfinished last run): let one run through
+        record['state'] = HALF_OPEN
+        return True
+
+    def retry_at(self, portal: str) -> Optional[datetime]:
+        """When an open circuit will next let the portal be probed"""
+        record = self._record(portal)
+        if record['state'] != OPEN:
+            return None
+        return datetime.fromtimestamp(record['opened_at'] + record['cooldown'])
+
+    def record(self, portal: str, jobs: int, elapsed: float, error: Optional[str] = None,
+               up_to_date: bool = False):
+        """Record the outcome of one portal run.
+
+        `up_to_date` marks an incremental run that found no jobs because
+        everything in the feed was seen on earlier runs; it counts as healthy.
+        """
+        record = self._record(portal)
+        record['runs'] += 1
+        record['last_run'] = datetime.now().isoformat()
+        record['latencies'] = (record['latencies'] + [round(elapsed, 3)])[-self.latency_window:]
+        record['jobs_found'] += jobs
+
+        if (jobs or up_to_date) and error is None:
+            record['successes'] += 1
+            record['consecutive_failures'] = 0
+            record['last_error'] = None
+            if record['state'] != CLOSED:
+                logger.info(f"{portal}: circuit closed, portal is yielding jobs again")
+            record['state'] = CLOSED
+            record['cooldown'] = self.cooldown
+            return
+
+        record['consecutive_failures'] += 1
+        record['seconds_without_jobs'] += elapsed
+        record['last_error'] = error or "no jobs"
+        if record['state'] == HALF_OPEN:
+            record['cooldown'] = min(self.max_cooldown, record['cooldown'] * 2)
+            self._open(portal, record)
+        elif record['consecutive_failures'] >= self.failure_threshold:
+            record['cooldown'] = self.cooldown
+            self._open(portal, record)
+
+    def _open(self, portal: str, record: Dict):
+        record['state'] = OPEN
+        record['opened_at'] = time.time()
+        logger.warning(f"{portal}: circuit open after {record['consecutive_failures']} runs without jobs, "
+                       f"skipping for {record['cooldown'] / 3600:.0f}h")
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Portal records with success rate and latency percentiles filled in"""
+        snapshot = {}
+        for portal, record in self.portals.items():
+            latencies = record['latencies']
+            snapshot[portal] = dict(
+                record,
+                success_rate=round(record['successes'] / record['runs'], 3) if record['runs'] else None,
+                latency_p50=percentile(latencies, 50),
+                latency_p95=percentile(latencies, 95)
+            )
+        return snapshot
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import re
+import time
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from config import SERP_CACHE_TTL, SERP_MERGE_QUERIES, SERP_MERGE_WINDOW, HTML_PARSER_BACKEND
+from network.body_reader import stop_at_marker
+from scrapers.html_parser import extract_links
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_SEARCH_URL = "https://www.google.com/search"
+SITE_QUERY_PATTERN = re.compile(r'^site:(\S+)\s+(.+)$')
+
+Fetcher = Callable[..., Awaitable[str]]
+
+# Organic results end where Google's related searches and pagination begin;
+# the scripts after that are never downloaded
+SERP_RESULTS_END = partial(stop_at_marker, 'id="botstuff"', 'id="foot"')
+
+
+class SerpService:
+    """Shared access to Google search results for the site:-query scrapers.
+
+    Identical queries in flight at the same time are fetched once
+    (single-flight), parsed result sets are cached for a TTL, and with
+    merging enabled `site:` queries that share the same search terms are
+    combined into one OR query whose results are split back out per site.
+    """
+
+    def __init__(self, ttl: int = SERP_CACHE_TTL, merge_queries: bool = SERP_MERGE_QUERIES,
+                 merge_window: float = SERP_MERGE_WINDOW, parser_backend: str = HTML_PARSER_BACKEND):
+        self.ttl = ttl
+        self.merge_queries = merge_queries
+        self.merge_window = merge_window
+        self.parser_backend = parser_backend
+        # Parsing runs here when JobSearchAssistant provides a CPU executor
+        self.cpu_executor = None
+        self.stats = {"queries": 0, "google_requests": 0, "cache_hits": 0, "coalesced": 0, "merged": 0}
+        self._cache: Dict[Tuple[str, int], Tuple[float, List[Dict]]] = {}
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
+        self._pending: Dict[str, List[Tuple[str, int, asyncio.Future]]] = {}
+
+    @staticmethod
+    def build_url(query: str, num: int) -> str:
+        return f"{GOOGLE_SEARCH_URL}?q={query.replace(' ', '+')}&num={num}"
+
+    async def parse_results(self, html: str) -> List[Dict]:
+        """Extract result links and their headings from a SERP page"""
+        if self.cpu_executor is not None:
+            return await self.cpu_executor.run(extract_links, html, self.parser_backend)
+        return extract_links(html, self.parser_backend)
+
+    async def search(self, query: str, num: int, fetch: Fetcher) -> List[Dict]:
+        """Get parsed results for a query, fetching Google at most once"""
+        self.stats["queries"] += 1
+        key = (query, num)
+
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            self.stats["cache_hits"] += 1
+            return list(cached[1])
+
+        while (inflight := self._inflight.get(key)) is not None:
+            self.stats["coalesced"] += 1
+            try:
+                return list(await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                # Only the leader was cancelled (its portal timed out or stopped early): take over
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            match = SITE_QUERY_PATTERN.match(query)
+            if self.merge_queries and match:
+                results = await self._search_merged(match.group(1), match.group(2), num, fetch)
+            else:
+                results = await self._fetch_results(query, num, fetch)
+            if results is not None:
+                self._cache[key] = (time.monotonic(), results)
+            future.set_result(results or [])
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case no follower awaits it
+            future.exception()
+            raise
+        finally:
+            # Cancelled, the followers are woken to fetch the query themselves
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+        return list(results or [])
+
+    async def _fetch_results(self, query: str, num: int, fetch: Fetcher) -> Optional[List[Dict]]:
+        """Fetch and parse one SERP page; None when Google gave us nothing usable"""
+        self.stats["google_requests"] += 1
+        html = await fetch(self.build_url(query, num), stop=SERP_RESULTS_END)
+        if not html:
+            logger.debug(f"Empty HTML response from Google for: {query}")
+            return None
+        if "consent.google.com" in html:
+            logger.warning(f"Blocked by Google Consent page for: {query}")
+            return None
+        return await self.parse_results(html)
+
+    async def _search_merged(self, site: str, terms: str, num: int,
+                             fetch: Fetcher) -> Optional[List[Dict]]:
+        """Batch site: queries sharing the same terms into one OR query.
+
+        The first caller for a set of terms waits `merge_window` seconds for
+        others to join, runs the combined query and hands every caller the
+        results that belong to its site. When that caller is cancelled, the
+        others start over with a group of their own.
+        """
+        while (group := self._pending.get(terms)) is not None:
+            future = asyncio.get_running_loop().create_future()
+            group.append((site, num, future))
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        group = [(site, num, future)]
+        self._pending[terms] = group
+        try:
+            await asyncio.sleep(self.merge_window)
+            del self._pending[terms]
+
+            sites = list(dict.fromkeys(member_site for member_site, _, _ in group))
+            if len(sites) == 1:
+                query = f"site:{sites[0]} {terms}"
+            else:
+                query = "(" + " OR ".join(f"site:{s}" for s in sites) + f") {terms}"
+                self.stats["merged"] += len(sites) - 1
+            total = min(100, sum(member_num for _, member_num, _ in group))
+            results = await self._fetch_results(query, total, fetch)
+
+            for member_site, member_num, member_future in group:
+                if results is None or len(sites) == 1:
+                    member_future.set_result(results)
+                else:
+                    member_future.set_result([r for r in results if member_site in r["href"]][:member_num])
+            return future.result()
+        except Exception as e:
+            for _, _, member_future in group:
+                if not member_future.done():
+                    member_future.set_exception(e)
+                    member_future.exception()
+            raise
+        finally:
+            if self._pending.get(terms) is group:
+                del self._pending[terms]
+            for _, _, member_future in group:
+                if not member_future.done():
+                    member_future.cancel()
+
+    def summary(self) -> str:
+        """One-line report of how many Google requests the queries cost"""
+        return (f"{self.stats['google_requests']} Google requests for {self.stats['queries']} queries "
+                f"({self.stats['cache_hits']} cached, {self.stats['coalesced']} coalesced, "
+                f"{self.stats['merged']} merged)")
@@ -0,0 +1,149 @@
+"""Link extraction backends for SERP and listing pages.
+
+Every backend returns the same list of {'href', 'title', 'heading'} dicts,
+in document order: one per <a href> element, with the text of its first
+<h3> and of its first <div role="heading"> (None when the anchor has no
+such element). Which of the two a portal reads is up to the portal, see
+link_title(). Only anchors and their headings are of interest, so the
+BeautifulSoup backends parse through a SoupStrainer and the "stream"
+backend never builds a tree at all.
+"""
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+import logging
+from config import HTML_PARSER_BACKEND
+
+logger = logging.getLogger(__name__)
+
+PARSER_BACKENDS = ("lxml", "html.parser", "stream")
+# Elements that never get an end tag, so they must not deepen a capture
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+                 "link", "meta", "param", "source", "track", "wbr"}
+
+
+def lxml_available() -> bool:
+    try:
+        import lxml  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def resolve_backend(backend: str = HTML_PARSER_BACKEND) -> str:
+    """Map "auto" (and an unavailable lxml) to a backend that can run here"""
+    if backend == "auto":
+        return "lxml" if lxml_available() else "stream"
+    if backend == "lxml" and not lxml_available():
+        logger.warning("lxml is not installed, falling back to the stream parser")
+        return "stream"
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {backend}")
+    return backend
+
+
+def link_title(result: Dict, default: str, heading_fallback: bool = False) -> str:
+    """A result's title: its <h3>, else (if enabled) its <div role="heading">, else `default`"""
+    if result['title'] is not None:
+        return result['title']
+    if heading_fallback and result['heading'] is not None:
+        return result['heading']
+    return default
+
+
+def _element_text(link, *args) -> Optional[str]:
+    element = link.find(*args)
+    return element.get_text() if element is not None else None
+
+
+def _extract_with_soup(html: str, features: str) -> List[Dict]:
+    from bs4 import BeautifulSoup, SoupStrainer
+    soup = BeautifulSoup(html, features, parse_only=SoupStrainer('a'))
+    return [{"href": link['href'],
+             "title": _element_text(link, 'h3'),
+             "heading": _element_text(link, 'div', {'role': 'heading'})}
+            for link in soup.find_all('a', href=True)]
+
+
+class _LinkExtractor(HTMLParser):
+    """Single-pass anchor/heading extractor on top of the stdlib tokenizer"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links: List[Dict] = []
+        # Open anchors (innermost last) with their heading captures; "depth"
+        # maps each capture still open to how far below its element we are
+        self._open: List[Dict] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            attributes = dict(attrs)
+            result = {"href": attributes.get('href'), "title": None, "heading": None}
+            if result["href"] is not None:
+                self.links.append(result)
+            self._open.append({"result": result, "h3": None, "heading": None, "depth": {}})
+            return
+        if tag in VOID_ELEMENTS:
+            return
+        for anchor in self._open:
+            depth = anchor["depth"]
+            for capture in depth:
+                depth[capture] += 1
+            if tag == 'h3' and anchor["h3"] is None:
+                anchor["h3"], depth["h3"] = [], 0
+            elif (tag == 'div' and anchor["heading"] is None
+                  and dict(attrs).get('role') == 'heading'):
+                anchor["heading"], depth["heading"] = [], 0
+
+    def handle_startendtag(self, tag, attrs):
+        # Self-closing tags (<br/>, <img/>) never open a capture
+        if tag == 'a':
+            self.handle_starttag(tag, attrs)
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag == 'a':
+            if self._open:
+                self._finish(self._open.pop())
+            return
+        if tag in VOID_ELEMENTS:
+            return
+        for anchor in self._open:
+            depth = anchor["depth"]
+            for capture in list(depth):
+                if depth[capture] == 0:
+                    del depth[capture]
+                else:
+                    depth[capture] -= 1
+
+    def handle_data(self, data):
+        for anchor in self._open:
+            for capture in anchor["depth"]:
+                anchor[capture].append(data)
+
+    def close(self):
+        super().close()
+        while self._open:
+            self._finish(self._open.pop())
+
+    @staticmethod
+    def _finish(anchor: Dict):
+        for capture, key in (("h3", "title"), ("heading", "heading")):
+            if anchor[capture] is not None:
+                anchor["result"][key] = "".join(anchor[capture])
+
+
+def _extract_streaming(html: str) -> List[Dict]:
+    extractor = _LinkExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.links
+
+
+def extract_links(html: str, backend: Optional[str] = None) -> List[Dict]:
+    """Extract result links and their headings from an HTML page"""
+    backend = resolve_backend(backend or HTML_PARSER_BACKEND)
+    if backend == "stream":
+        return _extract_streaming(html)
+    return _extract_with_soup(html, backend)
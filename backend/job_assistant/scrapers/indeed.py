@@ -1,7 +1,7 @@
 from typing import List, Dict
 import re
-from bs4 import BeautifulSoup
 from scrapers.base_scraper import BaseScraper
+from scrapers.html_parser import link_title
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,50 +24,39 @@ class IndeedScraper(BaseScraper):
             ]
             
             for query in search_queries[:1]:  # Limit queries
-                google_url = f"https://www.google.com/search?q={query.replace(' ', '+')}&num=10"
-                html = await self.fetch(google_url)
+                results = await self.search_google(query, num=10)
+                links_found = 0
                 
-                if html:
-                    if "consent.google.com" in html:
-                        logger.warning(f"{self.name}: Blocked by Google Consent page")
-                        continue
-
-                    soup = BeautifulSoup(html, 'html.parser')
-                    links_found = 0
-                    
-                    # Extract Indeed job links from Google results
-                    for link in soup.find_all('a', href=True):
-                        href = link['href']
-                        # Google links often look like /url?q=https://indeed.com/...
-                        if 'indeed.com' in href and ('/viewjob' in href or '/rc/clk' in href):
-                            links_found += 1
-                            # Extract actual Indeed URL
-                            match = re.search(r'(https://[^&]+indeed[^&]+)', href)
-                            if match:
-                                job_url = match.group(1)
-                                # Decode URL encoded characters
-                                job_url = job_url.replace('%3F', '?').replace('%3D', '=').replace('%26', '&')
-                                
-                                title_elem = link.find('h3') or link.find('div', {'role': 'heading'})
-                                title = title_elem.get_text() if title_elem else "Python Developer"
-                                
-                                job = self.create_job_dict(
-                                    job_id=job_url.split('jk=')[-1][:20] if 'jk=' in job_url else "",
-                                    company="See on Indeed",
-                                    title=title,
-                                    description=f"Python Backend Developer position - {title}",
-                                    location="Remote/India",
-                                    link=job_url
-                                )
-                                jobs.append(job)
-                                
-                                if len(jobs) >= self.max_jobs:
-                                    break
-                    
-                    if links_found == 0:
-                        logger.debug(f"{self.name}: No indeed.com links found in Google results")
-                else:
-                    logger.debug(f"{self.name}: Empty HTML response from Google")
+                # Extract Indeed job links from Google results
+                for result in results:
+                    href = result['href']
+                    # Google links often look like /url?q=https://indeed.com/...
+                    if 'indeed.com' in href and ('/viewjob' in href or '/rc/clk' in href):
+                        links_found += 1
+                        # Extract actual Indeed URL
+                        match = re.search(r'(https://[^&]+indeed[^&]+)', href)
+                        if match:
+                            job_url = match.group(1)
+                            # Decode URL encoded characters
+                            job_url = job_url.replace('%3F', '?').replace('%3D', '=').replace('%26', '&')
+                            
+                            title = link_title(result, "Python Developer", heading_fallback=True)
+                            
+                            job = self.create_job_dict(
+                                job_id=job_url.split('jk=')[-1][:20] if 'jk=' in job_url else "",
+                                company="See on Indeed",
+                                title=title,
+                                description=f"Python Backend Developer position - {title}",
+                                location="Remote/India",
+                                link=job_url
+                            )
+                            jobs.append(job)
+                            
+                            if len(jobs) >= self.max_jobs:
+                                break
+                
+                if results and links_found == 0:
+                    logger.debug(f"{self.name}: No indeed.com links found in Google results")
                 
                 if len(jobs) >= self.max_jobs:
                     break
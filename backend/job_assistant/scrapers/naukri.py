@@ -1,7 +1,7 @@
 from typing import List, Dict
 import re
-from bs4 import BeautifulSoup
 from scrapers.base_scraper import BaseScraper
+from scrapers.html_parser import link_title
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,47 +17,36 @@ class NaukriScraper(BaseScraper):
         
         try:
             search_query = 'site:naukri.com "python developer" OR "django developer" fresher'
-            google_url = f"https://www.google.com/search?q={search_query.replace(' ', '+')}&num=20"
+            results = await self.search_google(search_query, num=20)
+            links_found = 0
             
-            html = await self.fetch(google_url)
+            for result in results:
+                href = result['href']
+                if 'naukri.com' in href and '/job-listings' in href:
+                    links_found += 1
+                    # Extract actual Naukri URL
+                    match = re.search(r'(https://[^&]+naukri[^&]+)', href)
+                    if match:
+                        job_url = match.group(1)
+                        job_url = job_url.replace('%3F', '?').replace('%3D', '=').replace('%26', '&')
+                        
+                        title = link_title(result, "Python Developer", heading_fallback=True)
+                        
+                        job = self.create_job_dict(
+                            job_id="", # Naukri IDs are complex, leave blank for hash
+                            company="See on Naukri",
+                            title=title,
+                            description=f"Backend development role - {title}",
+                            location="India",
+                            link=job_url
+                        )
+                        jobs.append(job)
+                        
+                        if len(jobs) >= self.max_jobs:
+                            break
             
-            if html:
-                if "consent.google.com" in html:
-                    logger.warning(f"{self.name}: Blocked by Google Consent page")
-                else:
-                    soup = BeautifulSoup(html, 'html.parser')
-                    links_found = 0
-                    
-                    for link in soup.find_all('a', href=True):
-                        href = link['href']
-                        if 'naukri.com' in href and '/job-listings' in href:
-                            links_found += 1
-                            # Extract actual Naukri URL
-                            match = re.search(r'(https://[^&]+naukri[^&]+)', href)
-                            if match:
-                                job_url = match.group(1)
-                                job_url = job_url.replace('%3F', '?').replace('%3D', '=').replace('%26', '&')
-                                
-                                title_elem = link.find('h3') or link.find('div', {'role': 'heading'})
-                                title = title_elem.get_text() if title_elem else "Python Developer"
-                                
-                                job = self.create_job_dict(
-                                    job_id="", # Naukri IDs are complex, leave blank for hash
-                                    company="See on Naukri",
-                                    title=title,
-                                    description=f"Backend development role - {title}",
-                                    location="India",
-                                    link=job_url
-                                )
-                                jobs.append(job)
-                                
-                                if len(jobs) >= self.max_jobs:
-                                    break
-                    
-                    if links_found == 0:
-                        logger.debug(f"{self.name}: No naukri.com links found in Google results")
-            else:
-                logger.debug(f"{self.name}: Empty HTML response from Google")
+            if results and links_found == 0:
+                logger.debug(f"{self.name}: No naukri.com links found in Google results")
         
         except Exception as e:
             logger.error(f"Error scraping Naukri: {str(e)}")
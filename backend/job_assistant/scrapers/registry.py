@@ -0,0 +1,83 @@
+"""Which portals can be scraped, by name, without importing their scrapers.
+
+The manifest maps a portal name to the factory that builds its scraper,
+as a "module:attribute" string plus the arguments to call it with. Scraper
+modules (and aiohttp, parsers and the rest of the request path behind
+them) are only imported when a portal is loaded, so commands that never
+scrape pay nothing for them.
+
+Portals come from three places, in this order:
+
+    BUILTIN_SCRAPERS   - the hand-written scrapers in this package
+    SERP_PORTALS       - one SerpPortalScraper per spec in scrapers/serp_portals.py
+    entry points       - factories other packages register under the
+                         "job_assistant.scrapers" group; the entry point
+                         name is the portal name
+"""
+
+import importlib
+import logging
+from typing import Dict, List, Optional, Tuple
+from scrapers.serp_portals import SERP_PORTALS
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "job_assistant.scrapers"
+
+BUILTIN_SCRAPERS = {
+    "Indeed": "scrapers.indeed:IndeedScraper",
+    "Naukri": "scrapers.naukri:NaukriScraper",
+    "Instahyre": "scrapers.instahyre:InstahyreScraper",
+    "Remote OK": "scrapers.remoteok:RemoteOKScraper",
+    "Remotive": "scrapers.remotive:RemotiveScraper",
+}
+
+SERP_SCRAPER_FACTORY = "scrapers.serp_engine:create_serp_scraper"
+
+
+def _entry_point_scrapers() -> Dict[str, Tuple[str, tuple]]:
+    from importlib.metadata import entry_points
+    try:
+        return {entry.name: (entry.value, ()) for entry in entry_points(group=ENTRY_POINT_GROUP)}
+    except Exception as e:
+        logger.warning(f"Could not read scraper entry points: {str(e)}")
+        return {}
+
+
+def scraper_manifest() -> Dict[str, Tuple[str, tuple]]:
+    """Portal name -> (factory, arguments), in scraping order"""
+    manifest = {name: (target, ()) for name, target in BUILTIN_SCRAPERS.items()}
+    for spec in SERP_PORTALS:
+        manifest[spec["name"]] = (SERP_SCRAPER_FACTORY, (spec["name"],))
+    for name, entry in _entry_point_scrapers().items():
+        manifest.setdefault(name, entry)
+    return manifest
+
+
+def scraper_names() -> List[str]:
+    """Names of every portal that can be scraped"""
+    return list(scraper_manifest())
+
+
+def resolve(target: str):
+    """Import the object a "module:attribute" string points at"""
+    module_name, _, attribute = target.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def load_scrapers(names: Optional[List[str]] = None) -> List:
+    """Build the scrapers for `names` (all portals when None), importing only their modules"""
+    manifest = scraper_manifest()
+    if names is None:
+        names = list(manifest)
+    scrapers = []
+    for name in names:
+        if name not in manifest:
+            logger.warning(f"Unknown portal {name!r}; known portals: {', '.join(manifest)}")
+            continue
+        target, args = manifest[name]
+        try:
+            scrapers.append(resolve(target)(*args))
+        except Exception as e:
+            logger.error(f"Could not load scraper for {name}: {str(e)}")
+    return scrapers
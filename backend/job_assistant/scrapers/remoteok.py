@@ -1,5 +1,7 @@
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict
+from contextlib import aclosing
 import logging
+from config import KNOWN_ITEMS_BEFORE_STOP
 from scrapers.base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
@@ -11,17 +13,36 @@ class RemoteOKScraper(BaseScraper):
     
     async def scrape(self) -> List[Dict]:
         """Scrape Remote OK using their API"""
-        jobs = []
+        return [job async for job in self.iter_jobs()]
+    
+    async def iter_jobs(self) -> AsyncIterator[Dict]:
+        """Yield matching Remote OK jobs as the feed streams in.
+        
+        The feed is newest first, so reading stops once it reaches the items
+        seen on earlier runs.
+        """
+        count = 0
+        known_in_a_row = 0
         
         try:
             # Remote OK public API
             api_url = "https://remoteok.com/api"
-            data = await self.fetch_json(api_url)
-            
-            if isinstance(data, list):
-                for item in data[1:]:  # Skip first item (metadata)
-                    if not isinstance(item, dict):
+            # Items are parsed as they arrive; leaving the loop cancels the transfer
+            async with aclosing(self.iter_json_array(api_url)) as items:
+                index = 0
+                async for item in items:
+                    index += 1
+                    if index == 1 or not isinstance(item, dict):  # Skip first item (metadata)
+                        continue
+                    
+                    epoch = item.get('epoch')
+                    if self.seen_before(str(item.get('id', '')), epoch if isinstance(epoch, (int, float)) else None):
+                        known_in_a_row += 1
+                        if known_in_a_row >= KNOWN_ITEMS_BEFORE_STOP:
+                            logger.info(f"{self.name}: caught up with the last run after {index - 1} items")
+                            break
                         continue
+                    known_in_a_row = 0
                     
                     tags = item.get('tags', [])
                     position = item.get('position', '')
@@ -38,12 +59,11 @@ class RemoteOKScraper(BaseScraper):
                             location='Remote',
                             link=item.get('url', f"https://remoteok.com/remote-jobs/{item.get('id', '')}")
                         )
-                        jobs.append(job)
+                        yield job
+                        count += 1
                         
-                        if len(jobs) >= self.max_jobs:
+                        if count >= self.max_jobs:
                             break
         
         except Exception as e:
             logger.error(f"Error scraping Remote OK: {str(e)}")
-        
-        return jobs[:self.max_jobs]
@@ -1,5 +1,8 @@
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict, Optional
+from contextlib import aclosing
+from datetime import datetime
 import logging
+from config import KNOWN_ITEMS_BEFORE_STOP, REMOTIVE_PAGE_SIZES
 from scrapers.base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
@@ -11,33 +14,72 @@ class RemotiveScraper(BaseScraper):
     
     async def scrape(self) -> List[Dict]:
         """Scrape Remotive using their API"""
-        jobs = []
+        return [job async for job in self.iter_jobs()]
+    
+    async def iter_jobs(self) -> AsyncIterator[Dict]:
+        """Yield matching Remotive jobs as the feed streams in.
+        
+        With high-water marks, the newest REMOTIVE_PAGE_SIZES[0] jobs are
+        requested first, and a larger page only when that one held no run
+        of jobs seen on earlier runs; reading stops at such a run.
+        """
+        count = 0
+        known_in_a_row = 0
+        # Without marks there is nothing to stop at, so stream the whole feed once
+        page_sizes = REMOTIVE_PAGE_SIZES if self.high_water_marks is not None else [None]
         
         try:
             # Remotive public API
             api_url = "https://remotive.com/api/remote-jobs?category=software-dev"
-            data = await self.fetch_json(api_url)
-            
-            if isinstance(data, dict) and 'jobs' in data:
-                for item in data['jobs']:
-                    title = item.get('title', '')
-                    
-                    # Filter for Python/Backend roles
-                    if any(keyword in title.lower() for keyword in ['python', 'django', 'backend', 'engineer']):
-                        job = self.create_job_dict(
-                            job_id=str(item.get('id', '')),
-                            company=item.get('company_name', 'Unknown'),
-                            title=title,
-                            description=item.get('description', title),
-                            location='Remote',
-                            link=item.get('url', '')
-                        )
-                        jobs.append(job)
+            read = 0
+            for limit in page_sizes:
+                url = api_url if limit is None else f"{api_url}&limit={limit}"
+                index = 0
+                caught_up = False
+                # Items are parsed as they arrive; leaving the loop cancels the transfer
+                async with aclosing(self.iter_json_array(url, key='jobs')) as items:
+                    async for item in items:
+                        index += 1
+                        # A larger page starts with the items the previous one already covered
+                        if index <= read or not isinstance(item, dict):
+                            continue
+                        if self.seen_before(str(item.get('id', '')), self._posted_at(item)):
+                            known_in_a_row += 1
+                            if known_in_a_row >= KNOWN_ITEMS_BEFORE_STOP:
+                                logger.info(f"{self.name}: caught up with the last run after {index} items")
+                                caught_up = True
+                                break
+                            continue
+                        known_in_a_row = 0
+                        title = item.get('title', '')
                         
-                        if len(jobs) >= self.max_jobs:
-                            break
+                        # Filter for Python/Backend roles
+                        if any(keyword in title.lower() for keyword in ['python', 'django', 'backend', 'engineer']):
+                            job = self.create_job_dict(
+                                job_id=str(item.get('id', '')),
+                                company=item.get('company_name', 'Unknown'),
+                                title=title,
+                                description=item.get('description', title),
+                                location='Remote',
+                                link=item.get('url', '')
+                            )
+                            yield job
+                            count += 1
+                            
+                            if count >= self.max_jobs:
+                                break
+                # A short page is the whole feed
+                if caught_up or count >= self.max_jobs or limit is None or index < limit:
+                    break
+                read = index
         
         except Exception as e:
             logger.error(f"Error scraping Remotive: {str(e)}")
-        
-        return jobs[:self.max_jobs]
+    
+    @staticmethod
+    def _posted_at(item: Dict) -> Optional[float]:
+        """The job's publication time as epoch seconds, when it parses"""
+        try:
+            return datetime.fromisoformat(item['publication_date']).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return None
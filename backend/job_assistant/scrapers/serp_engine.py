@@ -0,0 +1,80 @@
+from typing import AsyncIterator, List, Dict, Optional
+import re
+import logging
+from scrapers.base_scraper import BaseScraper
+from scrapers.html_parser import link_title
+from scrapers.serp_portals import SERP_PORTALS
+
+logger = logging.getLogger(__name__)
+
+
+def compile_spec(spec: Dict) -> Dict:
+    """Fill in spec defaults and precompile its link regex"""
+    compiled = dict(spec)
+    compiled.setdefault("site", spec["domain"])
+    compiled.setdefault("path", "")
+    compiled.setdefault("num", 15)
+    compiled.setdefault("heading_fallback", False)
+    compiled["link_pattern"] = re.compile(spec["link_regex"])
+    return compiled
+
+
+# Compiled once at import, shared by every scraper instance
+COMPILED_SERP_PORTALS = [compile_spec(spec) for spec in SERP_PORTALS]
+
+
+class SerpPortalScraper(BaseScraper):
+    """Scraper for a portal reached through Google site: searches, driven by a portal spec"""
+
+    def __init__(self, spec: Dict):
+        super().__init__(spec["name"], spec["portal_url"])
+        self.spec = spec if "link_pattern" in spec else compile_spec(spec)
+
+    async def scrape(self) -> List[Dict]:
+        return [job async for job in self.iter_jobs()]
+
+    async def iter_jobs(self) -> AsyncIterator[Dict]:
+        """Yield each query's jobs as soon as its results are in"""
+        count = 0
+        try:
+            for terms in self.spec["queries"]:
+                search_query = f"site:{self.spec['site']} {terms}"
+                results = await self.search_google(search_query, num=self.spec["num"])
+                for job in self.extract_jobs(results, self.max_jobs - count):
+                    yield job
+                    count += 1
+                if count >= self.max_jobs:
+                    break
+        except Exception as e:
+            logger.error(f"Error scraping {self.name}: {str(e)}")
+
+    def extract_jobs(self, results: List[Dict], limit: Optional[int] = None) -> List[Dict]:
+        """Turn parsed SERP results into job dicts for this portal"""
+        spec = self.spec
+        jobs = []
+        for result in results:
+            href = result['href']
+            if spec["domain"] not in href or spec["path"] not in href:
+                continue
+            match = spec["link_pattern"].search(href)
+            if match:
+                title = link_title(result, spec["default_title"], spec["heading_fallback"])
+                jobs.append(self.create_job_dict("", spec["company"], title,
+                                                 spec["description"].format(title=title),
+                                                 spec["location"], match.group(1)))
+                if limit is not None and len(jobs) >= limit:
+                    break
+        return jobs
+
+
+def create_serp_scrapers() -> List[SerpPortalScraper]:
+    """Build one scraper per entry in SERP_PORTALS"""
+    return [SerpPortalScraper(spec) for spec in COMPILED_SERP_PORTALS]
+
+
+def create_serp_scraper(name: str) -> SerpPortalScraper:
+    """Build the scraper for the SERP_PORTALS entry called `name`"""
+    for spec in COMPILED_SERP_PORTALS:
+        if spec["name"] == name:
+            return SerpPortalScraper(spec)
+    raise KeyError(f"No SERP portal named {name!r}")
@@ -0,0 +1,209 @@
+"""Portals scraped through Google `site:` searches.
+
+Each entry drives one SerpPortalScraper (see scrapers/serp_engine.py):
+
+    name / portal_url  - portal label and home page
+    domain             - result links must contain this domain
+    path               - optional extra substring the link must contain
+    site               - optional site: filter (defaults to domain)
+    queries            - search terms, each run as "site:<site> <terms>"
+    num                - results requested per query
+    link_regex         - extracts the portal URL from Google's result href
+    default_title      - used when the result has no heading
+    heading_fallback   - optional; also accept a <div role="heading"> when the
+                         result has no <h3> (defaults to False)
+    company / location - fixed labels for the job
+    description        - template, formatted with {title}
+
+Adding a portal is a matter of adding an entry here.
+"""
+
+SERP_PORTALS = [
+    {
+        "name": "Cutshort",
+        "portal_url": "https://cutshort.io",
+        "domain": "cutshort.io",
+        "path": "/jobs/",
+        "queries": ["python developer remote"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+cutshort[^&]+)",
+        "default_title": "Python Developer",
+        "company": "See on Cutshort",
+        "description": "Backend role - {title}",
+        "location": "India",
+    },
+    {
+        "name": "Freshersworld",
+        "portal_url": "https://www.freshersworld.com",
+        "domain": "freshersworld.com",
+        "path": "jobs",
+        "queries": ["python django backend"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+freshersworld[^&]+)",
+        "default_title": "Python Developer",
+        "company": "See on Freshersworld",
+        "description": "Fresher position - {title}",
+        "location": "India",
+    },
+    {
+        "name": "TimesJobs",
+        "portal_url": "https://www.timesjobs.com",
+        "domain": "timesjobs.com",
+        "queries": ["python developer"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+timesjobs[^&]+)",
+        "default_title": "Python Developer",
+        "company": "See on TimesJobs",
+        "description": "Backend role - {title}",
+        "location": "India",
+    },
+    {
+        "name": "Foundit",
+        "portal_url": "https://www.foundit.in",
+        "domain": "foundit.in",
+        "queries": ["python backend developer"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+foundit[^&]+)",
+        "default_title": "Backend Developer",
+        "company": "See on Foundit",
+        "description": "Python Backend - {title}",
+        "location": "India",
+    },
+    {
+        "name": "We Work Remotely",
+        "portal_url": "https://weworkremotely.com",
+        "domain": "weworkremotely.com",
+        "path": "/jobs/",
+        "queries": ["python backend developer"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+weworkremotely[^&]+)",
+        "default_title": "Backend Developer",
+        "company": "See on We Work Remotely",
+        "description": "Remote position - {title}",
+        "location": "Remote",
+    },
+    {
+        "name": "Jobspresso",
+        "portal_url": "https://jobspresso.co",
+        "domain": "jobspresso.co",
+        "queries": ["python developer"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+jobspresso[^&]+)",
+        "default_title": "Python Developer",
+        "company": "See on Jobspresso",
+        "description": "Remote role - {title}",
+        "location": "Remote",
+    },
+    {
+        "name": "Working Nomads",
+        "portal_url": "https://www.workingnomads.com",
+        "domain": "workingnomads.com",
+        "queries": ["python backend"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+workingnomads[^&]+)",
+        "default_title": "Backend Developer",
+        "company": "See on Working Nomads",
+        "description": "Remote position - {title}",
+        "location": "Remote",
+    },
+    {
+        "name": "Y Combinator",
+        "portal_url": "https://www.ycombinator.com/jobs",
+        "domain": "ycombinator.com",
+        "site": "ycombinator.com/companies",
+        "queries": ["python backend engineer"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+ycombinator[^&]+)",
+        "default_title": "Backend Engineer",
+        "company": "YC Startup",
+        "description": "Startup role - {title}",
+        "location": "Varies",
+    },
+    {
+        "name": "Wellfound",
+        "portal_url": "https://wellfound.com",
+        "domain": "wellfound.com",
+        "path": "/l/",
+        "queries": ["python backend developer"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+wellfound[^&]+)",
+        "default_title": "Backend Developer",
+        "company": "Startup on Wellfound",
+        "description": "Startup position - {title}",
+        "location": "Varies",
+    },
+    {
+        "name": "Otta",
+        "portal_url": "https://otta.com",
+        "domain": "otta.com",
+        "path": "/jobs/",
+        "queries": ["python backend engineer"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+otta[^&]+)",
+        "default_title": "Backend Engineer",
+        "company": "See on Otta",
+        "description": "Startup role - {title}",
+        "location": "Varies",
+    },
+    {
+        "name": "Reed.co.uk",
+        "portal_url": "https://www.reed.co.uk",
+        "domain": "reed.co.uk",
+        "path": "/jobs/",
+        "queries": ["python developer backend"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+)",
+        "default_title": "Python Developer",
+        "company": "See on Reed",
+        "description": "UK position - {title}",
+        "location": "UK",
+    },
+    {
+        "name": "CWJobs",
+        "portal_url": "https://www.cwjobs.co.uk",
+        "domain": "cwjobs.co.uk",
+        "queries": ["python backend developer"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+cwjobs[^&]+)",
+        "default_title": "Backend Developer",
+        "company": "See on CWJobs",
+        "description": "UK IT role - {title}",
+        "location": "UK",
+    },
+    {
+        "name": "GraduateJobs",
+        "portal_url": "https://www.graduatejobs.com",
+        "domain": "graduatejobs.com",
+        "queries": ["software engineer python"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+graduatejobs[^&]+)",
+        "default_title": "Graduate Software Engineer",
+        "company": "See on GraduateJobs",
+        "description": "Graduate role - {title}",
+        "location": "UK",
+    },
+    {
+        "name": "IamExpat Jobs",
+        "portal_url": "https://www.iamexpat.nl",
+        "domain": "iamexpat.nl",
+        "queries": ["python developer software engineer"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+iamexpat[^&]+)",
+        "default_title": "Software Developer",
+        "company": "See on IamExpat",
+        "description": "Netherlands role - {title}",
+        "location": "Netherlands",
+    },
+    {
+        "name": "Undutchables",
+        "portal_url": "https://undutchables.nl",
+        "domain": "undutchables.nl",
+        "queries": ["software developer python"],
+        "num": 15,
+        "link_regex": r"(https://[^&]+undutchables[^&]+)",
+        "default_title": "Software Developer",
+        "company": "See on Undutchables",
+        "description": "Netherlands position - {title}",
+        "location": "Netherlands",
+    },
+]
@@ -0,0 +1,106 @@
+import asyncio
+import gzip
+import zlib
+
+import pytest
+
+from network.body_reader import ContentDecoder, read_body, stop_at_marker
+
+BODY = ("<html><body>" + "".join(f"<div class='job'>Python developer {i} – café</div>" for i in range(400))
+        + "</body></html>").encode("utf-8")
+
+
+class FakeContent:
+    def __init__(self, payload: bytes):
+        self.payload = payload
+        self.sent = 0
+
+    async def iter_chunked(self, size: int):
+        for start in range(0, len(self.payload), size):
+            self.sent += min(size, len(self.payload) - start)
+            yield self.payload[start:start + size]
+
+
+class FakeResponse:
+    """What read_body() uses of an aiohttp response"""
+
+    def __init__(self, payload: bytes, encoding: str = "", charset: str = "utf-8"):
+        self.headers = {"Content-Encoding": encoding} if encoding else {}
+        self.charset = charset
+        self.content = FakeContent(payload)
+
+
+def compress(encoding: str, data: bytes) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(data)
+    if encoding == "deflate":
+        return zlib.compress(data)
+    if encoding == "raw-deflate":
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+    return data
+
+
+def read(response, max_bytes=10 ** 7, stop=None, chunk_size=256):
+    return asyncio.run(read_body(response, max_bytes, stop, chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("encoding", ["", "gzip", "deflate", "raw-deflate"])
+def test_reads_the_whole_body(encoding):
+    header = "deflate" if encoding == "raw-deflate" else encoding
+    body = read(FakeResponse(compress(encoding, BODY), header))
+    assert body.text == BODY.decode("utf-8")
+    assert body.complete and body.body_bytes == len(BODY)
+
+
+def test_body_of_exactly_max_bytes_is_complete():
+    body = read(FakeResponse(BODY), max_bytes=len(BODY))
+    assert body.complete and body.body_bytes == len(BODY)
+
+
+@pytest.mark.parametrize("encoding", ["", "gzip"])
+def test_cut_at_max_bytes(encoding):
+    response = FakeResponse(compress(encoding, BODY), encoding)
+    body = read(response, max_bytes=1000)
+    assert body.truncated and not body.complete
+    assert body.body_bytes == 1000
+    assert BODY.decode("utf-8").startswith(body.text)
+    assert response.content.sent < len(response.content.payload)
+
+
+def test_compressed_body_is_not_inflated_past_the_limit():
+    bomb = gzip.compress(b"a" * 10 ** 7)
+    body = read(FakeResponse(bomb, "gzip"), max_bytes=4096, chunk_size=len(bomb))
+    assert body.truncated and body.body_bytes == 4096
+
+
+def test_stop_predicate_ends_the_download():
+    response = FakeResponse(BODY)
+    body = read(response, stop=stop_at_marker("developer 10 "))
+    assert body.stopped and not body.truncated
+    assert "developer 10 " in body.text
+    assert response.content.sent < len(BODY)
+
+
+def test_marker_split_across_chunks_is_found():
+    seen = stop_at_marker("</ul>", "<footer")
+    assert not seen("<li>a</li></u")
+    assert seen("l><p>")
+    seen = stop_at_marker("<footer")
+    assert not seen("<foo")
+    assert not seen("t")
+    assert seen("er")
+
+
+def test_multibyte_characters_split_across_chunks():
+    body = read(FakeResponse(BODY), chunk_size=7)
+    assert body.text == BODY.decode("utf-8")
+
+
+def test_unknown_charset_falls_back_to_utf8():
+    assert read(FakeResponse("café".encode("utf-8"), charset="x-unknown")).text == "café"
+
+
+def test_unsupported_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        ContentDecoder("compress")
@@ -0,0 +1,92 @@
+import pytest
+
+from scrapers.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, percentile
+
+HOUR = 3600
+
+
+@pytest.fixture
+def health_file(tmp_path):
+    return str(tmp_path / "portal_health.json")
+
+
+@pytest.fixture
+def circuit(health_file):
+    return CircuitBreaker(health_file, failure_threshold=2, cooldown=HOUR, max_cooldown=3 * HOUR)
+
+
+def expire_cooldown(circuit: CircuitBreaker, portal: str):
+    circuit.portals[portal]["opened_at"] -= circuit.portals[portal]["cooldown"] + 1
+
+
+@pytest.mark.parametrize("values, pct, expected", [([], 50, 0.0), ([3.0], 95, 3.0),
+                                                   ([4, 1, 3, 2], 50, 2), ([4, 1, 3, 2], 95, 4)])
+def test_percentile_is_nearest_rank(values, pct, expected):
+    assert percentile(values, pct) == expected
+
+
+def test_opens_after_consecutive_runs_without_jobs(circuit):
+    circuit.record("Remotive", jobs=0, elapsed=1.0)
+    assert circuit.allow("Remotive")
+    circuit.record("Remotive", jobs=0, elapsed=1.0, error="timeout")
+    assert circuit.portals["Remotive"]["state"] == OPEN
+    assert not circuit.allow("Remotive")
+    assert circuit.portals["Remotive"]["skipped"] == 1
+    assert circuit.retry_at("Remotive") is not None
+
+
+def test_a_run_with_jobs_resets_the_failure_count(circuit):
+    circuit.record("Remotive", jobs=0, elapsed=1.0)
+    circuit.record("Remotive", jobs=5, elapsed=1.0)
+    circuit.record("Remotive", jobs=0, elapsed=1.0)
+    assert circuit.portals["Remotive"]["state"] == CLOSED
+
+
+def test_up_to_date_incremental_runs_count_as_healthy(circuit):
+    for _ in range(3):
+        circuit.record("Remotive", jobs=0, elapsed=0.2, up_to_date=True)
+    assert circuit.portals["Remotive"]["state"] == CLOSED
+    assert circuit.portals["Remotive"]["successes"] == 3
+
+
+def test_successful_probe_closes_the_circuit(circuit):
+    for _ in range(2):
+        circuit.record("Remotive", jobs=0, elapsed=1.0)
+    expire_cooldown(circuit, "Remotive")
+    assert circuit.allow("Remotive")
+    assert circuit.portals["Remotive"]["state"] == HALF_OPEN
+    circuit.record("Remotive", jobs=3, elapsed=1.0)
+    assert circuit.portals["Remotive"]["state"] == CLOSED
+    assert circuit.retry_at("Remotive") is None
+
+
+def test_failed_probes_double_the_cooldown_up_to_the_cap(circuit):
+    for _ in range(2):
+        circuit.record("Remotive", jobs=0, elapsed=1.0)
+    cooldowns = []
+    for _ in range(3):
+        expire_cooldown(circuit, "Remotive")
+        assert circuit.allow("Remotive")
+        circuit.record("Remotive", jobs=0, elapsed=1.0)
+        cooldowns.append(circuit.portals["Remotive"]["cooldown"])
+    assert cooldowns == [2 * HOUR, 3 * HOUR, 3 * HOUR]
+    assert not circuit.allow("Remotive")
+
+
+def test_health_survives_a_restart(health_file):
+    first = CircuitBreaker(health_file, failure_threshold=2, latency_window=2)
+    for elapsed in (1.0, 2.0, 3.0):
+        first.record("Remotive", jobs=0, elapsed=elapsed)
+    first.save()
+    second = CircuitBreaker(health_file, failure_threshold=2)
+    assert not second.allow("Remotive")
+    snapshot = second.snapshot()["Remotive"]
+    assert snapshot["latencies"] == [2.0, 3.0]
+    assert snapshot["success_rate"] == 0.0
+    assert snapshot["seconds_without_jobs"] == 6.0
+
+
+def test_unreadable_health_file_starts_empty(health_file):
+    with open(health_file, "w") as f:
+        f.write("{")
+    assert CircuitBreaker(health_file).portals == {}
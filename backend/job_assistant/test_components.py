@@ -27,7 +27,7 @@ async def test_components():
         "description": "Looking for a Python developer with Django, REST APIs, and PostgreSQL experience"
     }
     matched = matcher.match_job(test_job)
-    print(f"  ✓ Matched skills: {', '.join(matched['matched_skills'][:5])}")
+    print(f"  ✓ Matched skills: {', '.join(matcher.vocabulary.names(matched['matched_mask'])[:5])}")
     print(f"  ✓ Match percentage: {matched['match_percentage']:.1f}%")
     print()
     
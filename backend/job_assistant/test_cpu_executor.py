@@ -0,0 +1,73 @@
+import asyncio
+import multiprocessing
+import os
+
+import pytest
+
+from workers.cpu_executor import CPUExecutor
+
+
+def fail_with(error: Exception):
+    raise error
+
+
+def where() -> str:
+    return "process" if multiprocessing.parent_process() is not None else "thread"
+
+
+def die_in_a_worker() -> str:
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return "thread"
+
+
+def run(executor: CPUExecutor, fn, *args):
+    async def scenario():
+        try:
+            return await executor.run(fn, *args)
+        finally:
+            executor.shutdown()
+    return asyncio.run(asyncio.wait_for(scenario(), timeout=30))
+
+
+@pytest.fixture
+def processes():
+    executor = CPUExecutor(max_workers=1, use_processes=True)
+    try:
+        if run(executor, where) != "process":
+            pytest.skip("Process pool unavailable")
+    except OSError as e:
+        pytest.skip(f"Process pool unavailable: {e}")
+    return CPUExecutor(max_workers=1, use_processes=True)
+
+
+@pytest.mark.parametrize("error", [OSError("disk full"), PermissionError("denied"), ValueError("bad page")])
+def test_errors_raised_by_fn_propagate_from_processes(processes, error):
+    with pytest.raises(type(error), match=str(error)):
+        run(processes, fail_with, error)
+    assert processes.kind == "process" and processes.use_processes
+
+
+@pytest.mark.parametrize("error", [OSError("disk full"), ValueError("bad page")])
+def test_errors_raised_by_fn_propagate_from_threads(error):
+    executor = CPUExecutor(max_workers=1, use_processes=False)
+    with pytest.raises(type(error)):
+        run(executor, fail_with, error)
+
+
+def test_broken_pool_falls_back_to_threads(processes):
+    assert run(processes, die_in_a_worker) == "thread"
+    assert processes.kind == "thread" and not processes.use_processes
+
+
+def test_failing_to_start_workers_falls_back_to_threads(processes, monkeypatch):
+    async def scenario():
+        executor = processes._get_executor()
+        monkeypatch.setattr(executor, "submit", lambda *args: fail_with(PermissionError("no fork")))
+        try:
+            return await processes.run(where)
+        finally:
+            processes.shutdown()
+
+    assert asyncio.run(asyncio.wait_for(scenario(), timeout=30)) == "thread"
+    assert processes.kind == "thread"
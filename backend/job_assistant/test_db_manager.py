@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from database.db_manager import JobDatabase
+from matcher.skill_matcher import SkillMatcher
+from matcher.skill_vocabulary import SkillVocabulary, skill_lists
+from scrapers.indeed import IndeedScraper
+
+SKILLS = ["Python", "Django", "SQL"]
+
+
+@pytest.fixture
+def history_file(tmp_path):
+    return str(tmp_path / "history" / "jobs_history.json")
+
+
+def scraped(title: str, description: str) -> dict:
+    return IndeedScraper().create_job_dict("", "Acme", title, description, "Remote",
+                                           f"https://www.indeed.com/viewjob?jk={title.replace(' ', '-')}")
+
+
+def run(history_file: str, skills_base, jobs):
+    """One assistant run: match new jobs against the saved vocabulary, then save them"""
+    db = JobDatabase(history_file)
+    matcher = SkillMatcher(skills_base, SkillVocabulary(db.skill_vocabulary()))
+    jobs = matcher.match_jobs(db.filter_duplicates(jobs), processes=1)
+    db.save_jobs(jobs, matcher.vocabulary.skills)
+    return db, matcher
+
+
+def test_scraped_jobs_start_with_empty_masks():
+    job = scraped("Backend Engineer", "Python")
+    assert (job["skill_mask"], job["matched_mask"], job["match_percentage"]) == (0, 0, 0)
+
+
+def test_missing_history_file_is_created(history_file):
+    db = JobDatabase(history_file)
+    with open(history_file) as f:
+        assert json.load(f) == {"jobs": []}
+    assert db.skill_vocabulary() == []
+    assert db.find_jobs(["python"]) == []
+
+
+def test_job_round_trips_through_the_masks(history_file):
+    db, matcher = run(history_file, SKILLS, [scraped("Backend Engineer", "Python, Django, Docker and Kafka")])
+    record, = JobDatabase(history_file).load_history()["jobs"]
+    vocabulary = SkillVocabulary(db.skill_vocabulary())
+    assert skill_lists(record, vocabulary) == {
+        "required_skills": ["django", "docker", "kafka", "python"],
+        "matched_skills": ["django", "python"],
+        "missing_skills": ["docker", "kafka"],
+    }
+    assert record["match_percentage"] == 50.0
+    assert db.skill_vocabulary() == matcher.vocabulary.skills
+
+
+def test_vocabulary_growth_keeps_saved_masks_stable(history_file):
+    run(history_file, SKILLS, [scraped("Backend Engineer", "Python, Django and Kafka")])
+    first_vocabulary = JobDatabase(history_file).skill_vocabulary()
+    first_record = JobDatabase(history_file).load_history()["jobs"][0]
+
+    # A later run whose skills base brings in skills the vocabulary lacks
+    db, _ = run(history_file, SKILLS + ["Haskell", "Elixir"],
+                [scraped("Functional Engineer", "Haskell, Elixir and Python")])
+    vocabulary = db.skill_vocabulary()
+    assert vocabulary[:len(first_vocabulary)] == first_vocabulary
+    assert {"haskell", "elixir"} <= set(vocabulary[len(first_vocabulary):])
+
+    old_record, new_record = db.load_history()["jobs"]
+    assert (old_record["skill_mask"], old_record["matched_mask"]) == \
+        (first_record["skill_mask"], first_record["matched_mask"])
+    assert skill_lists(old_record, SkillVocabulary(vocabulary))["required_skills"] == ["django", "kafka", "python"]
+    assert skill_lists(new_record, SkillVocabulary(vocabulary))["required_skills"] == ["elixir", "haskell", "python"]
+
+
+def test_saved_jobs_are_filtered_as_duplicates(history_file):
+    job = scraped("Backend Engineer", "Python")
+    run(history_file, SKILLS, [dict(job)])
+    assert JobDatabase(history_file).filter_duplicates([dict(job)]) == []
+
+
+def test_find_jobs_filters_on_skills(history_file):
+    db, _ = run(history_file, SKILLS, [
+        scraped("Data Engineer", "Python, Kafka and SQL"),
+        scraped("Java Engineer", "Java, Kafka and Spring"),
+        scraped("Web Developer", "Python and Django"),
+    ])
+
+    def titles(*args):
+        return sorted(job["title"] for job in db.find_jobs(*args))
+
+    assert titles(["kafka"]) == ["Data Engineer", "Java Engineer"]
+    assert titles(["kafka"], ["java"]) == ["Data Engineer"]
+    assert titles(["Python", "SQL"]) == ["Data Engineer"]
+    assert titles([], ["python"]) == ["Java Engineer"]
+    assert titles() == ["Data Engineer", "Java Engineer", "Web Developer"]
+    # Skills no job has ever needed
+    assert titles(["cobol"]) == []
+    assert titles(["python"], ["cobol"]) == ["Data Engineer", "Web Developer"]
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from normalizer.description import CLEANER_VERSION, DescriptionNormalizer, html_to_text
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return str(tmp_path / "descriptions.json")
+
+
+@pytest.mark.parametrize("raw, text", [
+    ("<p>Python &amp; Django</p>", "Python & Django"),
+    # Remotive-style HTML escaped a second time, entities inside included
+    ("&lt;p&gt;R&amp;amp;D in Python&lt;/p&gt;&lt;ul&gt;&lt;li&gt;Django&lt;/li&gt;&lt;/ul&gt;",
+     "R&D in Python Django"),
+    ("Tom &amp;amp; Jerry &amp;#8211; Rust", "Tom & Jerry – Rust"),
+    # Plain text that only looks a little like markup
+    ("salary < 50k & equity, C++ <3", "salary < 50k & equity, C++ <3"),
+    ("AT&T needs Go", "AT&T needs Go"),
+])
+def test_entities_and_escaped_markup(raw, text):
+    assert html_to_text(raw) == text
+
+
+@pytest.mark.parametrize("raw, text", [
+    # Inline tags do not split words, block tags do
+    ("<p>Py<b>th</b>on and <a href='/x'>Dja</a>ngo</p>", "Python and Django"),
+    ("<p>Python</p><p>Django</p>", "Python Django"),
+    ("<ul><li>Python</li><li>SQL</li></ul>", "Python SQL"),
+    ("Python<br>Django<br/>SQL<BR />Go", "Python Django SQL Go"),
+    ("<DIV>Python</DIV><Div>Django</Div>", "Python Django"),
+    ("<table><tr><td>Python</td><td>Django</td></tr></table>", "Python Django"),
+    ("<h2>Stack</h2>Python", "Stack Python"),
+    ("<span>Py</span><span>thon</span>", "Python"),
+    # Whitespace inside the text is collapsed, &nbsp; and newlines included
+    ("  Python&nbsp;&nbsp;and\n\n\tDjango  ", "Python and Django"),
+    ("Python<script>var skills = ['java'];</script> <style>p {}</style>Django", "Python Django"),
+    ("Python<!-- java -->Django", "PythonDjango"),
+])
+def test_block_and_inline_whitespace(raw, text):
+    assert html_to_text(raw) == text
+
+
+def test_truncates_at_a_word_boundary():
+    text = "python django postgresql"
+    assert html_to_text(text, max_chars=len(text)) == text
+    assert html_to_text(text, max_chars=len(text) - 1) == "python django"
+    assert html_to_text(text, max_chars=14) == "python django"
+    assert html_to_text(text, max_chars=13) == "python django"
+    assert html_to_text(text, max_chars=12) == "python"
+
+
+def test_truncates_a_single_long_word_mid_word():
+    assert html_to_text("x" * 50, max_chars=10) == "x" * 10
+
+
+def test_truncation_counts_the_cleaned_text():
+    assert html_to_text("<p>" + "<b>a</b> " * 20 + "</p>", max_chars=7) == "a a a a"
+
+
+def test_normalizer_caches_cleaned_descriptions(cache_file):
+    normalizer = DescriptionNormalizer(cache_file, max_chars=100)
+    job = normalizer.normalize({"description": "<p>Python</p>"})
+    assert job["description"] == "Python"
+    normalizer.save()
+
+    second = DescriptionNormalizer(cache_file, max_chars=100)
+    assert second.normalize({"description": "<p>Python</p>"})["description"] == "Python"
+    assert second.normalize({"description": "plain  text"})["description"] == "plain text"
+    assert (second.stats["cache_hits"], second.stats["cleaned"], second.stats["plain"]) == (1, 0, 1)
+
+
+@pytest.mark.parametrize("written", [{"max_chars": 50}, {"version": CLEANER_VERSION - 1}])
+def test_cache_from_another_cleaner_is_discarded(cache_file, written):
+    normalizer = DescriptionNormalizer(cache_file, max_chars=100)
+    normalizer.normalize({"description": "<p>Python</p>"})
+    normalizer.save()
+    with open(cache_file) as f:
+        data = json.load(f)
+    with open(cache_file, "w") as f:
+        json.dump(dict(data, **written), f)
+
+    second = DescriptionNormalizer(cache_file, max_chars=100)
+    second.normalize({"description": "<p>Python</p>"})
+    assert (second.stats["cache_hits"], second.stats["cleaned"]) == (0, 1)
+
+
+def test_unreadable_cache_is_ignored(cache_file):
+    with open(cache_file, "w") as f:
+        f.write("{not json")
+    normalizer = DescriptionNormalizer(cache_file)
+    assert normalizer.normalize({"description": "<b>Go</b>"})["description"] == "Go"
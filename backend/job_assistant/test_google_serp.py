@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from scrapers.google_serp import SerpService
+
+PAGE = ('<div><a href="https://a.example/jobs/1"><h3>Python Developer</h3></a>'
+        '<a href="https://b.example/jobs/2"><h3>Backend Engineer</h3></a></div>')
+
+
+class FakeGoogle:
+    """fetch() for SerpService that counts requests and can be held open"""
+
+    def __init__(self, page: str = PAGE, delay: float = 0.0, error: Exception = None):
+        self.page = page
+        self.delay = delay
+        self.error = error
+        self.urls = []
+
+    async def __call__(self, url, stop=None):
+        self.urls.append(url)
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.page
+
+
+def service(**kwargs) -> SerpService:
+    kwargs.setdefault("merge_window", 0.05)
+    return SerpService(parser_backend="stream", **kwargs)
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+def test_identical_queries_in_flight_are_fetched_once():
+    async def scenario():
+        serp, google = service(), FakeGoogle(delay=0.05)
+        results = await asyncio.gather(*(serp.search("site:a.example python", 10, google) for _ in range(3)))
+        return serp, google, results
+
+    serp, google, results = run(scenario())
+    assert len(google.urls) == 1
+    assert all(len(result) == 2 for result in results)
+    assert serp.stats["coalesced"] == 2
+
+
+def test_results_are_cached_for_the_ttl():
+    async def scenario():
+        serp, google = service(), FakeGoogle()
+        await serp.search("python", 10, google)
+        await serp.search("python", 10, google)
+        return serp, google
+
+    serp, google = run(scenario())
+    assert len(google.urls) == 1
+    assert serp.stats["cache_hits"] == 1
+
+
+def test_followers_take_over_when_the_leader_is_cancelled():
+    async def scenario():
+        serp, google = service(), FakeGoogle(delay=0.05)
+        leader = asyncio.create_task(serp.search("python", 10, google))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(serp.search("python", 10, google)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return serp, google, results
+
+    serp, google, results = run(scenario())
+    assert [len(result) for result in results] == [2, 2]
+    assert len(google.urls) == 2
+    assert not serp._inflight
+
+
+def test_cancelled_follower_leaves_the_leader_alone():
+    async def scenario():
+        serp, google = service(), FakeGoogle(delay=0.05)
+        leader = asyncio.create_task(serp.search("python", 10, google))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(serp.search("python", 10, google))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        return await leader, follower
+
+    results, follower = run(scenario())
+    assert len(results) == 2
+    assert follower.cancelled()
+
+
+def test_errors_reach_every_caller():
+    async def scenario():
+        serp, google = service(), FakeGoogle(delay=0.02, error=ConnectionError("down"))
+        return await asyncio.gather(*(serp.search("python", 10, google) for _ in range(2)),
+                                    return_exceptions=True), serp
+
+    results, serp = run(scenario())
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert not serp._inflight
+
+
+def test_merged_site_queries_share_one_request_and_split_the_results():
+    async def scenario():
+        serp, google = service(merge_queries=True), FakeGoogle()
+        results = await asyncio.gather(serp.search("site:a.example python developer", 5, google),
+                                       serp.search("site:b.example python developer", 5, google))
+        return google, results
+
+    google, (a, b) = run(scenario())
+    assert len(google.urls) == 1
+    assert "OR" in google.urls[0]
+    assert [r["href"] for r in a] == ["https://a.example/jobs/1"]
+    assert [r["href"] for r in b] == ["https://b.example/jobs/2"]
+
+
+@pytest.mark.parametrize("cancel_after", [0.01, 0.07])  # During the merge window, during the fetch
+def test_merge_group_survives_a_cancelled_leader(cancel_after):
+    async def scenario():
+        serp, google = service(merge_queries=True), FakeGoogle(delay=0.05)
+        leader = asyncio.create_task(serp.search("site:a.example python", 5, google))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(serp.search("site:b.example python", 5, google))
+        await asyncio.sleep(cancel_after)
+        leader.cancel()
+        result = await follower
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        # A later caller for the same terms is not stuck in the dead group
+        later = await serp.search("site:c.example python", 5, google)
+        return serp, result, later
+
+    serp, result, later = run(scenario())
+    # The follower ran its own site:b.example query, whose results are not split by site
+    assert len(result) == 2 and len(later) == 2
+    assert not serp._pending and not serp._inflight
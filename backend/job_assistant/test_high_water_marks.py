@@ -0,0 +1,78 @@
+import pytest
+
+from database.high_water_marks import HighWaterMarks
+
+
+@pytest.fixture
+def marks_file(tmp_path):
+    return str(tmp_path / "high_water_marks.json")
+
+
+@pytest.fixture
+def high_water_marks(marks_file):
+    return HighWaterMarks(marks_file)
+
+
+def test_new_portal_knows_nothing(high_water_marks):
+    assert high_water_marks.newest("Remotive") is None
+    assert not high_water_marks.is_known("Remotive", "1", posted_at=100.0)
+
+
+def test_staged_items_are_known_only_after_commit(high_water_marks):
+    high_water_marks.stage("Remotive", "1", posted_at=100.0)
+    assert not high_water_marks.is_known("Remotive", "1")
+    assert high_water_marks.commit("Remotive") == 1
+    assert high_water_marks.is_known("Remotive", "1")
+    assert high_water_marks.newest("Remotive") == 100.0
+
+
+def test_uncommitted_portal_keeps_its_old_mark(marks_file):
+    first = HighWaterMarks(marks_file)
+    first.stage("Remotive", "1", posted_at=100.0)
+    first.commit("Remotive")
+    first.stage("Remotive", "2", posted_at=200.0)
+    first.save()
+    second = HighWaterMarks(marks_file)
+    assert second.newest("Remotive") == 100.0
+    assert not second.is_known("Remotive", "2")
+
+
+def test_older_postings_are_below_the_mark(high_water_marks):
+    high_water_marks.stage("Remotive", "5", posted_at=500.0)
+    high_water_marks.commit("Remotive")
+    assert high_water_marks.is_known("Remotive", "4", posted_at=400.0)
+    assert not high_water_marks.is_known("Remotive", "6", posted_at=600.0)
+    assert not high_water_marks.is_known("Remotive", "7")
+
+
+def test_mark_never_moves_backwards(high_water_marks):
+    high_water_marks.stage("Remotive", "5", posted_at=500.0)
+    high_water_marks.commit("Remotive")
+    high_water_marks.stage("Remotive", "3", posted_at=300.0)
+    high_water_marks.commit("Remotive")
+    assert high_water_marks.newest("Remotive") == 500.0
+
+
+def test_newest_ids_are_kept_up_to_max_ids(marks_file):
+    high_water_marks = HighWaterMarks(marks_file, max_ids=3)
+    for item_id in ("1", "2"):
+        high_water_marks.stage("Remotive", item_id)
+    high_water_marks.commit("Remotive")
+    for item_id in ("3", "4", "1"):
+        high_water_marks.stage("Remotive", item_id)
+    assert high_water_marks.commit("Remotive") == 3
+    assert high_water_marks.portals["Remotive"]["seen_ids"] == ["3", "4", "1"]
+    assert not high_water_marks.is_known("Remotive", "2")
+
+
+def test_portals_have_separate_marks(high_water_marks):
+    high_water_marks.stage("Remotive", "1", posted_at=100.0)
+    high_water_marks.commit("Remotive")
+    assert not high_water_marks.is_known("Remote OK", "1", posted_at=50.0)
+    assert high_water_marks.commit("Remote OK") == 0
+
+
+def test_unreadable_file_starts_empty(marks_file):
+    with open(marks_file, "w") as f:
+        f.write("[")
+    assert HighWaterMarks(marks_file).portals == {}
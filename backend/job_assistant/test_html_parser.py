@@ -0,0 +1,58 @@
+import pytest
+
+from benchmarks.bench_html_parsers import (DEFAULT_TITLE, baseline_links, synthetic_serp_page,
+                                           titled_links)
+from scrapers.html_parser import PARSER_BACKENDS, extract_links, lxml_available
+from scrapers.serp_engine import SerpPortalScraper
+
+PAGE = (
+    '<html><body>'
+    '<a href="https://www.cutshort.io/jobs/h3-only"><h3>Python <b>Developer</b> &amp; Co</h3></a>'
+    '<a href="https://www.cutshort.io/jobs/heading-only"><div role="heading">Backend Engineer</div></a>'
+    '<a href="https://www.cutshort.io/jobs/both"><div role="heading">Heading</div><h3>Title</h3></a>'
+    '<a href="https://www.cutshort.io/jobs/empty-h3"><h3></h3><div role="heading">Fallback</div></a>'
+    '<a href="https://www.cutshort.io/jobs/h3-in-heading"><div role="heading">Outer <h3>Inner</h3></div></a>'
+    '<a href="https://www.cutshort.io/jobs/plain-div"><div>Not a heading</div></a>'
+    '<a href="https://www.cutshort.io/jobs/void"><h3>Line<br>break<img src="x.png"></h3></a>'
+    '<a name="no-href"><h3>Skipped</h3></a>'
+    '<a href="https://www.cutshort.io/jobs/untitled">Just text</a>'
+    '</body></html>'
+)
+
+BACKENDS = [pytest.param(backend, marks=pytest.mark.skipif(
+                backend == "lxml" and not lxml_available(), reason="lxml is not installed"))
+            for backend in PARSER_BACKENDS]
+
+
+@pytest.mark.parametrize("heading_fallback", [False, True])
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("page", [PAGE, synthetic_serp_page(results=12, filler_kb=2)],
+                         ids=["fixture", "synthetic"])
+def test_backends_title_links_like_the_original_scrapers(page, backend, heading_fallback):
+    assert titled_links(extract_links(page, backend), heading_fallback) == \
+        baseline_links(page, heading_fallback)
+
+
+def test_fixture_covers_both_title_rules():
+    with_h3, without_h3 = baseline_links(PAGE, False), baseline_links(PAGE, True)
+    assert ("https://www.cutshort.io/jobs/heading-only", DEFAULT_TITLE) in with_h3
+    assert ("https://www.cutshort.io/jobs/heading-only", "Backend Engineer") in without_h3
+    # An empty <h3> still wins over the heading fallback
+    assert ("https://www.cutshort.io/jobs/empty-h3", "") in without_h3
+
+
+def test_serp_portals_read_only_the_h3_by_default():
+    scraper = SerpPortalScraper({
+        "name": "Cutshort", "portal_url": "https://cutshort.io", "domain": "cutshort.io",
+        "queries": [], "link_regex": r"(https://[^&]+cutshort[^&]+)", "default_title": "Default",
+        "company": "See on Cutshort", "location": "Remote", "description": "{title}",
+    })
+    titles = {job["link"].rsplit("/", 1)[-1]: job["title"]
+              for job in scraper.extract_jobs(extract_links(PAGE, "stream"))}
+    assert titles["h3-only"] == "Python Developer & Co"
+    assert titles["heading-only"] == "Default"
+
+    scraper.spec["heading_fallback"] = True
+    titles = {job["link"].rsplit("/", 1)[-1]: job["title"]
+              for job in scraper.extract_jobs(extract_links(PAGE, "stream"))}
+    assert titles["heading-only"] == "Backend Engineer"
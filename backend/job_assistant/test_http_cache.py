@@ -0,0 +1,149 @@
+import asyncio
+import os
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from network.http_cache import HttpCache
+from scrapers.base_scraper import BaseScraper
+
+URL = "https://remotive.com/api/remote-jobs"
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "http")
+
+
+def test_stored_bodies_survive_a_restart(cache_dir):
+    first = HttpCache(cache_dir)
+    first.store(URL, '{"jobs": []}', {"ETag": '"v1"', "Last-Modified": "Sun, 18 Oct 2026 06:00:00 GMT"})
+    first.save()
+    second = HttpCache(cache_dir)
+    entry = second.get(URL)
+    assert entry["etag"] == '"v1"'
+    assert second.read_body(URL) == '{"jobs": []}'
+
+
+def test_freshness_follows_the_ttl(cache_dir):
+    http_cache = HttpCache(cache_dir, ttl=60)
+    http_cache.store(URL, "body", {})
+    entry = http_cache.get(URL)
+    assert http_cache.is_fresh(entry)
+    entry["stored_at"] = time.time() - 61
+    assert not http_cache.is_fresh(entry)
+
+
+def test_conditional_headers(cache_dir):
+    http_cache = HttpCache(cache_dir)
+    assert http_cache.conditional_headers(None) == {}
+    http_cache.store(URL, "body", {"ETag": '"v1"', "Last-Modified": "Sun, 18 Oct 2026 06:00:00 GMT"})
+    assert http_cache.conditional_headers(http_cache.get(URL)) == {
+        "If-None-Match": '"v1"', "If-Modified-Since": "Sun, 18 Oct 2026 06:00:00 GMT"}
+
+
+def test_not_modified_refreshes_the_entry(cache_dir):
+    http_cache = HttpCache(cache_dir, ttl=60)
+    http_cache.store(URL, "body", {"ETag": '"v1"'})
+    entry = http_cache.get(URL)
+    entry["stored_at"] = 0
+    http_cache.record_revalidated(URL, {"ETag": '"v2"'})
+    assert http_cache.is_fresh(entry) and entry["etag"] == '"v2"'
+    assert http_cache.stats["revalidated"] == 1 and http_cache.stats["bytes_saved"] == 4
+
+
+def test_no_store_responses_are_not_cached(cache_dir):
+    http_cache = HttpCache(cache_dir)
+    http_cache.store(URL, "body", {"Cache-Control": "private, no-store"})
+    assert http_cache.get(URL) is None
+    assert http_cache.stats["misses"] == 1
+
+
+def test_least_recently_used_entries_are_evicted(cache_dir):
+    http_cache = HttpCache(cache_dir, max_bytes=10)
+    http_cache.store("https://a.example/", "aaaa", {})
+    http_cache.store("https://b.example/", "bbbb", {})
+    http_cache.read_body("https://a.example/")
+    http_cache.store("https://c.example/", "cccc", {})
+    assert http_cache.get("https://b.example/") is None
+    assert not os.path.exists(http_cache._body_path("https://b.example/"))
+    assert http_cache.read_body("https://a.example/") == "aaaa"
+
+
+def test_entry_without_a_body_is_dropped_from_the_saved_index(cache_dir):
+    first = HttpCache(cache_dir)
+    first.store(URL, "body", {})
+    first.save()
+    os.remove(first._body_path(URL))
+    second = HttpCache(cache_dir)
+    assert second.get(URL) is None
+    second.save()
+    assert HttpCache(cache_dir)._entries == {}
+
+
+def test_unreadable_body_is_dropped_from_the_saved_index(cache_dir):
+    first = HttpCache(cache_dir)
+    first.store(URL, "body", {})
+    first.save()
+    with open(first._body_path(URL), "wb") as f:
+        f.write(b"not gzip")
+    second = HttpCache(cache_dir)
+    assert second.read_body(URL) is None
+    second.save()
+    assert HttpCache(cache_dir)._entries == {}
+
+
+def test_unreadable_index_starts_empty(cache_dir):
+    os.makedirs(cache_dir)
+    with open(os.path.join(cache_dir, "index.json"), "w") as f:
+        f.write("{truncated")
+    assert HttpCache(cache_dir)._entries == {}
+
+
+class LocalScraper(BaseScraper):
+    def __init__(self, http_cache: HttpCache):
+        super().__init__("Local", "http://127.0.0.1")
+        self.http_cache = http_cache
+
+    async def scrape(self):
+        return []
+
+
+async def read_text(scraper: BaseScraper, url: str):
+    return await scraper.fetch(url)
+
+
+async def read_items(scraper: BaseScraper, url: str):
+    return [item async for item in scraper.iter_json_array(url, "jobs")]
+
+
+@pytest.mark.parametrize("read, expected", [(read_text, '{"jobs": [{"id": 2}]}'), (read_items, [{"id": 2}])])
+def test_not_modified_with_a_lost_body_is_fetched_again(cache_dir, read, expected):
+    requests = []
+
+    async def feed(request):
+        requests.append(request.headers.get("If-None-Match"))
+        if "If-None-Match" in request.headers:
+            return web.Response(status=304)
+        return web.Response(text='{"jobs": [{"id": 2}]}', content_type="application/json", headers={"ETag": '"v2"'})
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/feed", feed)
+        async with TestServer(app) as server:
+            url = str(server.make_url("/feed"))
+            http_cache = HttpCache(cache_dir, ttl=60)
+            http_cache.store(url, '{"jobs": [{"id": 1}]}', {"ETag": '"v1"'})
+            http_cache.get(url)["stored_at"] -= 120
+            # The body file is still there but can no longer be read
+            with open(http_cache._body_path(url), "wb") as f:
+                f.write(b"not gzip")
+            return url, http_cache, await read(LocalScraper(http_cache), url)
+
+    url, http_cache, result = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    assert result == expected
+    assert requests == ['"v1"', None]
+    assert http_cache.get(url)["etag"] == '"v2"'
+    assert http_cache.read_body(url) == '{"jobs": [{"id": 2}]}'
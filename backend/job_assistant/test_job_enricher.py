@@ -0,0 +1,130 @@
+import json
+
+import pytest
+
+from enricher.job_enricher import MAX_PENDING_SCRIPT, _JobPostingRead, extract_description
+
+LONG = "We build backend services in Python and Django for teams around the world. " * 4
+MAIN = "Main text: " + LONG
+META = "Meta text: " + LONG
+BODY = "Body text: " + LONG
+
+
+def json_ld(data) -> str:
+    return f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+
+def page(head: str = "", main: str = MAIN, meta: str = META, body: str = BODY) -> str:
+    return (f'<html><head><meta name="description" content="{meta}">{head}</head><body>'
+            f'<nav>Home Jobs Login</nav><header>Acme careers</header>'
+            f'<main>{main}</main><p>{body}</p><footer>Privacy Terms</footer></body></html>')
+
+
+@pytest.mark.parametrize("data", [
+    {"@context": "https://schema.org", "@type": "JobPosting", "description": "From JSON-LD"},
+    {"@type": ["JobPosting", "Thing"], "description": "From JSON-LD"},
+    {"@context": "https://schema.org", "@graph": [
+        {"@type": "Organization", "name": "Acme", "description": "Not the job"},
+        {"@type": "JobPosting", "description": "From JSON-LD"},
+    ]},
+    [{"@type": "BreadcrumbList"}, {"@type": "JobPosting", "description": "From JSON-LD"}],
+])
+def test_job_posting_json_ld_comes_first(data):
+    assert extract_description(page(json_ld(data))) == "From JSON-LD"
+
+
+def test_json_ld_description_is_cleaned():
+    data = {"@type": "JobPosting", "description": "&lt;p&gt;Py&lt;b&gt;thon&lt;/b&gt; &amp;amp; SQL&lt;/p&gt;"}
+    assert extract_description(page(json_ld(data))) == "Python & SQL"
+
+
+def test_first_job_posting_block_wins():
+    head = json_ld({"@type": "JobPosting", "description": "First"}) + \
+        json_ld({"@type": "JobPosting", "description": "Second"})
+    assert extract_description(page(head)) == "First"
+
+
+@pytest.mark.parametrize("head", [
+    "",
+    json_ld({"@type": "Organization", "description": "Not the job"}),
+    json_ld({"@type": "JobPosting"}),
+    json_ld({"@type": "JobPosting", "description": ""}),
+    '<script type="application/ld+json">{not json</script>',
+])
+def test_main_text_without_a_usable_job_posting(head):
+    assert extract_description(page(head)) == MAIN.strip()
+
+
+def test_article_counts_as_main_text():
+    html = page(main="").replace("<p>", "<article>" + MAIN + "</article><p>")
+    assert extract_description(html) == MAIN.strip()
+
+
+def test_meta_description_when_main_text_is_short():
+    assert extract_description(page(main="Apply now")) == META.strip()
+
+
+def test_page_text_when_meta_is_short_too():
+    description = extract_description(page(main="", meta="Jobs"))
+    assert description == BODY.strip()
+    for furniture in ("Home Jobs Login", "Acme careers", "Privacy Terms"):
+        assert furniture not in description
+
+
+def test_nothing_usable():
+    assert extract_description(page(main="", meta="", body="Short")) == ""
+
+
+def test_inline_tags_do_not_split_words():
+    main = "<p>We use Py<b>th</b>on</p><ul><li>Django</li><li>SQL</li></ul>" + LONG
+    assert extract_description(page(main=main)).startswith("We use Python Django SQL We build")
+
+
+def test_max_chars():
+    data = {"@type": "JobPosting", "description": LONG}
+    assert extract_description(page(json_ld(data)), max_chars=20) == "We build backend"
+    description = extract_description(page(main=MAIN * 3), max_chars=len(MAIN))
+    assert len(description) <= len(MAIN) and MAIN.startswith(description)
+
+
+JOB_POSTING = ('<script id="job-posting-structured-data-0123456789abcdef0123456789abcdef0123456789" '
+               'nonce="abcdef0123456789" type="application/ld+json">'
+               '{"@type": "JobPosting", "description": "Python"}</script>')
+
+
+def read(chunks) -> bool:
+    stop = _JobPostingRead()
+    return any(stop(chunk) for chunk in chunks)
+
+
+def test_job_posting_read_in_one_chunk():
+    assert read(["<html><head>" + JOB_POSTING])
+    assert not read(["<html><head>" + json_ld({"@type": "Organization"}) + "</head><body>"])
+
+
+def test_job_posting_read_with_the_block_split_anywhere():
+    html = "<html><head><title>Python < Go</title>" + "x" * 200 + JOB_POSTING + "</head>"
+    for cut in range(len(html)):
+        assert read([html[:cut], html[cut:]]), cut
+
+
+def test_job_posting_read_in_small_chunks():
+    html = "<html><head>" + "y" * 1000 + JOB_POSTING + "</head><body>" + "z" * 1000
+    assert read(html[i:i + 7] for i in range(0, len(html), 7))
+
+
+def test_pending_text_is_capped():
+    stop = _JobPostingRead()
+    assert not stop('<script type="application/ld+json">{"@type": "Organization", "logo": "')
+    chunk = "x" * (64 * 1024)
+    for _ in range(MAX_PENDING_SCRIPT // len(chunk) + 2):
+        assert not stop(chunk)
+        assert len(stop._pending) <= MAX_PENDING_SCRIPT
+    # The oversized block was given up on, a later JobPosting is still found
+    assert stop('"}</script>' + JOB_POSTING)
+
+
+def test_unclosed_tag_is_not_carried_past_the_cap():
+    stop = _JobPostingRead()
+    assert not stop("<div class=" + "x" * (MAX_PENDING_SCRIPT + 1))
+    assert stop._pending == ""
@@ -0,0 +1,80 @@
+import json
+import random
+
+import pytest
+
+from network.json_stream import JsonArrayStream
+
+ARRAYS = [
+    [1, -2.5, 3e10, -4.25e-3, 0, 10],
+    [True, False, None, "x", -0.5],
+    ["café ☃", "quote \" and \\ slash", "", "über"],
+    [{"id": 1, "tags": ["a", "b"]}, [1, [2, [3]]], {"nested": {"n": -1.5e2}}],
+    [],
+]
+
+
+def decode(body: bytes, chunks, key=None):
+    stream = JsonArrayStream(key=key)
+    items = []
+    start = 0
+    for end in chunks:
+        items += stream.feed(body[start:end])
+        start = end
+    items += stream.feed(body[start:])
+    return items + stream.close()
+
+
+@pytest.mark.parametrize("array", ARRAYS)
+@pytest.mark.parametrize("separators", [(",", ":"), (", ", ": "), (" ,\n", " : ")])
+def test_split_at_every_byte(array, separators):
+    body = json.dumps(array, separators=separators, ensure_ascii=False).encode("utf-8")
+    for offset in range(len(body) + 1):
+        assert decode(body, [offset]) == array, f"split at byte {offset}: {body[:offset]!r}"
+
+
+@pytest.mark.parametrize("array", ARRAYS)
+def test_split_at_every_byte_under_key(array):
+    body = json.dumps({"meta": {"jobs": 0}, "jobs": array, "after": [1]}).encode("utf-8")
+    for offset in range(len(body) + 1):
+        assert decode(body, [offset], key="jobs") == array
+
+
+def test_number_split_after_sign_dot_and_exponent():
+    stream = JsonArrayStream()
+    assert stream.feed(b"[1, -") == [1]
+    assert stream.feed(b"2.") == []
+    assert stream.feed(b"5e") == []
+    assert stream.feed(b"1]") == [-25.0]
+    assert stream.done
+
+
+def test_random_scalar_arrays_split_byte_by_byte():
+    rng = random.Random(7)
+    scalars = [lambda: rng.randint(-10 ** 6, 10 ** 6), lambda: rng.uniform(-1e6, 1e6),
+               lambda: rng.choice([True, False, None]), lambda: "s" * rng.randint(0, 5)]
+    for _ in range(200):
+        array = [rng.choice(scalars)() for _ in range(rng.randint(1, 8))]
+        body = json.dumps(array).encode("utf-8")
+        cuts = sorted(rng.sample(range(len(body) + 1), min(len(body), rng.randint(1, 6))))
+        assert decode(body, cuts) == array
+        assert decode(body, range(1, len(body))) == array
+
+
+def test_ignores_anything_after_the_array():
+    stream = JsonArrayStream()
+    assert stream.feed(b"[1, 2] trailing garbage {") == [1, 2]
+    assert stream.feed(b"more") == []
+    assert stream.close() == []
+
+
+def test_truncated_body_fails_on_close():
+    stream = JsonArrayStream()
+    assert stream.feed(b"[1, -2.") == [1]
+    with pytest.raises(json.JSONDecodeError):
+        stream.close()
+
+
+def test_rejects_a_body_that_is_not_an_array():
+    with pytest.raises(ValueError):
+        JsonArrayStream().feed(b'{"jobs": []}')
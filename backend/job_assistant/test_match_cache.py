@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from matcher.match_cache import MatchCache, content_hash
+
+SKILLS = ["Python", "Django", "SQL"]
+VOCABULARY = ["python", "django", "sql"]
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return str(tmp_path / "match_results.json")
+
+
+def matched(title: str, description: str = "Python and Django", percentage: float = 66.7) -> dict:
+    return {"title": title, "description": description, "link": f"https://remotive.com/{title}",
+            "skill_mask": 0b111, "matched_mask": 0b011, "match_percentage": percentage}
+
+
+def test_content_hash_ignores_everything_but_title_and_description():
+    job = matched("Backend Engineer")
+    assert content_hash(job) == content_hash(dict(job, link="https://other.example/", company="Acme"))
+    assert content_hash(job) != content_hash(dict(job, description="Go and Rust"))
+
+
+def test_results_survive_a_restart(cache_file):
+    first = MatchCache(SKILLS, VOCABULARY, cache_file)
+    first.store(matched("Backend Engineer"))
+    first.save()
+    job = {"title": "Backend Engineer", "description": "Python and Django"}
+    second = MatchCache(SKILLS, VOCABULARY, cache_file)
+    assert second.apply(job)
+    assert (job["skill_mask"], job["matched_mask"], job["match_percentage"]) == (0b111, 0b011, 66.7)
+    assert second.hit_rate() == 1.0
+
+
+def test_changed_text_is_a_miss(cache_file):
+    match_cache = MatchCache(SKILLS, VOCABULARY, cache_file)
+    match_cache.store(matched("Backend Engineer"))
+    job = {"title": "Backend Engineer", "description": "Python, Django and Kubernetes"}
+    assert not match_cache.apply(job)
+    assert "skill_mask" not in job
+    assert match_cache.stats == {"hits": 0, "misses": 1}
+
+
+def test_cache_for_other_skills_is_discarded(cache_file):
+    first = MatchCache(SKILLS, VOCABULARY, cache_file)
+    first.store(matched("Backend Engineer"))
+    first.save()
+    assert not MatchCache(SKILLS + ["Go"], VOCABULARY, cache_file)._entries
+    assert not MatchCache(SKILLS, VOCABULARY + ["go"], cache_file)._entries
+    assert MatchCache(["sql", "python", "DJANGO"], VOCABULARY, cache_file)._entries
+
+
+def test_least_recently_used_results_are_evicted(cache_file):
+    match_cache = MatchCache(SKILLS, VOCABULARY, cache_file, max_entries=2)
+    for title in ("A", "B"):
+        match_cache.store(matched(title))
+    assert match_cache.apply({"title": "A", "description": "Python and Django"})
+    match_cache.store(matched("C"))
+    assert not match_cache.apply({"title": "B", "description": "Python and Django"})
+    assert match_cache.apply({"title": "A", "description": "Python and Django"})
+
+
+def test_unchanged_cache_is_not_rewritten(cache_file):
+    match_cache = MatchCache(SKILLS, VOCABULARY, cache_file)
+    match_cache.save()
+    assert not os.path.exists(match_cache.cache_file)
+
+
+def test_unreadable_cache_starts_empty(cache_file):
+    with open(cache_file, "w") as f:
+        f.write("{")
+    assert MatchCache(SKILLS, VOCABULARY, cache_file).hit_rate() is None
@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+import pytest
+
+import main
+from main import JobSearchAssistant
+
+DESCRIPTION = ("Backend role on our hiring platform. You will build REST APIs in Python and Django, "
+               "model data in PostgreSQL, ship with Docker to AWS and keep the services fast and well "
+               "tested. Job number {i}, posted by team {i} of our remote engineering organisation.")
+
+
+def job(i: int) -> dict:
+    return {"job_id": str(i), "company": f"Company {i}", "title": "Python Developer",
+            "description": DESCRIPTION.format(i=i), "location": "Remote", "portal": "Test",
+            "link": f"https://jobs.example/{i}", "skill_mask": 0, "matched_mask": 0, "match_percentage": 0}
+
+
+async def stream(count: int, stall: bool):
+    """`count` jobs, then either the end of the stream or a portal that never answers again"""
+    for i in range(count):
+        yield job(i)
+    if stall:
+        await asyncio.Event().wait()
+
+
+def match(tmp_path, count: int, stall: bool):
+    async def scenario():
+        assistant = JobSearchAssistant()
+        assistant.isolate(str(tmp_path))
+        async with assistant:
+            started = time.perf_counter()
+            received, matched = await assistant.match_job_stream(stream(count, stall))
+            return received, matched, time.perf_counter() - started
+
+    return asyncio.run(asyncio.wait_for(scenario(), timeout=30))
+
+
+def test_jobs_are_matched_when_the_stream_ends(tmp_path):
+    received, matched, _ = match(tmp_path, 3, stall=False)
+    assert received == 3
+    assert sorted(j["link"] for j in matched) == [f"https://jobs.example/{i}" for i in range(3)]
+
+
+def test_quiet_stream_does_not_hold_back_the_early_stop(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "MAX_JOBS_PER_RUN", 2)
+    monkeypatch.setattr(main, "EARLY_STOP_MATCH_PERCENTAGE", 50)
+    # Far fewer jobs than a chunk, and the stream stalls after them
+    received, matched, elapsed = match(tmp_path, 3, stall=True)
+    assert received == 3
+    assert len(matched) == 2
+    assert elapsed < main.MATCH_FLUSH_DELAY + 10
+
+
+@pytest.mark.parametrize("count", [main.MATCH_CHUNK_SIZE - 1, main.MATCH_CHUNK_SIZE + 1])
+def test_every_job_is_matched_across_chunks(tmp_path, count):
+    received, matched, _ = match(tmp_path, count, stall=False)
+    assert received == count
+    assert len(matched) == min(count, main.MAX_JOBS_PER_RUN)
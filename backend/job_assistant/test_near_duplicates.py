@@ -0,0 +1,103 @@
+import os
+
+import pytest
+
+from database.near_duplicates import NearDuplicateIndex, job_signatures, shingle_text
+
+DESCRIPTION = ("We are hiring a senior Python developer to build data pipelines and REST APIs with "
+               "Django, PostgreSQL and Celery. You will own services end to end, review code, mentor "
+               "two junior engineers and work closely with product on the roadmap for next year.")
+
+
+def job(link: str, description: str = DESCRIPTION, title: str = "Senior Python Developer") -> dict:
+    return {"link": link, "hash": link, "title": title, "company": "Acme", "description": description}
+
+
+@pytest.fixture
+def index_file(tmp_path):
+    return str(tmp_path / "near_duplicates.json")
+
+
+def check(near_duplicates: NearDuplicateIndex, *jobs) -> list:
+    """is_duplicate() for each job, signed the way the pipeline signs a batch"""
+    signatures = job_signatures([shingle_text(j) for j in jobs], near_duplicates.permutations,
+                                near_duplicates.shingle_size, near_duplicates.min_shingles)
+    return [near_duplicates.is_duplicate(j, s) for j, s in zip(jobs, signatures)]
+
+
+def test_repost_in_the_same_run_is_caught(index_file):
+    near_duplicates = NearDuplicateIndex(index_file)
+    original, repost = job("https://remotive.com/1"), job("https://weworkremotely.com/9")
+    repost["description"] = "<p>" + DESCRIPTION.replace("Celery", "Celery &amp; Redis") + "</p>"
+    assert check(near_duplicates, original, repost) == [False, True]
+    assert repost["duplicate_of"] == original["link"]
+
+
+def test_different_roles_are_kept(index_file):
+    other = job("https://remotive.com/2", "Design marketing pages in Figma, run user interviews and "
+                                          "own the brand guidelines for our growing consumer app.",
+                title="Product Designer")
+    assert check(NearDuplicateIndex(index_file), job("https://remotive.com/1"), other) == [False, False]
+
+
+def test_committed_jobs_are_kept_across_runs(index_file):
+    first = NearDuplicateIndex(index_file)
+    check(first, job("https://remotive.com/1"))
+    assert first.commit([job("https://remotive.com/1")]) == 1
+    first.save()
+    assert check(NearDuplicateIndex(index_file), job("https://workingnomads.com/5")) == [True]
+
+
+def test_staged_jobs_that_were_not_saved_are_forgotten(index_file):
+    first = NearDuplicateIndex(index_file)
+    check(first, job("https://remotive.com/1"))
+    first.save()
+    assert not os.path.exists(first.index_file)
+    assert check(NearDuplicateIndex(index_file), job("https://workingnomads.com/5")) == [False]
+
+
+def test_only_committed_jobs_are_written(index_file):
+    first = NearDuplicateIndex(index_file)
+    kept = job("https://remotive.com/1")
+    dropped = job("https://remotive.com/2", "Design marketing pages in Figma, run user interviews and "
+                                            "own the brand guidelines for our growing consumer app.")
+    check(first, kept, dropped)
+    first.commit([kept])
+    first.save()
+    assert list(NearDuplicateIndex(index_file)._entries) == [kept["hash"]]
+
+
+def test_a_job_is_never_a_duplicate_of_itself(index_file):
+    near_duplicates = NearDuplicateIndex(index_file)
+    assert check(near_duplicates, job("https://remotive.com/1")) == [False]
+    assert check(near_duplicates, job("https://remotive.com/1")) == [False]
+
+
+def test_short_texts_are_not_compared(index_file):
+    near_duplicates = NearDuplicateIndex(index_file)
+    placeholder = job("https://wellfound.com/1", "See listing")
+    assert check(near_duplicates, placeholder, job("https://wellfound.com/2", "See listing")) == [False, False]
+    assert near_duplicates.stats["too_short"] == 2
+    assert not near_duplicates._entries
+
+
+def test_oldest_signatures_are_dropped_beyond_max_entries(index_file):
+    near_duplicates = NearDuplicateIndex(index_file, max_entries=2)
+    jobs = [job(f"https://remotive.com/{i}", f"Role number {i} " + " ".join(f"w{i}x{n}" for n in range(20)))
+            for i in range(3)]
+    check(near_duplicates, *jobs)
+    assert list(near_duplicates._entries) == [jobs[1]["hash"], jobs[2]["hash"]]
+    assert all(jobs[0]["hash"] not in keys for buckets in near_duplicates._buckets for keys in buckets.values())
+
+
+def test_index_written_with_other_settings_is_discarded(index_file):
+    first = NearDuplicateIndex(index_file)
+    check(first, job("https://remotive.com/1"))
+    first.commit([job("https://remotive.com/1")])
+    first.save()
+    assert not NearDuplicateIndex(index_file, permutations=32, bands=8)._entries
+
+
+def test_permutations_must_split_into_bands(index_file):
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(index_file, permutations=64, bands=10)
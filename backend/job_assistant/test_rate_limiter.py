@@ -0,0 +1,76 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from network.rate_limiter import RateLimiter, TokenBucket, parse_retry_after
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+@pytest.mark.parametrize("value, expected", [(None, None), ("", None), ("120", 120.0), (" 5 ", 5.0),
+                                             ("soon", None)])
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 28 <= parse_retry_after(later) <= 30
+    earlier = format_datetime(datetime.now(timezone.utc) - timedelta(seconds=30), usegmt=True)
+    assert parse_retry_after(earlier) == 0.0
+
+
+def test_burst_up_to_capacity_then_paced():
+    async def scenario():
+        bucket = TokenBucket(rate=20, capacity=3)
+        burst = [await bucket.acquire() for _ in range(3)]
+        return burst, await bucket.acquire()
+
+    burst, paced = run(scenario())
+    assert sum(burst) < 0.02
+    assert paced >= 0.04
+
+
+def test_penalize_halves_the_rate_and_pauses():
+    async def scenario():
+        bucket = TokenBucket(rate=40, capacity=5)
+        bucket.penalize(retry_after=0.1)
+        return bucket, await bucket.acquire()
+
+    bucket, waited = run(scenario())
+    assert bucket.rate == 20
+    assert waited >= 0.09
+
+
+def test_reward_recovers_additively_up_to_the_base_rate():
+    bucket = TokenBucket(rate=10, capacity=1)
+    bucket.penalize()
+    bucket.penalize()
+    assert bucket.rate == 2.5
+    bucket.reward()
+    assert bucket.rate == 3.5
+    for _ in range(20):
+        bucket.reward()
+    assert bucket.rate == 10
+
+
+def test_rate_never_drops_below_the_floor():
+    bucket = TokenBucket(rate=0.05, capacity=1)
+    for _ in range(10):
+        bucket.penalize(retry_after=0)
+    assert bucket.rate == pytest.approx(0.02)
+
+
+def test_hosts_get_their_own_buckets():
+    limiter = RateLimiter(limits={"remotive.com": (1.0, 2)}, default_limit=(5.0, 5), jitter=0)
+    remotive = limiter._get_bucket("https://remotive.com/api/remote-jobs")
+    assert limiter._get_bucket("https://remotive.com/other") is remotive
+    assert (remotive.rate, remotive.capacity) == (1.0, 2)
+    other = limiter._get_bucket("https://weworkremotely.com/")
+    assert (other.rate, other.capacity) == (5.0, 5)
+    limiter.penalize("https://remotive.com/", retry_after=0)
+    assert remotive.rate == 0.5 and other.rate == 5.0
@@ -0,0 +1,82 @@
+import math
+import re
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from ranker.relevance import RelevanceRanker, profile_text  # noqa: E402
+
+# Same words as the byte tokenizer: ASCII letters, digits, '+' and '#', and any non-ASCII character
+WORD_PATTERN = re.compile(r'(?:[a-z0-9+#]|[^\x00-\x7f])+')
+
+PROFILE = "Python Django PostgreSQL REST APIs backend developer c++ c# Zürich microservices-architecture"
+
+JOBS = [
+    {"title": "Python Backend Developer", "description": "Django, PostgreSQL and REST APIs. Python first."},
+    {"title": "Senior C++ Engineer", "description": "Modern C++ and C# on Linux; some Python scripting."},
+    {"title": "Frontend Developer", "description": "React, TypeScript and CSS."},
+    {"title": "Backend Engineer (Zürich)", "description": "Go and Python microservices-architecture in Zürich."},
+    {"title": "Data Engineer", "description": "python python python python spark airflow " * 5},
+    {"title": "", "description": ""},
+    {"description": "Supercalifragilisticexpialidocious backend developer"},
+    {"title": "Developer", "description": None},
+]
+
+
+def tokens(text: str):
+    return WORD_PATTERN.findall(text.lower())
+
+
+def plain_bm25(profile: str, jobs, title_weight: float, k1: float, b: float):
+    """BM25 the textbook way, one job and one term at a time"""
+    query = Counter(tokens(profile))
+    documents = []
+    for job in jobs:
+        title, description = tokens(job.get("title") or ""), tokens(job.get("description") or "")
+        tf = Counter(description)
+        for word, count in Counter(title).items():
+            tf[word] += count * title_weight
+        documents.append(({term: tf[term] for term in query if tf[term]},
+                          len(description) + len(title) * title_weight))
+    average_length = sum(length for _, length in documents) / len(documents) or 1.0
+    scores = []
+    for tf, length in documents:
+        score = 0.0
+        for term, count in tf.items():
+            document_frequency = sum(1 for other, _ in documents if term in other)
+            idf = math.log1p((len(documents) - document_frequency + 0.5) / (document_frequency + 0.5))
+            score += idf * query[term] * count * (k1 + 1) / (count + k1 * (1 - b + b * length / average_length))
+        scores.append(score)
+    return scores
+
+
+@pytest.mark.parametrize("title_weight, k1, b", [(2.0, 1.2, 0.75), (1.0, 1.5, 0.0), (3.0, 0.9, 1.0)])
+def test_scores_match_plain_python_bm25(title_weight, k1, b):
+    ranker = RelevanceRanker(PROFILE, title_weight=title_weight, k1=k1, b=b)
+    expected = plain_bm25(PROFILE, JOBS, title_weight, k1, b)
+    assert ranker.scores(JOBS).tolist() == pytest.approx(expected, rel=1e-12, abs=1e-12)
+    assert any(expected)
+
+
+def test_scores_match_plain_python_bm25_on_the_default_profile():
+    ranker = RelevanceRanker(title_weight=2.0, k1=1.2, b=0.75)
+    expected = plain_bm25(profile_text(), JOBS, 2.0, 1.2, 0.75)
+    assert ranker.scores(JOBS).tolist() == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+def test_long_words_are_matched_whole():
+    ranker = RelevanceRanker("microservices-architecture supercalifragilisticexpialidocious")
+    scores = ranker.scores([{"title": "", "description": "supercalifragilisticexpialidocious"},
+                            {"title": "", "description": "supercalifragilistic"},
+                            {"title": "", "description": "nothing"}])
+    assert scores[0] > 0 and scores[1] == 0 and scores[2] == 0
+
+
+def test_zero_weight_keeps_the_match_order():
+    jobs = [dict(job, match_percentage=percentage) for job, percentage in zip(JOBS, [50, 90, 70, 10, 30, 0, 60, 80])]
+    ranked = RelevanceRanker(PROFILE, weight=0.0).rank(jobs)
+    assert [job["match_percentage"] for job in ranked] == [90, 80, 70, 60, 50, 30, 10, 0]
+    assert max(job["relevance"] for job in ranked) == 100.0
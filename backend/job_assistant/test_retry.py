@@ -0,0 +1,86 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from network.retry import RetryableResponse, RetryPolicy
+from scrapers.base_scraper import BaseScraper
+
+URL = "https://remotive.com/api/remote-jobs"
+
+
+class FlakyScraper(BaseScraper):
+    """Answers from a script of failures instead of the network"""
+
+    def __init__(self, responses, policy: RetryPolicy):
+        super().__init__("Flaky", "https://remotive.com")
+        self.responses = list(responses)
+        self.retry_policy = policy
+        self.attempts = 0
+
+    async def scrape(self):
+        return []
+
+    async def _send(self, url, method, *args, **kwargs):
+        self.attempts += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def fetch(scraper: BaseScraper, method: str = "GET") -> str:
+    return asyncio.run(asyncio.wait_for(scraper.fetch(URL, method), timeout=5))
+
+
+def test_backoff_doubles_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr("random.uniform", lambda low, high: high)
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert [policy.backoff(attempt) for attempt in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_backoff_is_never_shorter_than_retry_after():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
+    assert policy.backoff(1, retry_after=30) == 30
+
+
+def test_only_gets_are_retried():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.can_retry("get", 1) and policy.can_retry("GET", 2)
+    assert not policy.can_retry("GET", 3)
+    assert not policy.can_retry("POST", 1)
+
+
+def test_transient_failures_are_retried():
+    scraper = FlakyScraper([RetryableResponse(503), aiohttp.ServerDisconnectedError(), "body"],
+                           RetryPolicy(max_attempts=3, base_delay=0.001))
+    assert fetch(scraper) == "body"
+    assert scraper.attempts == 3
+    assert scraper.stats["retries"] == 2
+
+
+def test_gives_up_after_max_attempts():
+    scraper = FlakyScraper([RetryableResponse(429)] * 3, RetryPolicy(max_attempts=2, base_delay=0.001))
+    assert fetch(scraper) == ""
+    assert scraper.attempts == 2
+
+
+def test_post_is_not_retried():
+    scraper = FlakyScraper([RetryableResponse(503), "body"], RetryPolicy(max_attempts=3, base_delay=0.001))
+    assert fetch(scraper, "POST") == ""
+    assert scraper.attempts == 1
+
+
+def test_retry_after_past_the_deadline_gives_up_at_once():
+    scraper = FlakyScraper([RetryableResponse(429, retry_after=60), "body"],
+                           RetryPolicy(max_attempts=3, base_delay=0.001, deadline=5))
+    assert fetch(scraper) == ""
+    assert scraper.attempts == 1
+
+
+@pytest.mark.parametrize("error", [ValueError("bad"), KeyError("x")])
+def test_unexpected_errors_are_not_retried(error):
+    scraper = FlakyScraper([error, "body"], RetryPolicy(max_attempts=3, base_delay=0.001))
+    assert fetch(scraper) == ""
+    assert scraper.attempts == 1
@@ -0,0 +1,132 @@
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.bench_skill_matcher import PerPatternExtractor
+from config import SKILLS_BASE
+from matcher.skill_matcher import SkillExtractor, SkillMatcher, skills_fingerprint
+
+SKILLS = sorted({skill.lower() for skill in SKILLS_BASE + SkillMatcher.COMMON_INDUSTRY_SKILLS})
+
+TEXTS = [
+    # Word boundaries
+    "pythonic code, djangonaut, gitlab, ago, cargo, java_script, mysql2",
+    "Python/Django, (aws), git; sql. go!",
+    # Skills made of punctuation
+    "c++ c# .net asp.net vb.net c++11 c#/.net, we use C++ and C#.",
+    "node.js nodejs node. js ci/cd ci / cd",
+    # Overlapping skills
+    "java javascript javascripts Java-Script JavaScript/Java",
+    "go golang google cloud go-lang googlecloud",
+    "django rest framework, rest apis, spring boot spring",
+    "sql nosql mysql postgresql",
+    # Case
+    "PYTHON Django DoCkEr AWS K8S Machine Learning GITHUB ACTIONS",
+    # Skills at the edges of the string
+    "python",
+    "rust",
+    "c++",
+    ".net",
+    "java",
+    "python and java",
+    "",
+    "   ",
+    "no skills at all in this sentence",
+]
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return SkillExtractor(SKILLS)
+
+
+@pytest.fixture(scope="module")
+def per_pattern():
+    return PerPatternExtractor(SKILLS)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_extract_matches_the_per_pattern_loop(extractor, per_pattern, text):
+    assert extractor.extract(text) == per_pattern.extract(text)
+
+
+def test_extract_matches_the_per_pattern_loop_on_random_texts(extractor, per_pattern):
+    rng = random.Random(7)
+    pieces = SKILLS + ["and", "with", "x", "", "lang", "script", "s", "2"]
+    separators = [" ", "", "/", ",", ".", "-", "_", "(", ")", "+", "#", "\n"]
+    for _ in range(500):
+        text = "".join(rng.choice(separators) + (piece.upper() if rng.random() < 0.2 else piece)
+                       for piece in rng.choices(pieces, k=rng.randint(1, 12)))
+        assert extractor.extract(text) == per_pattern.extract(text), text
+
+
+def test_overlapping_skills_are_all_found(extractor):
+    assert extractor.extract("JavaScript and Java") == {"javascript", "java"}
+    assert extractor.extract("javascript") == {"javascript"}
+    assert extractor.extract("django rest framework") >= {"django", "django rest framework"}
+    assert extractor.extract("golang") == {"golang"}
+
+
+def jobs(count: int = 40):
+    titles = ["Python Developer", "Backend Engineer", "Java Developer", "Frontend Engineer"]
+    descriptions = ["Django, PostgreSQL and Docker on AWS", "Java, Spring Boot and Kafka",
+                    "React with TypeScript and CSS", "Go, gRPC and Kubernetes", "Nothing technical"]
+    return [{"title": titles[i % len(titles)], "description": descriptions[i % len(descriptions)]}
+            for i in range(count)]
+
+
+def test_match_jobs_in_processes_matches_in_process():
+    matcher = SkillMatcher(SKILLS_BASE)
+    expected = matcher.match_jobs(jobs(), processes=1)
+    try:
+        actual = matcher._match_in_processes(jobs(), 2)
+    except (OSError, NotImplementedError) as e:
+        pytest.skip(f"Process pool unavailable: {e}")
+    assert actual == expected
+
+
+def test_match_job_scores_against_the_skills_base():
+    matcher = SkillMatcher(["Python", "Django"])
+    job = matcher.match_job({"title": "Backend", "description": "Python, Django, Docker and AWS"})
+    assert matcher.vocabulary.names(job["skill_mask"]) == ["aws", "django", "docker", "python"]
+    assert matcher.vocabulary.names(job["matched_mask"]) == ["django", "python"]
+    assert job["match_percentage"] == 50.0
+
+
+def test_untitled_backend_role_defaults_to_python():
+    matcher = SkillMatcher(["Python"])
+    job = matcher.match_job({"title": "Backend Engineer", "description": "Great team"})
+    assert matcher.vocabulary.names(job["skill_mask"]) == ["python"]
+    assert job["match_percentage"] == 100.0
+
+
+def test_skills_fingerprint_ignores_order_and_case():
+    vocabulary = SkillMatcher(SKILLS_BASE).vocabulary.skills
+    assert skills_fingerprint(SKILLS_BASE, vocabulary) == \
+        skills_fingerprint([skill.upper() for skill in reversed(SKILLS_BASE)], vocabulary)
+
+
+def test_skills_fingerprint_changes_with_skills_and_vocabulary():
+    vocabulary = SkillMatcher(SKILLS_BASE).vocabulary.skills
+    fingerprint = skills_fingerprint(SKILLS_BASE, vocabulary)
+    assert skills_fingerprint(SKILLS_BASE + ["Haskell"], vocabulary) != fingerprint
+    assert skills_fingerprint(SKILLS_BASE, vocabulary + ["haskell"]) != fingerprint
+    # Bit order is part of what a mask means
+    assert skills_fingerprint(SKILLS_BASE, list(reversed(vocabulary))) != fingerprint
+
+
+def test_skills_fingerprint_is_stable_across_processes():
+    script = ("from config import SKILLS_BASE\n"
+              "from matcher.skill_matcher import SkillMatcher, skills_fingerprint\n"
+              "print(skills_fingerprint(SKILLS_BASE, SkillMatcher(SKILLS_BASE).vocabulary.skills))")
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    fingerprints = {
+        subprocess.run([sys.executable, "-c", script], cwd=cwd, capture_output=True, text=True, check=True,
+                       env=dict(os.environ, PYTHONHASHSEED=seed)).stdout.strip()
+        for seed in ("1", "2", "3")
+    }
+    assert len(fingerprints) == 1
+
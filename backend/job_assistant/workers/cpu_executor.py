@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+from config import CPU_WORKERS, CPU_USE_PROCESSES, CPU_MAX_PENDING, LOOP_LAG_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class CPUExecutor:
+    """Runs CPU-bound work (HTML parsing, skill matching) off the event loop.
+
+    Work goes to a process pool, or to a thread pool when processes cannot be
+    started here. At most `max_pending` calls are queued at once; further
+    callers wait, so a burst of large pages cannot pile up unbounded.
+    Functions and arguments must be picklable (module-level functions).
+    """
+
+    def __init__(self, max_workers: int = CPU_WORKERS, use_processes: bool = CPU_USE_PROCESSES,
+                 max_pending: int = CPU_MAX_PENDING):
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.max_pending = max_pending
+        self.kind = "none"
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    self.kind = "process"
+                except (OSError, NotImplementedError, PermissionError) as e:
+                    logger.warning(f"Process pool unavailable, using threads: {str(e)}")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="cpu")
+                self.kind = "thread"
+            logger.debug(f"CPU executor started: {self.max_workers} {self.kind} workers")
+        return self._executor
+
+    def _fall_back_to_threads(self, executor: Executor, reason: Exception) -> bool:
+        """Switch to threads after `executor` failed as a process pool; False if it was not one"""
+        if not isinstance(executor, ProcessPoolExecutor):
+            return False
+        # A concurrent call may have switched already
+        if self._executor is executor:
+            logger.warning(f"Process pool failed, falling back to threads: {str(reason)}")
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self.use_processes = False
+        return True
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run fn(*args) in the pool and await its result; exceptions raised by fn propagate"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            try:
+                # The pool starts its worker processes on submit, so that is
+                # where it fails when processes cannot run here
+                future = loop.run_in_executor(executor, fn, *args)
+            except (BrokenProcessPool, OSError) as e:
+                if not self._fall_back_to_threads(executor, e):
+                    raise
+                return await loop.run_in_executor(self._get_executor(), fn, *args)
+            try:
+                return await future
+            except BrokenProcessPool as e:
+                # A worker died (killed, out of memory) before fn could finish
+                if not self._fall_back_to_threads(executor, e):
+                    raise
+                return await loop.run_in_executor(self._get_executor(), fn, *args)
+
+    def shutdown(self):
+        """Stop the pool's workers"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up, i.e. how long it was blocked"""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL):
+        self.interval = interval
+        self.samples = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _sample(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - started - self.interval)
+            self.samples += 1
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+
+    def start(self):
+        """Start sampling on the running loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._sample())
+
+    async def stop(self):
+        """Stop sampling"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def summary(self) -> str:
+        """One-line report of the lag observed while sampling"""
+        mean = self.total_lag / self.samples if self.samples else 0.0
+        return (f"max {self.max_lag * 1000:.0f} ms, mean {mean * 1000:.1f} ms "
+                f"over {self.samples} samples")
@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict
 import uuid
 from datetime import datetime, timezone
+from job_assistant.matcher.skill_vocabulary import SkillVocabulary, skill_lists
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -22,29 +23,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# MongoDB connection (optional - graceful fallback)
+# MongoDB connection (optional - graceful fallback), opened at startup so
+# importing this module stays cheap
 mongo_client = None
 db = None
 
-try:
-    from motor.motor_asyncio import AsyncIOMotorClient
-    mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
-    db_name = os.environ.get('DB_NAME', 'ai_assistant_db')
-    mongo_client = AsyncIOMotorClient(mongo_url, serverSelectionTimeoutMS=3000)
-    db = mongo_client[db_name]
-    logger.info(f"MongoDB configured: {mongo_url}")
-except Exception as e:
-    logger.warning(f"MongoDB not available: {e}. Running without database.")
+
+def connect_mongo():
+    global mongo_client, db
+    try:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+        db_name = os.environ.get('DB_NAME', 'ai_assistant_db')
+        mongo_client = AsyncIOMotorClient(mongo_url, serverSelectionTimeoutMS=3000)
+        db = mongo_client[db_name]
+        logger.info(f"MongoDB configured: {mongo_url}")
+    except Exception as e:
+        logger.warning(f"MongoDB not available: {e}. Running without database.")
 
 # Job Assistant paths
 JOB_ASSISTANT_DIR = ROOT_DIR / 'job_assistant'
 HISTORY_FILE = JOB_ASSISTANT_DIR / 'database' / 'jobs_history.json'
+PORTAL_HEALTH_FILE = JOB_ASSISTANT_DIR / 'database' / 'portal_health.json'
 COVERLETTER_DIR = JOB_ASSISTANT_DIR / 'output' / 'coverletters'
 
 # Lifespan context manager (replaces deprecated on_event)
 @asynccontextmanager
 async def lifespan(app):
     # Startup
+    connect_mongo()
     yield
     # Shutdown
     if mongo_client:
@@ -105,6 +112,20 @@ class DashboardStats(BaseModel):
     cover_letters_generated: int = 0
     last_run: str = "Never"
 
+class PortalHealth(BaseModel):
+    portal: str
+    state: str = "closed"
+    runs: int = 0
+    success_rate: Optional[float] = None
+    consecutive_failures: int = 0
+    skipped: int = 0
+    jobs_found: int = 0
+    seconds_without_jobs: float = 0.0
+    latency_p50: float = 0.0
+    latency_p95: float = 0.0
+    last_run: Optional[str] = None
+    last_error: Optional[str] = None
+
 class SearchRequest(BaseModel):
     task: str = "morning"  # "morning" or "reminder"
 
@@ -121,6 +142,17 @@ def load_job_history() -> dict:
     return {"jobs": []}
 
 
+def load_portal_health() -> dict:
+    """Load per-portal circuit breaker state written by the job assistant"""
+    try:
+        if PORTAL_HEALTH_FILE.exists():
+            with open(PORTAL_HEALTH_FILE, 'r') as f:
+                return json.load(f)
+    except Exception as e:
+        logger.error(f"Error loading portal health: {e}")
+    return {"portals": {}}
+
+
 def get_cover_letters() -> List[str]:
     """Get list of generated cover letters"""
     try:
@@ -200,6 +232,7 @@ async def get_jobs():
     """Get all scraped and matched jobs"""
     history = load_job_history()
     jobs = history.get('jobs', [])
+    vocabulary = SkillVocabulary(history.get('skill_vocabulary', []))
 
     return [
         JobResponse(
@@ -210,9 +243,7 @@ async def get_jobs():
             location=job.get('location', ''),
             link=job.get('link', ''),
             portal=job.get('portal', 'Unknown'),
-            required_skills=job.get('required_skills', []),
-            matched_skills=job.get('matched_skills', []),
-            missing_skills=job.get('missing_skills', []),
+            **skill_lists(job, vocabulary),
             match_percentage=job.get('match_percentage', 0),
             cover_letter_generated=job.get('cover_letter_generated', 'No'),
             cover_letter_path=job.get('cover_letter_path', ''),
@@ -222,6 +253,14 @@ async def get_jobs():
     ]
 
 
+@api_router.get("/portals/health", response_model=List[PortalHealth])
+async def get_portal_health():
+    """Get circuit breaker state per portal, costliest portals without jobs first"""
+    portals = load_portal_health().get('portals', {})
+    health = [PortalHealth(portal=name, **record) for name, record in portals.items()]
+    return sorted(health, key=lambda p: p.seconds_without_jobs, reverse=True)
+
+
 @api_router.get("/cover-letters")
 async def list_cover_letters():
     """List all generated cover letters"""